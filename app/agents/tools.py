@@ -4,9 +4,11 @@ Custom tools for the Resume ReAct agent.
 from typing import List, Dict, Any
 from langchain.tools import Tool, StructuredTool
 from pydantic import BaseModel, Field
-from app.services.parser import extract_skills, extract_experience, extract_education
+from app.services.parsed_resume import parse_resume
 from app.services.analyzer import analyze_strengths_weaknesses, calculate_job_match, suggest_improvements
-from app.services.vector_store import get_similar_skills, get_industry_standards
+from app.services.vector_store import get_similar_skills, get_similar_skills_many, get_industry_standards
+from app.services.semantic_match import semantic_match, summarize_semantic_match
+from app.config import SEMANTIC_MATCH_ENABLED
 import re
 
 class ExtractSkillsInput(BaseModel):
@@ -45,13 +47,32 @@ class MatchSkillsInput(BaseModel):
     resume_text: str = Field(..., description="The text content of the resume")
     job_description_text: str = Field(..., description="The text content of the job description")
 
+class GetSimilarSkillsManyInput(BaseModel):
+    """Input for the batched similar skills tool."""
+    skills: List[str] = Field(..., description="Skills to find similar or related skills for")
+    k: int = Field(3, description="Number of similar skills to return per skill")
+
+def extract_skills_tool(resume_text: str) -> List[str]:
+    """Extract skills, reusing the memoized parse of the resume."""
+    return parse_resume(resume_text).skills
+
+def extract_experience_tool(resume_text: str) -> List[Dict[str, Any]]:
+    """Extract work experience, reusing the memoized parse of the resume."""
+    return parse_resume(resume_text).experience
+
+def extract_education_tool(resume_text: str) -> List[Dict[str, Any]]:
+    """Extract education, reusing the memoized parse of the resume."""
+    return parse_resume(resume_text).education
+
 def match_skills_tool(resume_text: str, job_description_text: str) -> Dict[str, Any]:
     """
     Extracts skills from resume and job description, finds common skills,
-    and calculates a matching percentage.
+    and calculates a matching percentage. When SEMANTIC_MATCH_ENABLED is
+    on, also matches the resume's lines against the job description's
+    requirement lines by embedding similarity and adds a short summary.
     """
-    resume_skills = extract_skills(resume_text)
-    jd_skills = extract_skills(job_description_text)
+    resume_skills = parse_resume(resume_text).skills
+    jd_skills = parse_resume(job_description_text).skills
 
     # Ensure we have lists of strings
     if not isinstance(resume_skills, list):
@@ -99,12 +120,19 @@ def match_skills_tool(resume_text: str, job_description_text: str) -> Dict[str,
     else:
         match_percentage = (len(set(skill.lower() for skill in matched_skills)) / len(jd_skills_set)) * 100
 
-    return {
+    result = {
         "matched_skills": matched_skills,
         "resume_skills": resume_skills_cleaned,
         "job_description_skills": jd_skills_cleaned,
         "match_percentage": round(match_percentage, 2)
     }
+    
+    # Credit requirements the resume covers in other words, by embedding
+    # similarity; summarized, since the result goes into the agent's prompt
+    if SEMANTIC_MATCH_ENABLED:
+        result["semantic_match"] = summarize_semantic_match(semantic_match(resume_text, job_description_text))
+    
+    return result
 
 def get_resume_tools() -> List[Tool]:
     """
@@ -115,21 +143,21 @@ def get_resume_tools() -> List[Tool]:
     """
     tools = [
         Tool.from_function(
-            func=extract_skills,
+            func=extract_skills_tool,
             name="ExtractSkills",
             description="Extract a list of skills from the resume text",
             args_schema=ExtractSkillsInput,
             return_direct=False,
         ),
         Tool.from_function(
-            func=extract_experience,
+            func=extract_experience_tool,
             name="ExtractExperience",
             description="Extract work experience details from the resume text",
             args_schema=ExtractExperienceInput,
             return_direct=False,
         ),
         Tool.from_function(
-            func=extract_education,
+            func=extract_education_tool,
             name="ExtractEducation",
             description="Extract education details from the resume text",
             args_schema=ExtractEducationInput,
@@ -162,6 +190,13 @@ def get_resume_tools() -> List[Tool]:
             description="Find similar or related skills that could enhance the resume",
             return_direct=False,
         ),
+        Tool.from_function(
+            func=get_similar_skills_many,
+            name="GetSimilarSkillsMany",
+            description="Find similar or related skills for a list of skills at once; prefer this over calling GetSimilarSkills for each skill",
+            args_schema=GetSimilarSkillsManyInput,
+            return_direct=False,
+        ),
         Tool.from_function(
             func=get_industry_standards,
             name="GetIndustryStandards",
@@ -30,6 +30,69 @@ MAX_TOKENS = 4000
 CHROMA_PERSIST_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "chroma")
 COLLECTION_NAME = "resume_knowledge"
 
+# Vector store backend: "chroma", or "numpy" for the in-process index in VECTOR_INDEX_DIRECTORY
+VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "chroma").lower()
+VECTOR_INDEX_DIRECTORY = os.getenv("VECTOR_INDEX_DIRECTORY", os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "vector_index"))
+
+# Embedding settings; "hashing" works offline, "chroma" uses Chroma's default model
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "hashing").lower()
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "384"))
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "10000"))  # 0 disables the cache
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", os.path.join(os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "resume-analyzer", "embeddings"))  # Empty keeps it in memory only
+
+# Vector KB builds (see app.services.kb_builder)
+KB_BUILD_BATCH_SIZE = int(os.getenv("KB_BUILD_BATCH_SIZE", "256"))  # Documents per upsert
+KB_BUILDS_TO_KEEP = int(os.getenv("KB_BUILDS_TO_KEEP", "2"))  # Builds kept on disk, including the active one
+
+# Semantic resume-to-job matching (see app.services.semantic_match)
+SEMANTIC_MATCH_ENABLED = os.getenv("SEMANTIC_MATCH_ENABLED", str(EMBEDDING_BACKEND == "chroma")).lower() == "true"  # On by default only with a sentence embedding backend
+SEMANTIC_MATCH_THRESHOLD = float(os.getenv("SEMANTIC_MATCH_THRESHOLD", "0.25"))  # Cosine similarity at which a requirement counts as covered; tuned for the hashing backend
+SEMANTIC_CHUNK_MAX_WORDS = int(os.getenv("SEMANTIC_CHUNK_MAX_WORDS", "40"))
+SEMANTIC_MATCH_TOP_PAIRS = int(os.getenv("SEMANTIC_MATCH_TOP_PAIRS", "10"))
+SEMANTIC_MATCH_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_MATCH_CACHE_MAX_ENTRIES", "4096"))  # In-memory cache of chunk embeddings; 0 disables it
+
 # MLflow settings
 MLFLOW_TRACKING_URI = "file:" + os.path.join(os.path.dirname(os.path.dirname(__file__)), "mlruns")
-EXPERIMENT_NAME = "resume-analyzer"
\ No newline at end of file
+EXPERIMENT_NAME = "resume-analyzer"
+
+# Document ingestion settings
+INGESTION_EXECUTOR = os.getenv("INGESTION_EXECUTOR", "thread").lower()  # "thread" or "process"
+INGESTION_MAX_WORKERS = int(os.getenv("INGESTION_MAX_WORKERS", "4"))
+
+# Extracted text cache settings
+TEXT_CACHE_MAX_ENTRIES = int(os.getenv("TEXT_CACHE_MAX_ENTRIES", "256"))
+TEXT_CACHE_DIR = os.getenv("TEXT_CACHE_DIR")  # Optional on-disk tier, disabled when unset
+
+# Isolated PDF extraction settings
+PDF_EXTRACTION_BACKEND = os.getenv("PDF_EXTRACTION_BACKEND", "process").lower()  # "process" or "inline"
+PDF_EXTRACTION_WORKERS = int(os.getenv("PDF_EXTRACTION_WORKERS", "2"))
+PDF_EXTRACTION_TIMEOUT_SECONDS = float(os.getenv("PDF_EXTRACTION_TIMEOUT_SECONDS", "10"))
+PDF_EXTRACTION_MAX_RSS_MB = int(os.getenv("PDF_EXTRACTION_MAX_RSS_MB", "512"))
+PDF_EXTRACTION_MAX_TASKS_PER_WORKER = int(os.getenv("PDF_EXTRACTION_MAX_TASKS_PER_WORKER", "100"))
+
+# Upload handling settings
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_SPOOL_THRESHOLD_BYTES = int(os.getenv("UPLOAD_SPOOL_THRESHOLD_BYTES", str(1024 * 1024)))
+UPLOAD_CHUNK_BYTES = 256 * 1024
+PDF_PAGES_PER_TASK = int(os.getenv("PDF_PAGES_PER_TASK", "8"))
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "16"))
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "0"))  # 0 means no limit
+PDF_EARLY_EXIT = os.getenv("PDF_EARLY_EXIT", "False").lower() == "true"  # Stop once all resume sections are seen
+
+# Resume parsing limits for untrusted text
+PARSER_HARDENED = os.getenv("PARSER_HARDENED", "True").lower() == "true"
+PARSER_MAX_INPUT_CHARS = int(os.getenv("PARSER_MAX_INPUT_CHARS", "100000"))
+PARSER_MAX_FIELD_CHARS = int(os.getenv("PARSER_MAX_FIELD_CHARS", "2000"))
+PARSER_TIME_BUDGET_SECONDS = float(os.getenv("PARSER_TIME_BUDGET_SECONDS", "2"))
+PARSED_RESUME_CACHE_MAX_ENTRIES = int(os.getenv("PARSED_RESUME_CACHE_MAX_ENTRIES", "128"))
+
+# Batch parsing settings
+BATCH_PARSE_WORKERS = int(os.getenv("BATCH_PARSE_WORKERS", str(os.cpu_count() or 1)))
+BATCH_PARSE_MIN_DOCUMENTS = int(os.getenv("BATCH_PARSE_MIN_DOCUMENTS", "32"))  # Smaller batches are parsed inline
+
+# Typo-tolerant skill lookups
+FUZZY_SKILL_MAX_DISTANCE = int(os.getenv("FUZZY_SKILL_MAX_DISTANCE", "2"))  # 0 disables typo-tolerant lookups
+FUZZY_SKILL_CACHE_MAX_ENTRIES = int(os.getenv("FUZZY_SKILL_CACHE_MAX_ENTRIES", "4096"))
+
+# Skills knowledge base; the compiled binary KB is used when present
+SKILLS_KB_PATH = os.getenv("SKILLS_KB_PATH", os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "skills_kb.bin"))
@@ -3,12 +3,14 @@ FastAPI application for Resume Analyzer.
 """
 import os
 import json
+import asyncio
+import functools
 from typing import Dict, Any, Optional
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 import uvicorn
 import mlflow
@@ -22,7 +24,7 @@ from fastapi import status
 
 load_dotenv()
 
-from app.config import APP_NAME, APP_VERSION, DEBUG, MLFLOW_TRACKING_URI, EXPERIMENT_NAME
+from app.config import APP_NAME, APP_VERSION, DEBUG, MLFLOW_TRACKING_URI, EXPERIMENT_NAME, MAX_UPLOAD_BYTES
 from app.core.security import (
     verify_password, get_password_hash, create_access_token,
     verify_token, Token, TokenData
@@ -35,10 +37,16 @@ from app.models.schema import (
 from app.agents.react_agent import ResumeReactAgent
 from app.services.parser import extract_skills, extract_experience, extract_education
 from app.services.analyzer import analyze_strengths_weaknesses, calculate_job_match, suggest_improvements
-from app.services.vector_store import initialize_vector_store, get_similar_skills
+from app.services.vector_store import initialize_vector_store, get_similar_skills, vector_store_health, shutdown_vector_store, reload_vector_store
 from app.services.logging import initialize_promptlayer
 from app.services.structured_analyzer import StructuredAnalyzer
 from app.services.resume_builder import ResumeBuilder
+from app.services.ingestion import extract_upload, is_supported_format, ingestion_stats, shutdown_ingestion
+from app.services.extraction_pool import ExtractionLimitExceeded
+from app.services.uploads import RequestSizeLimitMiddleware, UploadTooLarge
+from app.services.text_cache import text_cache
+from app.services.parsed_resume import parse_cache_stats
+from app.services.skills_kb import get_skills_kb, reload_skills_index
 from app.routers import career_paths # Import only career_paths for now
 
 # Setup logging
@@ -148,14 +156,24 @@ async def skills_career_dashboard_page(request: Request):
     """Render the skills and career dashboard page."""
     return templates.TemplateResponse("skills_career_dashboard.html", {"request": request})
 
+def warm_vector_store():
+    """Open the vector store ahead of the first lookup, in an executor thread."""
+    try:
+        initialize_vector_store()
+    except Exception as e:
+        logger.warning(f"Failed to initialize vector store, it will be opened on first use: {str(e)}")
+
 # Initialize services on startup
 @app.on_event("startup")
 async def startup_event():
     # Initialize PromptLayer
     initialize_promptlayer()
     
-    # Initialize vector store
-    # initialize_vector_store()  # Commented out due to ChromaDB schema issue
+    # Initialize vector store off the event loop; builds the knowledge
+    # collection when there is no usable build, so lookups do not pay for it.
+    # Lookups arriving before it is open wait for it like a lazy open would.
+    loop = asyncio.get_running_loop()
+    loop.run_in_executor(None, warm_vector_store)
     
     # Initialize the agent (this will be done on-demand, but we can test it here)
     try:
@@ -165,6 +183,14 @@ async def startup_event():
         print(f"Failed to initialize agent: {str(e)}")
         # Continue anyway, we'll initialize on-demand
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Stop the document extraction workers
+    shutdown_ingestion()
+    
+    # Close the vector store client
+    shutdown_vector_store()
+
 def get_agent():
     """Get or create the ReAct agent."""
     global agent
@@ -172,6 +198,21 @@ def get_agent():
         agent = ResumeReactAgent()
     return agent
 
+async def run_analysis(function, *args, **kwargs):
+    """Run a resume analysis in the default executor, so its parsing and matching do not block the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(function, *args, **kwargs))
+
+async def read_resume_upload(file: UploadFile) -> Dict[str, Any]:
+    """Extract text from an uploaded resume, rejecting documents over the extraction budget."""
+    try:
+        return await extract_upload(file)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ExtractionLimitExceeded as e:
+        logger.warning(f"Rejected upload {file.filename}: {str(e)}")
+        raise HTTPException(status_code=422, detail=str(e))
+
 # Removed duplicate root endpoint - using the HTML template version above
 
 @app.get("/health")
@@ -183,6 +224,67 @@ async def health_check():
         "timestamp": "2025-01-26"
     }
 
+@app.get("/health/vector-store")
+async def vector_store_health_check():
+    """Check that the vector store answers; 503 when it does not."""
+    loop = asyncio.get_running_loop()
+    health = await loop.run_in_executor(None, vector_store_health)
+    if health["status"] != "healthy":
+        return JSONResponse(status_code=503, content=health)
+    return health
+
+@app.get("/ingestion/stats")
+async def get_ingestion_stats():
+    """Per-stage document extraction timings and text/parse cache counters."""
+    return {
+        "stages": ingestion_stats.snapshot(),
+        "text_cache": text_cache.stats(),
+        "parsed_resumes": parse_cache_stats()
+    }
+
+@app.post("/skills-kb/reload")
+async def reload_skills_kb(current_user: TokenData = Depends(get_current_user)):
+    """
+    Reload the skills knowledge base from disk and swap it in without a restart.
+
+    Requests already running finish on the previous knowledge base. If the
+    file cannot be loaded, the previous knowledge base stays active.
+    """
+    loop = asyncio.get_running_loop()
+    start_time = time.perf_counter()
+    try:
+        await loop.run_in_executor(None, reload_skills_index)
+    except (OSError, ValueError) as e:
+        logger.error(f"Skills KB reload requested by {current_user.username} failed: {str(e)}")
+        raise HTTPException(status_code=422, detail=f"Failed to reload skills KB: {str(e)}")
+    
+    skills_kb = get_skills_kb()
+    logger.info(f"Skills KB reloaded by {current_user.username} from {skills_kb.source}")
+    return {
+        "source": skills_kb.source,
+        "entries": len(skills_kb.index),
+        "reload_ms": round((time.perf_counter() - start_time) * 1000, 3)
+    }
+
+@app.post("/vector-store/reload")
+async def rebuild_vector_store(current_user: TokenData = Depends(get_current_user)):
+    """
+    Rebuild the vector store's knowledge collection into a fresh directory
+    and switch to it without a restart.
+
+    Lookups keep using the previous build until the new one is complete. If
+    the build fails, the previous build stays active.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        stats = await loop.run_in_executor(None, reload_vector_store)
+    except Exception as e:
+        logger.error(f"Vector store rebuild requested by {current_user.username} failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to rebuild vector store: {str(e)}")
+    
+    logger.info(f"Vector store rebuilt by {current_user.username} in {stats['directory']}")
+    return stats
+
 @app.post("/analyze/text", response_model=Dict[str, Any])
 async def analyze_resume_text(
     request: ResumeAnalysisRequest,
@@ -209,7 +311,8 @@ async def analyze_resume_text(
             agent = get_agent()
             
             # Execute the agent
-            result = agent.analyze_resume(
+            result = await run_analysis(
+                agent.analyze_resume,
                 resume_text=request.resume_text,
                 job_description=request.job_description
             )
@@ -248,40 +351,24 @@ async def analyze_resume_file(
         Analysis results
     """
     try:
-        # Read the file content
-        content = await file.read()
-        
-        # Parse the resume based on file type
-        resume_text = ""
-        
-        if file.filename.endswith(".pdf"):
-            from pypdf import PdfReader
-            from io import BytesIO
-            reader = PdfReader(BytesIO(content))
-            for page in reader.pages:
-                resume_text += page.extract_text()
-                
-        elif file.filename.endswith(".docx"):
-            import docx
-            from io import BytesIO
-            doc = docx.Document(BytesIO(content))
-            resume_text = "\n".join([p.text for p in doc.paragraphs])
-                
-        else:
-            # Assume it's plain text
-            resume_text = content.decode("utf-8")
+        # Read the file and extract its text off the event loop
+        extraction = await read_resume_upload(file)
+        resume_text = extraction["text"]
         
         # Get the agent
         agent = get_agent()
         
         # Execute the agent
-        result = agent.analyze_resume(
+        result = await run_analysis(
+            agent.analyze_resume,
             resume_text=resume_text,
             job_description=job_description
         )
         
         return result
             
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -297,40 +384,24 @@ async def simple_analyze_resume(
     A simplified version of resume analysis that uses fewer API calls.
     """
     try:
-        # Read the file content
-        content = await file.read()
-        
-        # Parse the resume based on file type
-        resume_text = ""
-        
-        if file.filename.endswith(".pdf"):
-            from pypdf import PdfReader
-            from io import BytesIO
-            reader = PdfReader(BytesIO(content))
-            for page in reader.pages:
-                resume_text += page.extract_text()
-                
-        elif file.filename.endswith(".docx"):
-            import docx
-            from io import BytesIO
-            doc = docx.Document(BytesIO(content))
-            resume_text = "\n".join([p.text for p in doc.paragraphs])
-                
-        else:
-            # Assume it's plain text
-            resume_text = content.decode("utf-8")
+        # Read the file and extract its text off the event loop
+        extraction = await read_resume_upload(file)
+        resume_text = extraction["text"]
         
         # Get the agent
         agent = get_agent()
         
         # Use the direct analyze method to avoid agent overhead
-        result = agent.direct_analyze(
+        result = await run_analysis(
+            agent.direct_analyze,
             resume_text=resume_text,
             job_description=job_description
         )
         
         return result
             
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -340,43 +411,29 @@ async def simple_analyze_resume(
 @app.post("/structured_analyze", response_model=Dict[str, Any])
 async def structured_analyze(
     file: UploadFile = File(...),
-    job_description: Optional[str] = Form(None)
+    job_description: Optional[str] = Form(None),
+    include_similar_skills: bool = Form(False)
 ):
     """
     Analyze a resume with structured output that doesn't use API calls.
     """
     try:
-        # Read the file content
-        content = await file.read()
-        
-        # Parse the resume based on file type
-        resume_text = ""
-        
-        if file.filename.endswith(".pdf"):
-            from pypdf import PdfReader
-            from io import BytesIO
-            reader = PdfReader(BytesIO(content))
-            for page in reader.pages:
-                resume_text += page.extract_text()
-                
-        elif file.filename.endswith(".docx"):
-            import docx
-            from io import BytesIO
-            doc = docx.Document(BytesIO(content))
-            resume_text = "\n".join([p.text for p in doc.paragraphs])
-                
-        else:
-            # Assume it's plain text
-            resume_text = content.decode("utf-8")
+        # Read the file and extract its text off the event loop
+        extraction = await read_resume_upload(file)
+        resume_text = extraction["text"]
         
         # Use the structured analyzer
-        result = structured_analyzer.analyze_resume(
+        result = await run_analysis(
+            structured_analyzer.analyze_resume,
             resume_text=resume_text,
-            job_description=job_description
+            job_description=job_description,
+            include_similar_skills=include_similar_skills
         )
         
         return result
             
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -437,40 +494,24 @@ async def analyze(file: UploadFile = File(...), job_description: Optional[str] =
         if not file.filename.endswith(('.pdf', '.docx', '.txt')):
             raise HTTPException(status_code=400, detail="File type not supported. Please upload a PDF, DOCX, or TXT file.")
         
-        # Read the file content
-        content = await file.read()
-        
-        # Parse the resume based on file type
-        resume_text = ""
-        
-        if file.filename.endswith(".pdf"):
-            from pypdf import PdfReader
-            from io import BytesIO
-            reader = PdfReader(BytesIO(content))
-            for page in reader.pages:
-                resume_text += page.extract_text()
-                
-        elif file.filename.endswith(".docx"):
-            import docx
-            from io import BytesIO
-            doc = docx.Document(BytesIO(content))
-            resume_text = "\n".join([p.text for p in doc.paragraphs])
-                
-        else:
-            # Assume it's plain text
-            resume_text = content.decode("utf-8")
+        # Read the file and extract its text off the event loop
+        extraction = await read_resume_upload(file)
+        resume_text = extraction["text"]
         
         # Get the agent
         agent = get_agent()
         
         # Execute the agent
-        result = agent.analyze_resume(
+        result = await run_analysis(
+            agent.analyze_resume,
             resume_text=resume_text,
             job_description=job_description
         )
         
         return result
             
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error analyzing resume: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -536,27 +577,14 @@ async def optimize_resume(
         if file and file.filename and file.size > 0:
             logger.info(f"Processing uploaded file: {file.filename}, size: {file.size}, content_type: {file.content_type}")
             used_input_type = f"file: {file.filename}"
-            # Read the file content
-            content = await file.read()
-            logger.info(f"File content read successfully, size: {len(content)} bytes")
-            
-            # Parse the resume
-            if file.filename.endswith(".pdf"):
-                from pypdf import PdfReader
-                from io import BytesIO
-                reader = PdfReader(BytesIO(content))
-                for page in reader.pages:
-                    resume_text_content += page.extract_text()
-            elif file.filename.endswith(".docx"):
-                import docx
-                from io import BytesIO
-                doc = docx.Document(BytesIO(content))
-                resume_text_content = "\n".join([p.text for p in doc.paragraphs])
-            elif file.filename.endswith(".txt"):
-                resume_text_content = content.decode("utf-8")
-            else:
+            if not is_supported_format(file.filename):
                 logger.warning(f"Unsupported file type for optimization: {file.filename}")
                 raise HTTPException(status_code=400, detail=f"Unsupported file type: {file.filename}. Please use PDF, DOCX, or TXT.")
+            
+            # Read the file and extract its text off the event loop
+            extraction = await read_resume_upload(file)
+            logger.info(f"File content read successfully, size: {extraction['size']} bytes, timings: {extraction['timings']}")
+            resume_text_content = extraction["text"]
         
         elif resume_text and resume_text.strip():
             logger.info(f"Processing resume_text from form, length: {len(resume_text)}")
@@ -588,6 +616,8 @@ async def optimize_resume(
         logger.info(f"Optimization completed successfully: {result.get('success', False)}")
         return result
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error optimizing resume: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -698,28 +728,9 @@ async def extract_resume_text(file: UploadFile = File(...)):
     Extract text from uploaded resume file for interview assistant.
     """
     try:
-        # Read the file content
-        content = await file.read()
-        
-        # Parse the resume based on file type
-        resume_text = ""
-        
-        if file.filename.endswith(".pdf"):
-            from pypdf import PdfReader
-            from io import BytesIO
-            reader = PdfReader(BytesIO(content))
-            for page in reader.pages:
-                resume_text += page.extract_text()
-                
-        elif file.filename.endswith(".docx"):
-            import docx
-            from io import BytesIO
-            doc = docx.Document(BytesIO(content))
-            resume_text = "\n".join([p.text for p in doc.paragraphs])
-                
-        else:
-            # Assume it's plain text
-            resume_text = content.decode("utf-8")
+        # Read the file and extract its text off the event loop
+        extraction = await read_resume_upload(file)
+        resume_text = extraction["text"]
         
         return {
             "success": True,
@@ -727,6 +738,8 @@ async def extract_resume_text(file: UploadFile = File(...)):
             "filename": file.filename
         }
             
+    except HTTPException:
+        raise
     except Exception as e:
         return {
             "success": False,
@@ -741,40 +754,24 @@ async def analyze_resume(file: UploadFile = File(...), job_description: Optional
         if not file.filename.endswith(('.pdf', '.docx', '.txt')):
             raise HTTPException(status_code=400, detail="File type not supported. Please upload a PDF, DOCX, or TXT file.")
         
-        # Read the file content
-        content = await file.read()
-        
-        # Parse the resume based on file type
-        resume_text = ""
-        
-        if file.filename.endswith(".pdf"):
-            from pypdf import PdfReader
-            from io import BytesIO
-            reader = PdfReader(BytesIO(content))
-            for page in reader.pages:
-                resume_text += page.extract_text()
-                
-        elif file.filename.endswith(".docx"):
-            import docx
-            from io import BytesIO
-            doc = docx.Document(BytesIO(content))
-            resume_text = "\n".join([p.text for p in doc.paragraphs])
-                
-        else:
-            # Assume it's plain text
-            resume_text = content.decode("utf-8")
+        # Read the file and extract its text off the event loop
+        extraction = await read_resume_upload(file)
+        resume_text = extraction["text"]
         
         # Get the agent
         agent = get_agent()
         
         # Execute the agent
-        result = agent.analyze_resume(
+        result = await run_analysis(
+            agent.analyze_resume,
             resume_text=resume_text,
             job_description=job_description
         )
         
         return result
             
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error analyzing resume: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -784,6 +781,9 @@ app.include_router(career_paths.router, prefix="/api/v1/career-paths", tags=["Sk
 # Placeholder for WebSocket endpoint for real-time notifications
 # @app.websocket("/ws/notifications/{user_id}")
 
+# Reject oversized request bodies as they are received
+app.add_middleware(RequestSizeLimitMiddleware, max_bytes=MAX_UPLOAD_BYTES)
+
 # Add security headers middleware
 @app.middleware("http")
 async def add_security_headers(request: Request, call_next):
@@ -10,6 +10,8 @@ from app.models.skills_career import (
     SkillMilestone, CareerStageEvolution, IndustryTransition, 
     CareerTrajectory, SkillEvolution, CareerGrowthPattern
 )
+from app.services.parsed_resume import parse_resume
+from app.services.skill_registry import skill_registry
 
 router = APIRouter()
 
@@ -488,6 +490,11 @@ CAREER_GROWTH_PATTERNS_DB = [
     )
 ]
 
+# Skills keyed by registry ID; the skill's own ID is registered as an alias of its name
+SKILLS_BY_REGISTRY_ID = {}
+for _skill in SKILLS_DB:
+    SKILLS_BY_REGISTRY_ID.setdefault(skill_registry.register(_skill.name, [_skill.id]), _skill)
+
 # Helper function to get skill details by ID
 def get_skill_by_id(skill_id: str) -> Optional[Skill]:
     for skill in SKILLS_DB:
@@ -823,28 +830,17 @@ async def extract_skill_ids_from_text(request: ExtractSkillsRequest):
     if not request.resume_text or not request.resume_text.strip():
         return ExtractSkillsResponse(success=False, skill_ids=[], extracted_skill_names=[], message="Resume text is empty.")
 
-    # Simple lowercase text matching for this example.
-    # In a real app, this would use more sophisticated NLP/parsing like in StructuredAnalyzer.
-    resume_content_lower = request.resume_text.lower()
+    # Match every skill name and ID in one pass over the text, plus the
+    # skills section entries, which may be misspelled
     found_skill_ids = set()
     found_skill_names = set()
 
-    for skill_in_db in SKILLS_DB:
-        # Check for skill name (e.g., "Python") and skill id (e.g., "python")
-        # This is a basic check; more robust matching would be needed for variations.
-        if skill_in_db.name.lower() in resume_content_lower or skill_in_db.id.lower() in resume_content_lower:
-            # Try to find occurrences of the skill name or ID in the resume text
-            # This is to give preference to the actual terms found if possible
-            # For simplicity, just checking if the name is in the text is often enough
-            
-            # A more robust check would be to use a regex for whole word matching for skill_in_db.name
-            # For example: re.search(r'\b' + re.escape(skill_in_db.name.lower()) + r'\b', resume_content_lower)
-            if skill_in_db.name.lower() in resume_content_lower:
-                 found_skill_names.add(skill_in_db.name) # Add the original cased name
-                 found_skill_ids.add(skill_in_db.id)
-            elif skill_in_db.id.lower() in resume_content_lower: # If only ID was found (e.g. resume says 'aws' not 'Amazon Web Services')
-                 found_skill_names.add(skill_in_db.name) # Still report the proper name
-                 found_skill_ids.add(skill_in_db.id)
+    parsed = parse_resume(request.resume_text)
+    for term in parsed.skill_terms + parsed.skills:
+        skill_in_db = SKILLS_BY_REGISTRY_ID.get(skill_registry.resolve(term))
+        if skill_in_db is not None:
+            found_skill_names.add(skill_in_db.name) # Report the proper name even if only the ID was found
+            found_skill_ids.add(skill_in_db.id)
 
     if not found_skill_ids:
         return ExtractSkillsResponse(success=True, skill_ids=[], extracted_skill_names=[], message="No known skills found in the resume text.")
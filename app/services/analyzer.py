@@ -3,6 +3,18 @@ Resume analysis services.
 """
 from typing import List, Dict, Any, Tuple
 
+from app.services.skill_registry import skill_registry
+
+# Skills looked for in job descriptions
+JOB_SKILL_KEYWORDS = [
+    "Python", "Java", "JavaScript", "C++", "C#", "Ruby", "SQL", "HTML", "CSS",
+    "React", "Angular", "Vue", "Node.js", "Django", "Flask", "Spring",
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Git", "Jenkins",
+    "TensorFlow", "PyTorch", "Scikit-learn", "Pandas", "NumPy",
+    "Machine Learning", "Deep Learning", "NLP", "Computer Vision"
+]
+JOB_SKILL_IDS = skill_registry.register_many(JOB_SKILL_KEYWORDS)
+
 def analyze_strengths_weaknesses(
     skills: List[str], 
     experience: List[Dict[str, Any]], 
@@ -94,21 +106,13 @@ def calculate_job_match(
     # such as semantic similarity. For this example, we'll use a simplified approach.
     
     # Extract skills from job description (simplified approach)
-    job_skills = []
-    common_skills = [
-        "Python", "Java", "JavaScript", "C++", "C#", "Ruby", "SQL", "HTML", "CSS",
-        "React", "Angular", "Vue", "Node.js", "Django", "Flask", "Spring",
-        "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Git", "Jenkins",
-        "TensorFlow", "PyTorch", "Scikit-learn", "Pandas", "NumPy",
-        "Machine Learning", "Deep Learning", "NLP", "Computer Vision"
-    ]
-    
-    for skill in common_skills:
-        if skill.lower() in job_description.lower():
-            job_skills.append(skill)
+    found = set(skill_registry.find_ids(job_description))
+    job_skills = [(skill, skill_id) for skill, skill_id in zip(JOB_SKILL_KEYWORDS, JOB_SKILL_IDS) if skill_id in found]
     
-    # Calculate skill match
-    matching_skills = set(s.lower() for s in skills).intersection(set(s.lower() for s in job_skills))
+    # Calculate skill match by registry key, so aliases such as "k8s" count
+    resume_skill_keys = set(skill_registry.key(s) for s in skills)
+    matching_skills = [skill.lower() for skill, skill_id in job_skills if skill_id in resume_skill_keys]
+    missing_skills = [skill.lower() for skill, skill_id in job_skills if skill_id not in resume_skill_keys]
     skill_match_percent = len(matching_skills) / len(job_skills) * 100 if job_skills else 0
     
     # Look for experience requirements
@@ -157,8 +161,8 @@ def calculate_job_match(
         "skill_match_percent": round(skill_match_percent, 1),
         "experience_match_percent": round(experience_match_percent, 1),
         "education_match_percent": round(education_match_percent, 1),
-        "matching_skills": list(matching_skills),
-        "missing_skills": list(set(s.lower() for s in job_skills) - set(s.lower() for s in skills))
+        "matching_skills": matching_skills,
+        "missing_skills": missing_skills
     }
 
 def suggest_improvements(
@@ -0,0 +1,141 @@
+"""
+Bulk resume parsing over a process pool.
+
+Used to re-parse stored resumes, e.g. after the skills taxonomy changes.
+Inputs are split into chunks across worker processes and results are
+streamed back in input order.
+
+Usage:
+    python -m app.services.batch_parser resumes/*.txt
+"""
+import logging
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
+
+from app.config import BATCH_PARSE_WORKERS, BATCH_PARSE_MIN_DOCUMENTS
+from app.services.parsed_resume import ParsedResume, parse_resume_uncached
+from app.services.skills_kb import get_skills_kb
+
+logger = logging.getLogger(__name__)
+
+class BatchParseStats:
+    """
+    Progress of a parse_many() run, updated as results are streamed.
+    """
+
+    def __init__(self):
+        self.documents = 0
+        self.characters = 0
+        self.seconds = 0.0
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.documents / self.seconds if self.seconds > 0 else 0.0
+
+    def as_dict(self):
+        return {
+            "documents": self.documents,
+            "characters": self.characters,
+            "seconds": round(self.seconds, 3),
+            "docs_per_second": round(self.docs_per_second, 1),
+        }
+
+def _init_worker(skills_kb_source: str):
+    """
+    Give a spawned worker the parent's skill vocabulary.
+
+    Importing parsed_resume only registers the parser's skills; the analyzer
+    and career path skills are registered by importing their modules, and
+    the skills KB is loaded from the same source as in the parent, which
+    may have been reloaded from another file.
+    """
+    import app.routers.career_paths  # noqa: F401
+    import app.services.analyzer  # noqa: F401
+    from app.services.skills_kb import reload_skills_index
+
+    if get_skills_kb().source != skills_kb_source:
+        reload_skills_index(Path(skills_kb_source))
+
+def _default_chunksize(count: int, workers: int) -> int:
+    # About four chunks per worker balances load without per-document IPC
+    return max(1, count // (workers * 4))
+
+def parse_many(
+    texts: Iterable[str],
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    stats: Optional[BatchParseStats] = None
+) -> Iterator[ParsedResume]:
+    """
+    Parse many resumes, streaming the results back in input order.
+
+    Batches smaller than BATCH_PARSE_MIN_DOCUMENTS, or runs with a single
+    worker, are parsed in the calling process; pooled workers are given the
+    same skill vocabulary and skills KB, so both give the same results. Every
+    text is parsed afresh, bypassing the parse_resume memo, so results follow
+    the current skills taxonomy and a batch does not evict the parses of
+    recent requests.
+
+    Args:
+        texts: Resume texts to parse
+        max_workers: Worker processes to use (defaults to BATCH_PARSE_WORKERS)
+        chunksize: Documents sent to a worker at a time (chosen from the
+            batch size when omitted)
+        stats: Optional BatchParseStats updated as each result is yielded
+
+    Yields:
+        ParsedResume for each text, in the same order as texts
+    """
+    if not isinstance(texts, Sequence):
+        texts = list(texts)
+    workers = max(1, min(max_workers or BATCH_PARSE_WORKERS, len(texts)))
+    stats = stats if stats is not None else BatchParseStats()
+    start_time = time.perf_counter()
+
+    if workers == 1 or len(texts) < BATCH_PARSE_MIN_DOCUMENTS:
+        results = map(parse_resume_uncached, texts)
+        executor = None
+    else:
+        # Spawn rather than fork: the API process is multi-threaded. Each
+        # worker loads the skills KB the parent is using.
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(get_skills_kb().source,)
+        )
+        results = executor.map(parse_resume_uncached, texts, chunksize=chunksize or _default_chunksize(len(texts), workers))
+
+    try:
+        for text, parsed in zip(texts, results):
+            stats.documents += 1
+            stats.characters += len(text)
+            stats.seconds = time.perf_counter() - start_time
+            yield parsed
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    logger.info(
+        f"Parsed {stats.documents} documents in {stats.seconds:.2f}s "
+        f"({stats.docs_per_second:.1f} docs/sec, {workers} worker(s))"
+    )
+
+def main(paths):
+    """Parse text files and print throughput."""
+    texts = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            texts.append(f.read())
+
+    stats = BatchParseStats()
+    for _ in parse_many(texts, stats=stats):
+        pass
+    print(stats.as_dict())
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
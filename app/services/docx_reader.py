@@ -0,0 +1,103 @@
+"""
+Streaming DOCX text reader.
+
+Reads the main document part with an incremental XML parser and emits the
+text of each top-level body paragraph, without building python-docx's full
+object model. The output matches "\\n".join(p.text for p in doc.paragraphs).
+"""
+import posixpath
+import zipfile
+from typing import Iterator
+from xml.etree import ElementTree
+
+from app.services.uploads import MappedStream
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+RELS_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+OFFICE_DOCUMENT_REL = "/officeDocument"
+
+BODY = W_NS + "body"
+PARAGRAPH = W_NS + "p"
+RUN = W_NS + "r"
+HYPERLINK = W_NS + "hyperlink"
+TEXT = W_NS + "t"
+BREAK = W_NS + "br"
+BREAK_TYPE = W_NS + "type"
+
+# Run children translated to fixed text, as python-docx does
+RUN_CHARACTERS = {
+    W_NS + "tab": "\t",
+    W_NS + "ptab": "\t",
+    W_NS + "cr": "\n",
+    W_NS + "noBreakHyphen": "-",
+}
+
+def _main_document_path(archive: zipfile.ZipFile) -> str:
+    """Resolve the main document part from the package relationships."""
+    try:
+        with archive.open("_rels/.rels") as rels:
+            for relationship in ElementTree.parse(rels).getroot().iter(RELS_NS + "Relationship"):
+                if relationship.get("Type", "").endswith(OFFICE_DOCUMENT_REL):
+                    return posixpath.normpath(relationship.get("Target", "").lstrip("/"))
+    except KeyError:
+        pass
+    return "word/document.xml"
+
+def _run_child_text(element: ElementTree.Element) -> str:
+    """Text equivalent of a direct child of a run."""
+    if element.tag == TEXT:
+        return element.text or ""
+    if element.tag == BREAK:
+        # Only line breaks produce text; page and column breaks do not
+        return "\n" if element.get(BREAK_TYPE, "textWrapping") == "textWrapping" else ""
+    return RUN_CHARACTERS.get(element.tag, "")
+
+def iter_docx_paragraphs(content) -> Iterator[str]:
+    """
+    Stream the text of each top-level body paragraph in a DOCX document.
+
+    Args:
+        content: Bytes-like DOCX buffer (bytes or a read-only mmap)
+
+    Yields:
+        Paragraph text, in document order
+    """
+    with MappedStream(content) as stream, zipfile.ZipFile(stream) as archive:
+        with archive.open(_main_document_path(archive)) as document_xml:
+            stack = []
+            parts = []
+            body = None
+
+            for event, element in ElementTree.iterparse(document_xml, events=("start", "end")):
+                if event == "start":
+                    stack.append(element.tag)
+                    if element.tag == BODY and len(stack) == 2:
+                        body = element
+                    continue
+
+                depth = len(stack)
+                # document/body/p/r/<child> or document/body/p/hyperlink/r/<child>
+                if depth >= 5 and stack[1] == BODY and stack[2] == PARAGRAPH and stack[-2] == RUN:
+                    if depth == 5 or (depth == 6 and stack[3] == HYPERLINK):
+                        parts.append(_run_child_text(element))
+
+                elif depth == 3 and body is not None:
+                    if element.tag == PARAGRAPH:
+                        yield "".join(parts)
+                        parts = []
+                    # Drop finished body content to keep memory flat
+                    body.clear()
+
+                stack.pop()
+
+def read_docx_text(content) -> str:
+    """
+    Extract paragraph text from a DOCX document.
+
+    Args:
+        content: Bytes-like DOCX buffer (bytes or a read-only mmap)
+
+    Returns:
+        Paragraph text joined with newlines
+    """
+    return "\n".join(iter_docx_paragraphs(content))
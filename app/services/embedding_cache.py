@@ -0,0 +1,195 @@
+"""
+Cache of text embeddings keyed by model ID and text hash.
+
+The vector store embeds the same skill names and industry strings over and
+over, for queries and when the knowledge base is rebuilt. The cache sits in
+front of an embedding function: texts already seen with the same model get
+their stored vector, and only the others are embedded, in one call.
+
+Entries live in an LRU and are flushed to two files per model:
+
+    <cache dir>/<model ID>/keys.npy       16-byte BLAKE2b digests of the texts
+    <cache dir>/<model ID>/vectors.npy    float32[entries, dim]
+
+Both are written through temporary files and moved into place, by a
+background thread once flush_every new entries have been cached, and at
+shutdown, so requests never wait on the rewrite. On start the files are
+memory-mapped, so loaded vectors are only read from disk when they are used.
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.utils.helpers import LRUCache
+
+logger = logging.getLogger(__name__)
+
+KEYS_FILE = "keys.npy"
+VECTORS_FILE = "vectors.npy"
+_DIGEST_SIZE = 16
+
+def embedding_key(model_id: str, text: str) -> bytes:
+    """Cache key of a text embedded with a model."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=_DIGEST_SIZE, person=b"embedding-cache")
+    digest.update(b"\0" + model_id.encode("utf-8"))
+    return digest.digest()
+
+def _save_array(path: Path, values: np.ndarray):
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}-", suffix=path.suffix)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, values)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+class EmbeddingCache:
+    """
+    LRU of embeddings for one model, optionally persisted to a directory.
+    """
+
+    def __init__(self, model_id: str, max_entries: int = 10000, cache_dir: Optional[str] = None, flush_every: int = 256):
+        """
+        Args:
+            model_id: ID of the embedding model; part of every key
+            max_entries: Maximum number of cached vectors
+            cache_dir: Directory to persist the cache in, or None to keep it in memory
+            flush_every: Flush to disk in the background after this many new entries
+        """
+        self.model_id = model_id
+        self.memory = LRUCache(max_entries)
+        self.directory = Path(cache_dir) / model_id if cache_dir else None
+        self.flush_every = flush_every
+        self._unflushed = 0
+        self._flushing = False
+        # Guards the counters above; _write_lock serializes writes to the files
+        self._flush_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        if self.directory is not None:
+            self._load()
+
+    def _load(self):
+        """Fill the LRU from the persisted files, if present and consistent."""
+        try:
+            keys = np.load(self.directory / KEYS_FILE)
+            vectors = np.load(self.directory / VECTORS_FILE, mmap_mode="r")
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable embedding cache in {self.directory}: {str(e)}")
+            return
+        if keys.dtype != np.dtype(f"S{_DIGEST_SIZE}") or vectors.ndim != 2 or len(keys) != len(vectors):
+            logger.warning(f"Ignoring inconsistent embedding cache in {self.directory}")
+            return
+        # Files are written least recently used first, so the LRU order survives
+        for key, vector in zip(keys.tolist(), vectors):
+            self.memory.put(key, vector)
+        logger.info(f"Loaded {len(keys)} cached embeddings for {self.model_id}")
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Look up the vectors of several texts; None for each text not cached."""
+        return [self.memory.get(embedding_key(self.model_id, text)) for text in texts]
+
+    def put_many(self, texts: Sequence[str], vectors: np.ndarray):
+        """Cache the vectors of several texts, starting a background flush once enough are new."""
+        for text, vector in zip(texts, vectors):
+            # Copied, so a cached row does not keep the whole batch alive
+            self.memory.put(embedding_key(self.model_id, text), np.array(vector, dtype=np.float32))
+        if self.directory is None:
+            return
+        with self._flush_lock:
+            self._unflushed += len(texts)
+            due = self._unflushed >= self.flush_every and not self._flushing
+            if due:
+                self._flushing = True
+        if due:
+            threading.Thread(target=self._background_flush, name="embedding-cache-flush", daemon=True).start()
+
+    def _background_flush(self):
+        try:
+            self.flush()
+        finally:
+            with self._flush_lock:
+                self._flushing = False
+
+    def flush(self):
+        """Write the cached vectors to disk, if the cache is persisted."""
+        if self.directory is None:
+            return
+        with self._write_lock:
+            with self._flush_lock:
+                self._unflushed = 0
+            entries = self.memory.items()
+            if not entries:
+                return
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                keys = np.array([key for key, _ in entries], dtype=f"S{_DIGEST_SIZE}")
+                vectors = np.stack([vector for _, vector in entries]).astype(np.float32, copy=False)
+                # Vectors first: a reader that finds new keys with old vectors
+                # sees mismatched lengths and ignores the cache
+                _save_array(self.directory / VECTORS_FILE, vectors)
+                _save_array(self.directory / KEYS_FILE, keys)
+            except OSError as e:
+                logger.warning(f"Failed to write embedding cache to {self.directory}: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the entry count and hit/miss counters."""
+        stats = self.memory.stats()
+        stats["model_id"] = self.model_id
+        stats["persisted"] = self.directory is not None
+        return stats
+
+class CachedEmbeddingFunction:
+    """
+    Embedding function that serves repeated texts from an EmbeddingCache.
+
+    Follows Chroma's embedding function interface, like the function it
+    wraps; other attributes are those of the wrapped function.
+    """
+
+    def __init__(self, function: Callable[[List[str]], Any], cache: EmbeddingCache):
+        self.function = function
+        self.cache = cache
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts into a float32 array of shape (len(texts), dim)."""
+        vectors = self.cache.get_many(texts)
+        missing = {}
+        for text, vector in zip(texts, vectors):
+            if vector is None:
+                missing.setdefault(text, len(missing))
+        if missing:
+            wrapped = getattr(self.function, "embed", None)
+            new_texts = list(missing)
+            new_vectors = wrapped(new_texts) if wrapped is not None else self.function(new_texts)
+            new_vectors = np.asarray(new_vectors, dtype=np.float32).reshape(len(new_texts), -1)
+            self.cache.put_many(new_texts, new_vectors)
+            vectors = [new_vectors[missing[text]] if vector is None else vector for text, vector in zip(texts, vectors)]
+        if not vectors:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.stack(vectors).astype(np.float32, copy=False)
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        return self.embed(input).tolist()
+
+    # Chroma 1.x embeds documents and query texts through these methods;
+    # defined here so they do not reach the wrapped function uncached
+    def embed_documents(self, input: List[str]) -> List[List[float]]:
+        return self(input)
+
+    def embed_query(self, input: List[str]) -> List[List[float]]:
+        return self(input)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the wrapper
+        if name in ("function", "cache"):
+            raise AttributeError(name)
+        return getattr(self.function, name)
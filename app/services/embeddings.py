@@ -0,0 +1,245 @@
+"""
+Embedding backends for the vector store.
+
+Chroma's default embedding function downloads an ONNX model on first use,
+which fails on hosts without internet access and stalls the first query
+elsewhere. Backends are registered by name and selected with the
+EMBEDDING_BACKEND setting:
+
+- "hashing" (default): a local feature-hashing vectorizer. Words and
+  character trigrams of each word are hashed with BLAKE2b into EMBEDDING_DIM
+  signed buckets, weighted by sublinear term frequency and L2-normalized.
+  It needs no model files and gives the same vectors on every host and
+  Python version, so indexes can be rebuilt reproducibly.
+- "chroma": Chroma's default embedding model.
+
+Each backend has a model ID that is stored with the collection, so a
+collection built with another backend or dimension can be detected. The
+configured backend is wrapped in an embedding cache keyed by model ID and
+text hash (see app.services.embedding_cache), unless
+EMBEDDING_CACHE_MAX_ENTRIES is 0.
+"""
+import functools
+import hashlib
+import math
+import threading
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from app.config import EMBEDDING_BACKEND, EMBEDDING_DIM, EMBEDDING_CACHE_MAX_ENTRIES, EMBEDDING_CACHE_DIR
+from app.services.embedding_cache import CachedEmbeddingFunction, EmbeddingCache
+from app.services.skills_search import tokenize, trigrams
+
+HASHING_VERSION = 1
+
+# Weight of a word relative to each of its character trigrams
+WORD_FEATURE_WEIGHT = 1.0
+TRIGRAM_FEATURE_WEIGHT = 0.5
+
+class EmbeddingBackend(NamedTuple):
+    """An embedding function together with the ID of the model behind it."""
+    name: str
+    model_id: str
+    function: Callable[[List[str]], Any]
+
+# Registry of embedding backend factories keyed by name. Factories receive
+# the configured dimension, which backends with a fixed one ignore.
+EMBEDDING_BACKENDS: Dict[str, Callable[[int], EmbeddingBackend]] = {}
+
+def register_embedding_backend(name: str):
+    """
+    Register an embedding backend factory.
+
+    Args:
+        name: Value of EMBEDDING_BACKEND that selects the backend
+
+    Returns:
+        Decorator that registers the factory
+    """
+    def decorator(factory: Callable[[int], EmbeddingBackend]) -> Callable[[int], EmbeddingBackend]:
+        EMBEDDING_BACKENDS[name] = factory
+        return factory
+    return decorator
+
+@functools.lru_cache(maxsize=65536)
+def _feature_hash(feature: str) -> int:
+    """Stable 64-bit hash of a feature string."""
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+class HashingEmbeddingFunction:
+    """
+    Deterministic feature-hashing embedding function.
+
+    Follows Chroma's embedding function interface: called with a list of
+    texts, it returns one vector per text.
+    """
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        if dim <= 0:
+            raise ValueError(f"Embedding dimension must be positive, got {dim}")
+        self.dim = dim
+
+    @property
+    def model_id(self) -> str:
+        return f"hashing-v{HASHING_VERSION}-{self.dim}"
+
+    def _features(self, text: str) -> Dict[int, float]:
+        """Signed bucket weights of one text, before normalization."""
+        counts: Dict[str, int] = {}
+        for word in tokenize(text.lower()):
+            for feature in ("w:" + word, *("c:" + gram for gram in trigrams(f"<{word}>"))):
+                counts[feature] = counts.get(feature, 0) + 1
+
+        buckets: Dict[int, float] = {}
+        dim = self.dim
+        for feature, count in counts.items():
+            value = _feature_hash(feature)
+            # Sublinear term frequency, with the top bit of the hash as the sign
+            weight = (WORD_FEATURE_WEIGHT if feature[0] == "w" else TRIGRAM_FEATURE_WEIGHT) * (1.0 + math.log(count))
+            if value >> 63:
+                weight = -weight
+            bucket = value % dim
+            buckets[bucket] = buckets.get(bucket, 0.0) + weight
+        return buckets
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed texts into an array of shape (len(texts), dim).
+
+        Rows are L2-normalized; a text without words gets a zero vector.
+        """
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            buckets = self._features(text)
+            if buckets:
+                vectors[row, list(buckets)] = list(buckets.values())
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        return self.embed(input).tolist()
+
+    # Chroma 1.x embeds documents and query texts through these methods
+    def embed_documents(self, input: List[str]) -> List[List[float]]:
+        return self(input)
+
+    def embed_query(self, input: List[str]) -> List[List[float]]:
+        return self(input)
+
+@functools.lru_cache(maxsize=None)
+def _chroma_hashing_class() -> type:
+    """
+    Subclass of Chroma's EmbeddingFunction for hashing functions, registered
+    with Chroma under its name. Created on first use, so importing this
+    module does not import chromadb.
+    """
+    from chromadb.api.types import Documents, EmbeddingFunction
+    from chromadb.utils.embedding_functions import register_embedding_function
+
+    @register_embedding_function
+    class ChromaHashingEmbeddingFunction(EmbeddingFunction[Documents]):
+        """A hashing embedding function, possibly cached, as Chroma sees it."""
+
+        def __init__(self, function: Optional[Callable[[List[str]], Any]] = None, dim: int = EMBEDDING_DIM):
+            self.function = function if function is not None else HashingEmbeddingFunction(dim)
+            self.dim = dim
+
+        def __call__(self, input: Documents) -> List[np.ndarray]:
+            return list(self.function.embed(input))
+
+        # Chroma persists the name and configuration of a collection's
+        # embedding function, and rebuilds it from them when a collection is
+        # opened without one
+        @staticmethod
+        def name() -> str:
+            return "resume_analyzer_hashing"
+
+        def get_config(self) -> Dict[str, Any]:
+            return {"dim": self.dim}
+
+        @staticmethod
+        def build_from_config(config: Dict[str, Any]) -> "ChromaHashingEmbeddingFunction":
+            return ChromaHashingEmbeddingFunction(dim=config.get("dim", EMBEDDING_DIM))
+
+    return ChromaHashingEmbeddingFunction
+
+def chroma_embedding_function(function: Callable[[List[str]], Any]) -> Callable[[List[str]], Any]:
+    """
+    Adapt a backend's embedding function for a Chroma collection.
+
+    Chroma 1.x warns about embedding functions that do not subclass its
+    EmbeddingFunction, and cannot persist their configuration. Hashing
+    functions, cached or not, are wrapped in a subclass; Chroma's own
+    functions are returned as they are.
+    """
+    inner = function.function if isinstance(function, CachedEmbeddingFunction) else function
+    if not isinstance(inner, HashingEmbeddingFunction):
+        return function
+    return _chroma_hashing_class()(function, inner.dim)
+
+@register_embedding_backend("hashing")
+def _hashing_backend(dim: int) -> EmbeddingBackend:
+    function = HashingEmbeddingFunction(dim)
+    return EmbeddingBackend("hashing", function.model_id, function)
+
+@register_embedding_backend("chroma")
+def _chroma_default_backend(dim: int) -> EmbeddingBackend:
+    from chromadb.utils import embedding_functions
+    return EmbeddingBackend("chroma", "chroma-default", embedding_functions.DefaultEmbeddingFunction())
+
+_backend: Optional[EmbeddingBackend] = None
+_backend_lock = threading.Lock()
+
+def create_embedding_backend(name: str = EMBEDDING_BACKEND, dim: int = EMBEDDING_DIM) -> EmbeddingBackend:
+    """
+    Create an embedding backend by name.
+
+    Raises:
+        ValueError: If no backend is registered under the name
+    """
+    factory = EMBEDDING_BACKENDS.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown embedding backend {name!r}; expected one of {sorted(EMBEDDING_BACKENDS)}")
+    return factory(dim)
+
+def get_embedding_backend() -> EmbeddingBackend:
+    """
+    Get the embedding backend selected in the configuration, creating it on
+    first use.
+    """
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                backend = create_embedding_backend()
+                if EMBEDDING_CACHE_MAX_ENTRIES > 0:
+                    cache = EmbeddingCache(backend.model_id, EMBEDDING_CACHE_MAX_ENTRIES, EMBEDDING_CACHE_DIR or None)
+                    backend = backend._replace(function=CachedEmbeddingFunction(backend.function, cache))
+                _backend = backend
+    return _backend
+
+def embedding_cache_stats() -> Optional[Dict[str, Any]]:
+    """Return the counters of the configured backend's embedding cache, if any."""
+    function = _backend.function if _backend is not None else None
+    return function.cache.stats() if isinstance(function, CachedEmbeddingFunction) else None
+
+def flush_embedding_cache():
+    """Write the configured backend's embedding cache to disk."""
+    function = _backend.function if _backend is not None else None
+    if isinstance(function, CachedEmbeddingFunction):
+        function.cache.flush()
+
+def embed_texts(texts: Sequence[str], backend: Optional[EmbeddingBackend] = None) -> np.ndarray:
+    """
+    Embed texts as a float32 array of shape (len(texts), dim).
+
+    Args:
+        texts: Texts to embed
+        backend: Backend to use; defaults to the configured one
+    """
+    function = (backend or get_embedding_backend()).function
+    if isinstance(function, (HashingEmbeddingFunction, CachedEmbeddingFunction)):
+        return function.embed(texts)
+    return np.asarray(function(list(texts)), dtype=np.float32).reshape(len(texts), -1)
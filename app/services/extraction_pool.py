@@ -0,0 +1,238 @@
+"""
+Process-isolated worker pool for untrusted document extraction.
+
+Each job runs in a separate worker process with a wall-clock deadline and a
+resident memory cap. Workers that exceed either budget are killed and
+replaced, so a malformed PDF cannot hang or bloat the API process.
+"""
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# How often the parent checks a running job's deadline and memory use
+POLL_INTERVAL_SECONDS = 0.05
+
+class ExtractionError(Exception):
+    """Base class for document extraction failures."""
+
+class ExtractionLimitExceeded(ExtractionError):
+    """Raised when a document exceeds its extraction time or memory budget."""
+
+    def __init__(self, message: str, reason: str):
+        super().__init__(message)
+        self.reason = reason
+
+    def __reduce__(self):
+        # Keep the reason when the exception crosses the process boundary
+        return (self.__class__, (str(self), self.reason))
+
+def _read_rss_bytes(pid: int) -> Optional[int]:
+    """Return the resident set size of a process, or None if unavailable."""
+    try:
+        with open(f"/proc/{pid}/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+def _worker_main(conn):
+    """Worker process loop: run jobs received over the pipe until told to stop."""
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+
+        func, args = job
+        try:
+            conn.send((True, func(*args)))
+        except MemoryError:
+            conn.send((False, ExtractionLimitExceeded("Document exceeded the extraction memory limit", "memory")))
+        except Exception as e:
+            try:
+                conn.send((False, e))
+            except Exception:
+                # The exception itself could not be pickled
+                conn.send((False, ExtractionError(repr(e))))
+
+class _Worker:
+    """A single worker process and the parent end of its pipe."""
+
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.tasks_completed = 0
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=1)
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (OSError, BrokenPipeError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+        self.conn.close()
+
+class IsolatedWorkerPool:
+    """
+    Bounded pool of worker processes with per-job time and memory limits.
+
+    Jobs are submitted with run(), which blocks the calling thread until the
+    result is ready, so callers should invoke it from a worker thread rather
+    than the event loop.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        timeout_seconds: float = 10.0,
+        max_rss_mb: int = 512,
+        max_tasks_per_worker: int = 100
+    ):
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024 if max_rss_mb > 0 else None
+        self.max_tasks_per_worker = max_tasks_per_worker
+        # Spawn rather than fork: the API process is multi-threaded
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.LifoQueue[_Worker]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._lock = threading.Lock()
+        self._workers = set()
+        self._closed = False
+        self.killed_workers = 0
+
+    def _acquire_worker(self, deadline: Optional[float] = None) -> _Worker:
+        if deadline is None:
+            self._slots.acquire()
+        elif not self._slots.acquire(timeout=max(deadline - time.monotonic(), 0.0)):
+            raise ExtractionLimitExceeded(
+                f"Document extraction exceeded the {self.timeout_seconds:g}s time limit", "timeout"
+            )
+        try:
+            with self._lock:
+                if self._closed:
+                    raise ExtractionError("Extraction pool is shut down")
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                worker = _Worker(self._context)
+                with self._lock:
+                    self._workers.add(worker)
+                return worker
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release_worker(self, worker: _Worker, recycle: bool = False):
+        try:
+            if recycle or self._closed:
+                with self._lock:
+                    self._workers.discard(worker)
+                if recycle:
+                    worker.kill()
+                else:
+                    worker.stop()
+            elif self.max_tasks_per_worker and worker.tasks_completed >= self.max_tasks_per_worker:
+                # Retire long-lived workers so fragmentation cannot accumulate
+                with self._lock:
+                    self._workers.discard(worker)
+                worker.stop()
+            else:
+                self._idle.put(worker)
+        finally:
+            self._slots.release()
+
+    def run(self, func: Callable[..., Any], *args: Any, deadline: Optional[float] = None) -> Any:
+        """
+        Run func(*args) in an isolated worker process.
+
+        Args:
+            func: Module-level (picklable) function to execute
+            args: Picklable arguments for the function
+            deadline: time.monotonic() value by which the job must finish,
+                for jobs sharing one document's time budget; the pool's
+                per-job timeout still applies when it is earlier
+
+        Returns:
+            The function's return value
+
+        Raises:
+            ExtractionLimitExceeded: If the job exceeds the time or memory budget,
+                or the worker dies while running it
+        """
+        worker = self._acquire_worker(deadline)
+        recycle = False
+        try:
+            try:
+                worker.conn.send((func, args))
+            except OSError:
+                recycle = True
+                raise ExtractionLimitExceeded("Extraction worker terminated unexpectedly", "crashed")
+            job_deadline = time.monotonic() + self.timeout_seconds
+            deadline = job_deadline if deadline is None else min(deadline, job_deadline)
+
+            while not worker.conn.poll(POLL_INTERVAL_SECONDS):
+                if not worker.process.is_alive():
+                    recycle = True
+                    raise ExtractionLimitExceeded("Extraction worker terminated unexpectedly", "crashed")
+
+                if time.monotonic() >= deadline:
+                    recycle = True
+                    raise ExtractionLimitExceeded(
+                        f"Document extraction exceeded the {self.timeout_seconds:g}s time limit", "timeout"
+                    )
+
+                if self.max_rss_bytes is not None:
+                    rss = _read_rss_bytes(worker.process.pid)
+                    if rss is not None and rss > self.max_rss_bytes:
+                        recycle = True
+                        raise ExtractionLimitExceeded(
+                            f"Document extraction exceeded the {self.max_rss_bytes // (1024 * 1024)} MB memory limit", "memory"
+                        )
+
+            try:
+                ok, payload = worker.conn.recv()
+            except (EOFError, OSError):
+                recycle = True
+                raise ExtractionLimitExceeded("Extraction worker terminated unexpectedly", "crashed")
+
+            worker.tasks_completed += 1
+            if not ok:
+                if isinstance(payload, ExtractionLimitExceeded):
+                    recycle = True
+                raise payload
+            return payload
+
+        except ExtractionLimitExceeded as e:
+            if recycle:
+                self.killed_workers += 1
+                logger.warning(f"Recycling extraction worker {worker.process.pid}: {e.reason}")
+            raise
+        finally:
+            self._release_worker(worker, recycle=recycle)
+
+    def shutdown(self):
+        """Stop all worker processes."""
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
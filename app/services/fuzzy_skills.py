@@ -0,0 +1,164 @@
+"""
+Typo-tolerant skill lookup.
+
+A SymSpell-style deletion index: every vocabulary term is stored under each
+string obtained by deleting up to max_distance characters from its first
+prefix_length characters. A query generates the same deletions of its own
+prefix, so the terms within the edit distance are exactly those sharing a
+deletion with it, and only they are checked with a full edit distance. The
+number of deletions per query depends on max_distance and prefix_length, not
+on the size of the vocabulary.
+
+The allowed distance shrinks for short words, which are easy to confuse
+with ordinary words ("Rest" and Rust, "Scale" and Scala): terms of five
+characters or fewer only match exactly, up to seven characters one edit is
+allowed, and longer terms allow two. A match must also start with the same
+character as the query, since misspellings rarely change the first letter
+("Locker" is not a misspelling of Docker).
+"""
+import threading
+from typing import Dict, Generic, Iterable, List, Set, Tuple, TypeVar
+
+Payload = TypeVar("Payload")
+
+DEFAULT_MAX_DISTANCE = 2
+DEFAULT_PREFIX_LENGTH = 7
+
+def allowed_distance(length: int, max_distance: int = DEFAULT_MAX_DISTANCE) -> int:
+    """Maximum edit distance accepted for a term of the given length."""
+    if length <= 5:
+        return 0
+    if length <= 7:
+        return min(1, max_distance)
+    return min(2, max_distance)
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent
+    transpositions) between two strings.
+
+    Returns:
+        The distance, or max_distance + 1 as soon as it is known to exceed
+        max_distance
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    # Common prefixes and suffixes do not change the distance
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if not a or not b:
+        return len(a) + len(b)
+
+    # Only cells within max_distance of the diagonal can stay within it, so
+    # the table is filled in a band and capped at max_distance + 1
+    exceeded = max_distance + 1
+    len_a, len_b = len(a), len(b)
+    previous2: List[int] = []
+    previous = [min(j, exceeded) for j in range(len_b + 1)]
+    for i in range(1, len_a + 1):
+        current = [exceeded] * (len_b + 1)
+        current[0] = min(i, exceeded)
+        row_min = current[0]
+        char_a = a[i - 1]
+        for j in range(max(1, i - max_distance), min(len_b, i + max_distance) + 1):
+            value = previous[j - 1] + (char_a != b[j - 1])
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == b[j - 1] and previous2[j - 2] + 1 < value:
+                value = previous2[j - 2] + 1
+            if value > exceeded:
+                value = exceeded
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return exceeded
+        previous2, previous = previous, current
+    return previous[len_b]
+
+def _deletes(term: str, max_distance: int) -> Set[str]:
+    """Every string obtained by deleting up to max_distance characters."""
+    results = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))} - results
+        results |= frontier
+    return results
+
+class FuzzySkillIndex(Generic[Payload]):
+    """
+    Thread-safe deletion index from normalized terms to payloads.
+
+    Terms can be added at any time. Posting lists are replaced rather than
+    mutated, so lookups need no lock.
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE, prefix_length: int = DEFAULT_PREFIX_LENGTH):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._terms: Dict[str, Payload] = {}
+        self._deletes: Dict[str, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, term: str, payload: Payload):
+        """Index a normalized term. A term already indexed keeps its payload."""
+        with self._lock:
+            if term in self._terms:
+                return
+            self._terms[term] = payload
+            for deletion in _deletes(term[:self.prefix_length], allowed_distance(len(term), self.max_distance)):
+                self._deletes[deletion] = self._deletes.get(deletion, ()) + (term,)
+
+    def add_many(self, terms: Iterable[Tuple[str, Payload]]):
+        """Index several (term, payload) pairs."""
+        for term, payload in terms:
+            self.add(term, payload)
+
+    def lookup(self, term: str) -> List[Tuple[str, Payload, int]]:
+        """
+        Find the indexed terms within the allowed edit distance of a term
+        that start with the same character.
+
+        Args:
+            term: Normalized query term
+
+        Returns:
+            (term, payload, distance) for each match, closest first
+        """
+        payload = self._terms.get(term)
+        if payload is not None:
+            return [(term, payload, 0)]
+
+        max_distance = allowed_distance(len(term), self.max_distance)
+        if max_distance == 0:
+            return []
+
+        matches: Dict[str, int] = {}
+        for deletion in _deletes(term[:self.prefix_length], max_distance):
+            for candidate in self._deletes.get(deletion, ()):
+                if candidate in matches or candidate[0] != term[0]:
+                    continue
+                limit = min(max_distance, allowed_distance(len(candidate), self.max_distance))
+                distance = edit_distance(term, candidate, limit)
+                if distance <= limit:
+                    matches[candidate] = distance
+
+        ranked = sorted(matches.items(), key=lambda item: (item[1], item[0]))
+        return [(candidate, self._terms[candidate], distance) for candidate, distance in ranked]
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._terms
+
+    def __len__(self) -> int:
+        return len(self._terms)
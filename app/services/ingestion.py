@@ -0,0 +1,328 @@
+"""
+Document ingestion service for extracting text from uploaded resumes.
+
+Extraction is CPU bound (pypdf, python-docx), so it is dispatched to a bounded
+worker pool instead of running inside the async request handlers.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from app.config import (
+    INGESTION_EXECUTOR, INGESTION_MAX_WORKERS,
+    PDF_EXTRACTION_BACKEND, PDF_EXTRACTION_WORKERS, PDF_EXTRACTION_TIMEOUT_SECONDS,
+    PDF_EXTRACTION_MAX_RSS_MB, PDF_EXTRACTION_MAX_TASKS_PER_WORKER,
+    PDF_PAGES_PER_TASK, PDF_PARALLEL_MIN_PAGES, PDF_MAX_PAGES, PDF_EARLY_EXIT
+)
+from app.services.docx_reader import read_docx_text
+from app.services.extraction_pool import IsolatedWorkerPool
+from app.services.pdf_extraction import extract_pdf_parallel, read_pdf_text
+from app.services.text_cache import content_digest, text_cache
+from app.services.uploads import SpooledUpload, spool_upload
+
+logger = logging.getLogger(__name__)
+
+# Registry of text extractors keyed by file extension. Extractors receive a
+# bytes-like buffer (bytes or a read-only mmap) and must not keep references
+# to it after returning.
+EXTRACTORS: Dict[str, Callable[[Any], str]] = {}
+
+# Extension used when the upload has no registered extension
+DEFAULT_FORMAT = ".txt"
+
+# Formats whose parsers are run in isolated worker processes
+ISOLATED_FORMATS = {".pdf"} if PDF_EXTRACTION_BACKEND == "process" else set()
+
+def register_extractor(*extensions: str):
+    """
+    Register a text extractor for one or more file extensions.
+
+    Args:
+        extensions: File extensions (e.g. ".pdf") handled by the extractor
+
+    Returns:
+        Decorator that registers the extractor function
+    """
+    def decorator(func: Callable[[Any], str]) -> Callable[[Any], str]:
+        for extension in extensions:
+            EXTRACTORS[extension.lower()] = func
+        return func
+    return decorator
+
+@register_extractor(".pdf")
+def extract_pdf_text(content) -> str:
+    """Extract text from a PDF document, honouring the page limit and early exit settings."""
+    return read_pdf_text(content, max_pages=PDF_MAX_PAGES or None, stop_when_sections_found=PDF_EARLY_EXIT)
+
+@register_extractor(".docx")
+def extract_docx_text(content) -> str:
+    """Extract paragraph text from a DOCX document with the streaming reader."""
+    return read_docx_text(content)
+
+@register_extractor(".txt")
+def extract_plain_text(content) -> str:
+    """Decode a plain text document."""
+    return str(content, "utf-8")
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize extracted text so equivalent documents produce identical output.
+
+    Line endings are unified to "\n" and NUL characters (common in text pulled
+    from broken PDFs) are dropped.
+    """
+    return text.replace("\r\n", "\n").replace("\r", "\n").replace("\x00", "")
+
+def get_document_format(filename: Optional[str]) -> str:
+    """
+    Resolve the registered format for a file name.
+
+    Unknown extensions are treated as plain text, matching the behaviour of
+    the upload endpoints.
+    """
+    extension = os.path.splitext(filename or "")[1].lower()
+    return extension if extension in EXTRACTORS else DEFAULT_FORMAT
+
+def is_supported_format(filename: Optional[str]) -> bool:
+    """Check whether a file name has a registered extractor."""
+    return os.path.splitext(filename or "")[1].lower() in EXTRACTORS
+
+class IngestionStats:
+    """
+    Thread-safe accumulator of per-stage extraction timings.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    def record(self, document_format: str, stage: str, seconds: float):
+        """Record the duration of one stage for a document format."""
+        with self._lock:
+            entry = self._stages.setdefault(
+                (document_format, stage), {"count": 0, "total": 0.0, "max": 0.0}
+            )
+            entry["count"] += 1
+            entry["total"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Return accumulated timings grouped by format and stage."""
+        with self._lock:
+            result: Dict[str, Dict[str, Dict[str, float]]] = {}
+            for (document_format, stage), entry in self._stages.items():
+                result.setdefault(document_format, {})[stage] = {
+                    "count": entry["count"],
+                    "total_ms": round(entry["total"] * 1000, 3),
+                    "avg_ms": round(entry["total"] / entry["count"] * 1000, 3),
+                    "max_ms": round(entry["max"] * 1000, 3),
+                }
+            return result
+
+    def reset(self):
+        """Clear all accumulated timings."""
+        with self._lock:
+            self._stages.clear()
+
+ingestion_stats = IngestionStats()
+
+_executor: Optional[Executor] = None
+_isolated_pool: Optional[IsolatedWorkerPool] = None
+_page_dispatcher: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_executor() -> Executor:
+    """
+    Get or create the bounded worker pool used for extraction.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                if INGESTION_EXECUTOR == "process":
+                    _executor = ProcessPoolExecutor(max_workers=INGESTION_MAX_WORKERS)
+                else:
+                    _executor = ThreadPoolExecutor(
+                        max_workers=INGESTION_MAX_WORKERS,
+                        thread_name_prefix="ingestion"
+                    )
+    return _executor
+
+def get_isolated_pool() -> IsolatedWorkerPool:
+    """
+    Get or create the process pool used for formats in ISOLATED_FORMATS.
+    """
+    global _isolated_pool
+    if _isolated_pool is None:
+        with _executor_lock:
+            if _isolated_pool is None:
+                _isolated_pool = IsolatedWorkerPool(
+                    max_workers=PDF_EXTRACTION_WORKERS,
+                    timeout_seconds=PDF_EXTRACTION_TIMEOUT_SECONDS,
+                    max_rss_mb=PDF_EXTRACTION_MAX_RSS_MB,
+                    max_tasks_per_worker=PDF_EXTRACTION_MAX_TASKS_PER_WORKER
+                )
+    return _isolated_pool
+
+def get_page_dispatcher() -> ThreadPoolExecutor:
+    """
+    Get or create the threads that wait on page-range jobs in the isolated pool.
+    """
+    global _page_dispatcher
+    if _page_dispatcher is None:
+        with _executor_lock:
+            if _page_dispatcher is None:
+                _page_dispatcher = ThreadPoolExecutor(
+                    max_workers=PDF_EXTRACTION_WORKERS,
+                    thread_name_prefix="pdf-pages"
+                )
+    return _page_dispatcher
+
+def shutdown_ingestion():
+    """Shut down the extraction worker pools."""
+    global _executor, _isolated_pool, _page_dispatcher
+    with _executor_lock:
+        if _page_dispatcher is not None:
+            _page_dispatcher.shutdown(wait=False, cancel_futures=True)
+            _page_dispatcher = None
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+        if _isolated_pool is not None:
+            _isolated_pool.shutdown()
+            _isolated_pool = None
+
+DocumentSource = Union[bytes, SpooledUpload]
+
+def _run_extractor(document_format: str, content: DocumentSource) -> Tuple[str, float]:
+    """Run the registered extractor and time it inside the worker."""
+    start_time = time.perf_counter()
+    extractor = EXTRACTORS[document_format]
+    if isinstance(content, SpooledUpload):
+        with content.open_view() as buffer:
+            text = extractor(buffer)
+    else:
+        text = extractor(content)
+    return normalize_text(text), time.perf_counter() - start_time
+
+def _run_isolated_extractor(document_format: str, content: DocumentSource) -> Tuple[str, float]:
+    """Run the extractor in an isolated process, blocking the calling thread."""
+    pool = get_isolated_pool()
+    if document_format != ".pdf" or pool.max_workers < 2:
+        return pool.run(_run_extractor, document_format, content)
+
+    # Fan page ranges out across the workers and join the text once; all
+    # ranges share the document's time limit
+    start_time = time.perf_counter()
+    deadline = time.monotonic() + pool.timeout_seconds
+    text = extract_pdf_parallel(
+        pool.run,
+        get_page_dispatcher(),
+        content,
+        pages_per_task=PDF_PAGES_PER_TASK,
+        max_parallel=pool.max_workers,
+        max_pages=PDF_MAX_PAGES or None,
+        stop_when_sections_found=PDF_EARLY_EXIT,
+        min_parallel_pages=PDF_PARALLEL_MIN_PAGES,
+        deadline=deadline
+    )
+    return normalize_text(text), time.perf_counter() - start_time
+
+async def extract_text(filename: Optional[str], content: DocumentSource) -> Dict[str, Any]:
+    """
+    Extract text from a document without blocking the event loop.
+
+    Previously seen documents are served from the content-addressed text
+    cache and skip parsing entirely.
+
+    Args:
+        filename: Original file name, used to pick the extractor
+        content: Raw document bytes, or a spooled upload
+
+    Returns:
+        Dictionary with the extracted text, the resolved format, whether it
+        came from the cache and stage timings
+    """
+    document_format = get_document_format(filename)
+
+    start_time = time.perf_counter()
+    digest = content.digest if isinstance(content, SpooledUpload) else content_digest(content)
+    cache_key = text_cache.make_key(document_format, digest)
+    cached_text = text_cache.get(cache_key)
+    lookup_seconds = time.perf_counter() - start_time
+    ingestion_stats.record(document_format, "cache_lookup", lookup_seconds)
+
+    if cached_text is not None:
+        return {
+            "text": cached_text,
+            "format": document_format,
+            "cached": True,
+            "timings": {
+                "cache_lookup_ms": round(lookup_seconds * 1000, 3),
+            }
+        }
+
+    loop = asyncio.get_running_loop()
+    start_time = time.perf_counter()
+    if document_format in ISOLATED_FORMATS:
+        # The isolated pool bounds concurrency itself; a default-pool thread
+        # only waits on the worker process. Raises ExtractionLimitExceeded.
+        text, extract_seconds = await loop.run_in_executor(
+            None, _run_isolated_extractor, document_format, content
+        )
+    else:
+        text, extract_seconds = await loop.run_in_executor(
+            get_executor(), _run_extractor, document_format, content
+        )
+    total_seconds = time.perf_counter() - start_time
+    # Time spent waiting for a free worker (and moving data to it)
+    queue_seconds = max(total_seconds - extract_seconds, 0.0)
+
+    ingestion_stats.record(document_format, "queue", queue_seconds)
+    ingestion_stats.record(document_format, "extract", extract_seconds)
+    text_cache.put(cache_key, text)
+
+    return {
+        "text": text,
+        "format": document_format,
+        "cached": False,
+        "timings": {
+            "cache_lookup_ms": round(lookup_seconds * 1000, 3),
+            "queue_ms": round(queue_seconds * 1000, 3),
+            "extract_ms": round(extract_seconds * 1000, 3),
+        }
+    }
+
+async def extract_upload(file) -> Dict[str, Any]:
+    """
+    Read an uploaded file and extract its text.
+
+    Args:
+        file: FastAPI UploadFile containing the resume
+
+    Returns:
+        Dictionary with the extracted text, the resolved format and stage timings
+    """
+    start_time = time.perf_counter()
+    upload = await spool_upload(file)
+    read_seconds = time.perf_counter() - start_time
+
+    try:
+        result = await extract_text(file.filename, upload)
+    finally:
+        upload.close()
+    ingestion_stats.record(result["format"], "read", read_seconds)
+
+    total_seconds = time.perf_counter() - start_time
+    ingestion_stats.record(result["format"], "total", total_seconds)
+
+    result["timings"]["read_ms"] = round(read_seconds * 1000, 3)
+    result["timings"]["total_ms"] = round(total_seconds * 1000, 3)
+    result["size"] = upload.size
+
+    logger.debug(f"Extracted {file.filename} ({upload.size} bytes): {result['timings']}")
+    return result
@@ -0,0 +1,328 @@
+"""
+Compact, memory-mapped binary format for the skills knowledge base.
+
+The taxonomy (categories, their skills and skill aliases) is edited as a
+JSON source file and compiled into a binary file that loads without parsing:
+every string is stored once in a string table, and entries, related skills
+and aliases are arrays of 32-bit string IDs, with related skills kept as a
+CSR adjacency list. The file is read through mmap and memoryview.cast, so
+loading only touches the bytes it decodes.
+
+Layout (little-endian):
+
+    header              32 bytes, see _HEADER
+    string offsets      u32[string_count + 1], into the string data
+    entries             u32[entry_count * 2], (name, category) string IDs
+    related indptr      u32[entry_count + 1], into the related array
+    related             u32[related_count], string IDs
+    aliases             u32[alias_count * 2], (alias, canonical name) string IDs
+    string data         UTF-8 bytes
+
+The header's checksum is the CRC-32 of everything after the header.
+
+Usage:
+    python -m app.services.kb_binary build [--source kb.json] [--output skills_kb.bin]
+    python -m app.services.kb_binary export [--kb skills_kb.bin] [--output kb.json]
+    python -m app.services.kb_binary info [skills_kb.bin]
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from app.config import SKILLS_KB_PATH
+
+MAGIC = b"SKKB"
+FORMAT_VERSION = 1
+
+# magic, format version, flags, string count, entry count, related count,
+# alias count, string data bytes, checksum
+_HEADER = struct.Struct("<4sHHIIIIII")
+
+class SkillsKBFormatError(ValueError):
+    """Raised when a file is not a valid binary skills knowledge base."""
+
+def _to_little_endian(values: array) -> array:
+    if sys.byteorder != "little":
+        values = array("I", values)
+        values.byteswap()
+    return values
+
+def write_skills_kb(
+    path: Path,
+    skill_index: Mapping[str, Mapping[str, Any]],
+    aliases: Mapping[str, List[str]]
+) -> Dict[str, int]:
+    """
+    Compile a skills index and alias table into a binary knowledge base.
+
+    The file is written atomically, so a running server reloading it sees
+    either the old or the new version.
+
+    Args:
+        path: Output file
+        skill_index: Lowercase skill names mapped to their category and related skills
+        aliases: Canonical skill names mapped to their aliases
+
+    Returns:
+        Counts of strings, entries, related skills and aliases written
+    """
+    string_ids: Dict[str, int] = {}
+    encoded: List[bytes] = []
+
+    def intern(value: str) -> int:
+        string_id = string_ids.get(value)
+        if string_id is None:
+            string_id = string_ids[value] = len(encoded)
+            encoded.append(value.encode("utf-8"))
+        return string_id
+
+    entries, indptr, related, alias_pairs = array("I"), array("I", [0]), array("I"), array("I")
+    for name, entry in skill_index.items():
+        entries.extend((intern(name), intern(entry.get("category", "Unknown"))))
+        related.extend(intern(skill) for skill in entry.get("related_skills", ()))
+        indptr.append(len(related))
+    for canonical, names in aliases.items():
+        for alias in names:
+            alias_pairs.extend((intern(alias), intern(canonical)))
+
+    offsets = array("I", [0])
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+    string_data = b"".join(encoded)
+
+    body = b"".join(
+        _to_little_endian(values).tobytes() for values in (offsets, entries, indptr, related, alias_pairs)
+    ) + string_data
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0, len(encoded), len(skill_index), len(related), len(alias_pairs) // 2,
+        len(string_data), zlib.crc32(body)
+    )
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".skills_kb-", suffix=".bin")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(body)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+    return {
+        "strings": len(encoded),
+        "entries": len(skill_index),
+        "related": len(related),
+        "aliases": len(alias_pairs) // 2,
+    }
+
+class SkillsKBFile:
+    """
+    Read-only view of a binary knowledge base file.
+
+    Strings are decoded on access. Close the file (or use it as a context
+    manager) once done; decoded values stay valid after closing.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._views: List[Any] = []
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._open()
+        except BaseException:
+            self.close()
+            raise
+
+    def _open(self):
+        if len(self._mmap) < _HEADER.size:
+            raise SkillsKBFormatError(f"{self.path} is too small to be a skills KB")
+        (magic, version, _, self.string_count, self.entry_count, self.related_count,
+         self.alias_count, string_bytes, checksum) = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise SkillsKBFormatError(f"{self.path} is not a skills KB")
+        if version != FORMAT_VERSION:
+            raise SkillsKBFormatError(f"{self.path} has format version {version}, expected {FORMAT_VERSION}")
+
+        counts = (self.string_count + 1, self.entry_count * 2, self.entry_count + 1, self.related_count, self.alias_count * 2)
+        array_bytes = sum(counts) * 4
+        if len(self._mmap) != _HEADER.size + array_bytes + string_bytes:
+            raise SkillsKBFormatError(f"{self.path} is truncated or has trailing data")
+
+        view = memoryview(self._mmap)
+        self._views = [view]
+        body = view[_HEADER.size:]
+        self._views.append(body)
+        if zlib.crc32(body) != checksum:
+            raise SkillsKBFormatError(f"{self.path} failed its checksum")
+        if sys.byteorder == "little":
+            words = view[_HEADER.size:_HEADER.size + array_bytes].cast("I")
+            self._views.append(words)
+        else:
+            words = array("I")
+            words.frombytes(view[_HEADER.size:_HEADER.size + array_bytes])
+            words.byteswap()
+
+        sections = []
+        start = 0
+        for count in counts:
+            sections.append(words[start:start + count])
+            start += count
+        self._offsets, self._entries, self._indptr, self._related, self._aliases = sections
+        self._views.extend(section for section in sections if isinstance(section, memoryview))
+        self._strings = view[_HEADER.size + array_bytes:]
+        self._views.append(self._strings)
+
+        if self._offsets[-1] != string_bytes or self._indptr[-1] != self.related_count:
+            raise SkillsKBFormatError(f"{self.path} has inconsistent section sizes")
+
+    def string(self, string_id: int) -> str:
+        """Decode one string from the string table."""
+        return str(self._strings[self._offsets[string_id]:self._offsets[string_id + 1]], "utf-8")
+
+    def strings(self) -> List[str]:
+        """Decode the whole string table, indexed by string ID."""
+        data = bytes(self._strings)
+        offsets = self._offsets.tolist()
+        return [str(data[offsets[i]:offsets[i + 1]], "utf-8") for i in range(self.string_count)]
+
+    def entries(self) -> Iterator[Tuple[str, str, Tuple[str, ...]]]:
+        """Yield (name, category, related skills) for every entry, in file order."""
+        strings = self.strings()
+        entries = self._entries.tolist()
+        indptr = self._indptr.tolist()
+        related = [strings[i] for i in self._related.tolist()]
+        for i in range(self.entry_count):
+            yield strings[entries[2 * i]], strings[entries[2 * i + 1]], tuple(related[indptr[i]:indptr[i + 1]])
+
+    def aliases(self) -> Iterator[Tuple[str, str]]:
+        """Yield (alias, canonical name) pairs, in file order."""
+        aliases = self._aliases
+        for i in range(self.alias_count):
+            yield self.string(aliases[2 * i]), self.string(aliases[2 * i + 1])
+
+    def close(self):
+        """Release the memory map."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> "SkillsKBFile":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def read_skills_kb(path: Path) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[str]]]:
+    """
+    Load a binary knowledge base.
+
+    Args:
+        path: Binary KB file
+
+    Returns:
+        The skills index, in the shape built by skills_kb.build_skills_index,
+        and the alias table
+    """
+    with SkillsKBFile(path) as kb:
+        skill_index = {
+            name: {"category": category, "related_skills": list(related)}
+            for name, category, related in kb.entries()
+        }
+        aliases: Dict[str, List[str]] = {}
+        for alias, canonical in kb.aliases():
+            aliases.setdefault(canonical, []).append(alias)
+    return skill_index, aliases
+
+def build_from_source(source: Path, output: Path) -> Dict[str, int]:
+    """
+    Compile a JSON source file into a binary knowledge base.
+
+    The source holds "relationships" (categories mapped to their skills) and
+    optionally "aliases" (canonical skill names mapped to other spellings).
+    """
+    from app.services.skills_kb import build_skills_index
+
+    with open(source, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return write_skills_kb(output, build_skills_index(data["relationships"]), data.get("aliases", {}))
+
+def export_source(kb_path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Produce a JSON source for the knowledge base: from a binary KB when given,
+    otherwise from the taxonomy built into the code.
+    """
+    if kb_path is None:
+        from app.services.skill_registry import SKILL_ALIASES
+        from app.services.skills_kb import SKILLS_RELATIONSHIPS
+        return {"relationships": SKILLS_RELATIONSHIPS, "aliases": SKILL_ALIASES}
+
+    skill_index, aliases = read_skills_kb(kb_path)
+    # Category entries list the category's skills as related skills
+    relationships = {
+        entry["category"]: entry["related_skills"]
+        for name, entry in skill_index.items() if name == entry["category"].lower()
+    }
+    return {"relationships": relationships, "aliases": aliases}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.services.kb_binary", description="Build and inspect the binary skills KB.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="compile a JSON source into a binary KB")
+    build.add_argument("--source", type=Path, help="JSON source (defaults to the built-in taxonomy)")
+    build.add_argument("--output", type=Path, default=Path(SKILLS_KB_PATH))
+
+    export = commands.add_parser("export", help="write the JSON source of a KB")
+    export.add_argument("--kb", type=Path, help="binary KB to export (defaults to the built-in taxonomy)")
+    export.add_argument("--output", type=Path, help="output file (defaults to stdout)")
+
+    info = commands.add_parser("info", help="show the header of a binary KB")
+    info.add_argument("path", type=Path, nargs="?", default=Path(SKILLS_KB_PATH))
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        if args.source is not None:
+            counts = build_from_source(args.source, args.output)
+        else:
+            from app.services.skill_registry import SKILL_ALIASES
+            from app.services.skills_kb import build_skills_index
+            counts = write_skills_kb(args.output, build_skills_index(), SKILL_ALIASES)
+        print(f"Wrote {args.output}: {counts}")
+    elif args.command == "export":
+        source = json.dumps(export_source(args.kb), indent=2)
+        if args.output is None:
+            print(source)
+        else:
+            args.output.write_text(source + "\n", encoding="utf-8")
+    else:
+        start_time = time.perf_counter()
+        skill_index, aliases = read_skills_kb(args.path)
+        load_ms = (time.perf_counter() - start_time) * 1000
+        with SkillsKBFile(args.path) as kb:
+            print({
+                "path": str(args.path),
+                "format_version": FORMAT_VERSION,
+                "bytes": os.path.getsize(args.path),
+                "strings": kb.string_count,
+                "entries": kb.entry_count,
+                "related": kb.related_count,
+                "aliases": kb.alias_count,
+                "load_ms": round(load_ms, 3),
+            })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+"""
+Build pipeline for the vector store's knowledge collection.
+
+Every knowledge source (the curated skills and industry standards, the
+skills knowledge base, and the career paths skills and paths) is a
+registered generator of documents with stable IDs, so rebuilding the
+collection upserts the same IDs instead of adding duplicates. Documents are
+streamed into the collection in batches.
+
+A build goes into a fresh directory under the store's root, and the root's
+CURRENT file, which names the active build, is replaced atomically once the
+build is complete. Readers never open a half-built or stale-schema store;
+the previous build is kept for processes that still have it open, and older
+ones are removed.
+
+Usage:
+    python -m app.services.kb_builder build [--backend numpy] [--root DIR] [--batch-size 256]
+    python -m app.services.kb_builder current [--backend numpy] [--root DIR]
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from app.config import (
+    CHROMA_PERSIST_DIRECTORY, COLLECTION_NAME, VECTOR_BACKEND, VECTOR_INDEX_DIRECTORY,
+    KB_BUILD_BATCH_SIZE, KB_BUILDS_TO_KEEP
+)
+from app.services.embeddings import EmbeddingBackend, chroma_embedding_function, get_embedding_backend, flush_embedding_cache
+from app.services.skill_registry import normalize_skill
+from app.services.vector_index import NumpyVectorIndex
+
+logger = logging.getLogger(__name__)
+
+# Collection metadata key holding the ID of the embedding model
+EMBEDDING_MODEL_KEY = "embedding_model"
+
+# File in a store's root naming the active build directory
+CURRENT_FILE = "CURRENT"
+BUILDS_DIRECTORY = "builds"
+
+# Hand-written skill summaries; they take precedence over the skills KB entries
+CURATED_SKILLS = [
+    {
+        "skill": "Python",
+        "related_skills": "NumPy, Pandas, Scikit-learn, TensorFlow, PyTorch, Django, Flask",
+        "category": "Programming Language"
+    },
+    {
+        "skill": "Machine Learning",
+        "related_skills": "Deep Learning, Neural Networks, NLP, Computer Vision, Regression, Classification",
+        "category": "AI/Data Science"
+    },
+    {
+        "skill": "AWS",
+        "related_skills": "EC2, S3, Lambda, DynamoDB, CloudFormation, SageMaker",
+        "category": "Cloud"
+    },
+    {
+        "skill": "Docker",
+        "related_skills": "Kubernetes, Containerization, Microservices, CI/CD, DevOps",
+        "category": "DevOps"
+    },
+    {
+        "skill": "JavaScript",
+        "related_skills": "TypeScript, React, Angular, Vue.js, Node.js, Express.js",
+        "category": "Web Development"
+    }
+]
+
+INDUSTRY_STANDARDS = [
+    {
+        "industry": "Software Engineering",
+        "standards": "Clean, ATS-friendly format. Include: languages, frameworks, methodologies. Highlight metrics and achievements. Include GitHub, personal projects."
+    },
+    {
+        "industry": "Data Science",
+        "standards": "Lead with technical skills (Python, R, ML libraries). Highlight impactful projects with measurable results. Include domain expertise and visualization skills."
+    },
+    {
+        "industry": "Cloud Engineering",
+        "standards": "Focus on cloud platforms (AWS/Azure/GCP), certifications, infrastructure as code, security, and cost optimization experience. Include architecture diagrams if possible."
+    },
+    {
+        "industry": "Full Stack Development",
+        "standards": "Balance frontend and backend skills. Show end-to-end project experience. Highlight performance optimization, responsive design, and API development."
+    }
+]
+
+class KBDocument(NamedTuple):
+    """A document of the knowledge collection."""
+    id: str
+    document: str
+    metadata: Dict[str, Any]
+
+# Registry of knowledge sources, in build order. When two sources produce the
+# same document ID, the first one wins.
+KB_SOURCES: Dict[str, Callable[[], Iterable[KBDocument]]] = {}
+
+def register_kb_source(name: str):
+    """
+    Register a generator of knowledge documents.
+
+    Args:
+        name: Source name, reported in build statistics
+
+    Returns:
+        Decorator that registers the generator
+    """
+    def decorator(func: Callable[[], Iterable[KBDocument]]) -> Callable[[], Iterable[KBDocument]]:
+        KB_SOURCES[name] = func
+        return func
+    return decorator
+
+def _skill_document(skill: str, related_skills: Iterable[str], category: str) -> KBDocument:
+    data = {"skill": skill, "related_skills": ", ".join(related_skills), "category": category}
+    return KBDocument(f"skill:{normalize_skill(skill)}", json.dumps(data), {"type": "skill_data"})
+
+@register_kb_source("curated_skills")
+def curated_skill_documents() -> Iterator[KBDocument]:
+    for item in CURATED_SKILLS:
+        yield _skill_document(item["skill"], item["related_skills"].split(", "), item["category"])
+
+@register_kb_source("industry_standards")
+def industry_standard_documents() -> Iterator[KBDocument]:
+    for item in INDUSTRY_STANDARDS:
+        yield KBDocument(f"industry:{normalize_skill(item['industry'])}", json.dumps(item), {"type": "industry_standard"})
+
+@register_kb_source("skills_kb")
+def skills_kb_documents() -> Iterator[KBDocument]:
+    from app.services.skill_registry import skill_registry
+    from app.services.skills_kb import get_skills_kb
+
+    for name, entry in get_skills_kb().index.items():
+        yield _skill_document(skill_registry.canonical(name) or name, entry["related_skills"], entry["category"])
+
+@register_kb_source("career_skills")
+def career_skill_documents() -> Iterator[KBDocument]:
+    # The router module holds the data; imported here so the builder does
+    # not load FastAPI unless this source is built
+    from app.routers.career_paths import SKILLS_DB
+
+    for skill in SKILLS_DB:
+        data = {
+            "id": skill.id,
+            "skill": skill.name,
+            "description": skill.description or "",
+            "learning_resources": [resource.name for resource in skill.learning_resources or []],
+        }
+        yield KBDocument(f"career_skill:{skill.id}", json.dumps(data), {"type": "career_skill"})
+
+@register_kb_source("career_paths")
+def career_path_documents() -> Iterator[KBDocument]:
+    from app.routers.career_paths import CAREER_PATHS_DB
+
+    for path in CAREER_PATHS_DB:
+        data = {
+            "id": path.id,
+            "career_path": path.name,
+            "description": path.description or "",
+            "stages": [{"name": stage.name, "skills_required": stage.skills_required} for stage in path.stages],
+        }
+        yield KBDocument(f"career_path:{path.id}", json.dumps(data), {"type": "career_path"})
+
+def iter_kb_documents(sources: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, KBDocument]]:
+    """
+    Stream the documents of the registered sources, skipping IDs already produced.
+
+    Args:
+        sources: Names of the sources to read; all registered sources by default
+
+    Yields:
+        (source name, document) pairs
+    """
+    seen = set()
+    for name in sources or KB_SOURCES:
+        for document in KB_SOURCES[name]():
+            if document.id not in seen:
+                seen.add(document.id)
+                yield name, document
+
+def upsert_documents(collection, documents: Iterable[Tuple[str, KBDocument]], batch_size: int = KB_BUILD_BATCH_SIZE) -> Dict[str, Any]:
+    """
+    Upsert documents into a collection in batches.
+
+    Args:
+        collection: Chroma collection or NumpyVectorIndex
+        documents: (source name, document) pairs
+        batch_size: Documents per upsert call
+
+    Returns:
+        Document counts per source, batch count and throughput
+    """
+    start_time = time.perf_counter()
+    per_source: Dict[str, int] = {}
+    batch: List[KBDocument] = []
+    batches = 0
+
+    def flush():
+        nonlocal batches
+        collection.upsert(
+            ids=[document.id for document in batch],
+            documents=[document.document for document in batch],
+            metadatas=[document.metadata for document in batch]
+        )
+        batches += 1
+        batch.clear()
+
+    for source, document in documents:
+        per_source[source] = per_source.get(source, 0) + 1
+        batch.append(document)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    seconds = time.perf_counter() - start_time
+    total = sum(per_source.values())
+    return {
+        "documents": total,
+        "sources": per_source,
+        "batches": batches,
+        "seconds": round(seconds, 3),
+        "documents_per_second": round(total / seconds, 1) if seconds > 0 else None,
+    }
+
+def default_root(vector_backend: str = VECTOR_BACKEND) -> Path:
+    """Root directory of a vector backend's builds."""
+    if vector_backend == "numpy":
+        return Path(VECTOR_INDEX_DIRECTORY)
+    if vector_backend == "chroma":
+        return Path(CHROMA_PERSIST_DIRECTORY)
+    raise ValueError(f"Unknown vector backend {vector_backend!r}; expected 'chroma' or 'numpy'")
+
+def active_build_directory(root: Path) -> Optional[Path]:
+    """Return the build directory named by a root's CURRENT file, if there is one."""
+    try:
+        name = (Path(root) / CURRENT_FILE).read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return None
+    directory = Path(root) / BUILDS_DIRECTORY / name
+    return directory if name and directory.is_dir() else None
+
+def _set_active_build(root: Path, directory: Path):
+    """Point a root's CURRENT file at a build directory, atomically."""
+    fd, temp_path = tempfile.mkstemp(dir=root, prefix=f".{CURRENT_FILE}-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(directory.name + "\n")
+        os.replace(temp_path, root / CURRENT_FILE)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def _prune_builds(root: Path, keep: int):
+    """Remove all but the newest builds, never the active one."""
+    active = active_build_directory(root)
+    builds = sorted((root / BUILDS_DIRECTORY).iterdir(), key=lambda path: path.name, reverse=True)
+    kept = 0
+    for directory in builds:
+        if directory == active or (kept < keep and directory.is_dir()):
+            kept += 1
+            continue
+        shutil.rmtree(directory, ignore_errors=True)
+
+def close_client(client):
+    """
+    Release a Chroma client's database and background components.
+
+    Only this client's store is released; clients of other directories in
+    the process keep working. Does nothing for None (the NumPy backend).
+    """
+    if client is None:
+        return
+    try:
+        close = getattr(client, "close", None)
+        if close is not None:
+            close()
+            return
+        # Chroma before 1.0 has no close(); its clients of one directory share
+        # a System, cached per directory, which is stopped and dropped here
+        identifier = getattr(client, "_identifier", None)
+        systems = getattr(type(client), "_identifier_to_system", {})
+        system = systems.pop(identifier, None)
+        if system is not None:
+            system.stop()
+    except Exception as e:
+        logger.warning(f"Failed to close vector store client: {str(e)}")
+
+def open_store(vector_backend: str, directory: Path, embedding_backend: EmbeddingBackend, create: bool = False):
+    """
+    Open the knowledge collection of a build directory.
+
+    Args:
+        vector_backend: "chroma" or "numpy"
+        directory: Build directory
+        embedding_backend: Embedding backend the collection must have been built with
+        create: Create the collection if it does not exist
+
+    Returns:
+        (client, collection); the client is None for the NumPy backend
+
+    Raises:
+        ValueError: If the collection was built with another embedding model,
+            or does not exist and create is False
+    """
+    if vector_backend == "numpy":
+        index = NumpyVectorIndex.load(directory, embedding_backend)
+        if index.count() == 0 and not create:
+            raise ValueError(f"No vector index in {directory}")
+        return None, index
+
+    import chromadb
+    from chromadb.config import Settings
+
+    embedding_function = chroma_embedding_function(embedding_backend.function)
+    client = chromadb.PersistentClient(path=str(directory), settings=Settings(anonymized_telemetry=False))
+    if create:
+        collection = client.get_or_create_collection(
+            COLLECTION_NAME,
+            embedding_function=embedding_function,
+            metadata={EMBEDDING_MODEL_KEY: embedding_backend.model_id}
+        )
+    else:
+        try:
+            # Opened without an embedding function first: the stored model ID
+            # decides whether the collection can be used with this backend
+            collection = client.get_collection(COLLECTION_NAME)
+        except Exception as e:
+            close_client(client)
+            raise ValueError(f"No collection {COLLECTION_NAME} in {directory}: {str(e)}")
+        model_id = (collection.metadata or {}).get(EMBEDDING_MODEL_KEY)
+        if model_id != embedding_backend.model_id:
+            close_client(client)
+            raise ValueError(
+                f"Collection in {directory} was embedded with {model_id or 'an unknown model'}, "
+                f"not {embedding_backend.model_id}"
+            )
+        collection = client.get_collection(COLLECTION_NAME, embedding_function=embedding_function)
+    return client, collection
+
+def build_vector_kb(
+    vector_backend: str = VECTOR_BACKEND,
+    root: Optional[Path] = None,
+    batch_size: int = KB_BUILD_BATCH_SIZE,
+    keep: int = KB_BUILDS_TO_KEEP
+) -> Dict[str, Any]:
+    """
+    Build the knowledge collection from every source into a fresh directory
+    and make it the active build.
+
+    Args:
+        vector_backend: "chroma" or "numpy"
+        root: Root directory of the builds; defaults to the backend's configured directory
+        batch_size: Documents per upsert
+        keep: Number of builds to keep, including the new one
+
+    Returns:
+        Build statistics, including the build directory
+    """
+    root = Path(root) if root is not None else default_root(vector_backend)
+    embedding_backend = get_embedding_backend()
+    (root / BUILDS_DIRECTORY).mkdir(parents=True, exist_ok=True)
+    # Named after the start time, so builds sort oldest first
+    directory = Path(tempfile.mkdtemp(dir=root / BUILDS_DIRECTORY, prefix=time.strftime("%Y%m%d-%H%M%S-")))
+
+    client = None
+    try:
+        client, collection = open_store(vector_backend, directory, embedding_backend, create=True)
+        stats = upsert_documents(collection, iter_kb_documents(), batch_size)
+        if vector_backend == "numpy":
+            collection.save()
+    except BaseException:
+        close_client(client)
+        shutil.rmtree(directory, ignore_errors=True)
+        raise
+    # Readers open the build with their own client
+    close_client(client)
+    flush_embedding_cache()
+
+    _set_active_build(root, directory)
+    _prune_builds(root, keep)
+    stats.update({
+        "backend": vector_backend,
+        "directory": str(directory),
+        "embedding_model": embedding_backend.model_id,
+    })
+    logger.info(
+        f"Built vector KB in {directory}: {stats['documents']} documents in {stats['seconds']}s "
+        f"({stats['documents_per_second']} documents/s)"
+    )
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.services.kb_builder", description="Build the vector store's knowledge collection.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="rebuild the collection from all sources and make it active")
+    build.add_argument("--backend", choices=["chroma", "numpy"], default=VECTOR_BACKEND)
+    build.add_argument("--root", type=Path, help="root directory of the builds (defaults to the backend's configured directory)")
+    build.add_argument("--batch-size", type=int, default=KB_BUILD_BATCH_SIZE)
+    build.add_argument("--keep", type=int, default=KB_BUILDS_TO_KEEP, help="number of builds to keep")
+
+    current = commands.add_parser("current", help="show the active build")
+    current.add_argument("--backend", choices=["chroma", "numpy"], default=VECTOR_BACKEND)
+    current.add_argument("--root", type=Path)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        print(json.dumps(build_vector_kb(args.backend, args.root, args.batch_size, args.keep), indent=2))
+    else:
+        root = args.root if args.root is not None else default_root(args.backend)
+        directory = active_build_directory(root)
+        print(directory if directory is not None else f"No active build in {root}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Limits applied while parsing untrusted resume and job description text.
+
+In hardened mode (PARSER_HARDENED) documents are truncated to a maximum
+length, extracted fields are capped, and each document gets a wall-clock
+budget; extractors that run out of budget return what they found so far.
+"""
+import logging
+import time
+from typing import Optional
+
+from app.config import (
+    PARSER_HARDENED, PARSER_MAX_INPUT_CHARS, PARSER_MAX_FIELD_CHARS, PARSER_TIME_BUDGET_SECONDS
+)
+
+logger = logging.getLogger(__name__)
+
+def limit_input(text: str) -> str:
+    """Truncate a document to the maximum parsed length."""
+    if PARSER_HARDENED and len(text) > PARSER_MAX_INPUT_CHARS:
+        logger.warning(f"Truncating {len(text)} character document to {PARSER_MAX_INPUT_CHARS} characters for parsing")
+        return text[:PARSER_MAX_INPUT_CHARS]
+    return text
+
+def limit_field(value: str) -> str:
+    """Truncate one extracted field to the maximum field length."""
+    if PARSER_HARDENED and len(value) > PARSER_MAX_FIELD_CHARS:
+        return value[:PARSER_MAX_FIELD_CHARS]
+    return value
+
+def field_window() -> Optional[int]:
+    """How far before a date an entry header may start, or None for no limit."""
+    return PARSER_MAX_FIELD_CHARS if PARSER_HARDENED else None
+
+class ParseBudget:
+    """
+    Wall-clock budget shared by the extractors parsing one document.
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        self.deadline = time.monotonic() + seconds if seconds else None
+        self._reported = False
+
+    @classmethod
+    def for_document(cls) -> "ParseBudget":
+        """Create the budget for a new document, unlimited outside hardened mode."""
+        return cls(PARSER_TIME_BUDGET_SECONDS if PARSER_HARDENED else None)
+
+    def expired(self) -> bool:
+        """Check whether the budget has run out, logging the first time it does."""
+        if self.deadline is None or time.monotonic() < self.deadline:
+            return False
+        if not self._reported:
+            self._reported = True
+            logger.warning(f"Parsing exceeded the {PARSER_TIME_BUDGET_SECONDS:g}s time budget; returning partial results")
+        return True
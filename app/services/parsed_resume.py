@@ -0,0 +1,147 @@
+"""
+Immutable, memoized result of parsing one resume.
+
+Analyzers, agent tools and routers call parse_resume() instead of running
+the extractors themselves, so the regex work happens once per distinct
+resume text. Results are memoized by content hash in a bounded LRU.
+"""
+import hashlib
+from typing import Any, Dict, List
+
+from app.config import PARSED_RESUME_CACHE_MAX_ENTRIES
+from app.services.parser import extract_skills, extract_experience, extract_education
+from app.services.segmenter import segment_resume
+from app.services.skill_registry import skill_registry
+from app.utils.helpers import LRUCache
+
+class ParsedResume:
+    """
+    Skills, experience and education extracted from a resume.
+
+    Instances are immutable and shared between callers: properties return
+    copies, so callers may modify what they get back.
+    """
+
+    __slots__ = ("_digest", "_text", "_skills", "_experience", "_education", "_skill_terms")
+
+    def __init__(
+        self,
+        text: str,
+        skills: List[str],
+        experience: List[Dict[str, Any]],
+        education: List[Dict[str, Any]],
+        skill_terms: List[str],
+        digest: str
+    ):
+        set_slot = object.__setattr__
+        set_slot(self, "_digest", digest)
+        set_slot(self, "_text", text)
+        set_slot(self, "_skills", tuple(skills))
+        set_slot(self, "_experience", tuple(dict(job) for job in experience))
+        set_slot(self, "_education", tuple(dict(edu) for edu in education))
+        set_slot(self, "_skill_terms", tuple(skill_terms))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (self.__class__, (
+            self._text, list(self._skills), list(self._experience), list(self._education),
+            list(self._skill_terms), self._digest
+        ))
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 of the resume text."""
+        return self._digest
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @property
+    def skills(self) -> List[str]:
+        return list(self._skills)
+
+    @property
+    def experience(self) -> List[Dict[str, Any]]:
+        return [dict(job) for job in self._experience]
+
+    @property
+    def education(self) -> List[Dict[str, Any]]:
+        return [dict(edu) for edu in self._education]
+
+    @property
+    def skill_terms(self) -> List[str]:
+        """Canonical names of the known skills found anywhere in the text, under any alias, in order of first occurrence."""
+        return list(self._skill_terms)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ParsedResume) and self._digest == other._digest
+
+    def __hash__(self) -> int:
+        return hash(self._digest)
+
+    def __repr__(self) -> str:
+        return (
+            f"ParsedResume(digest={self._digest[:12]!r}, skills={len(self._skills)}, "
+            f"experience={len(self._experience)}, education={len(self._education)})"
+        )
+
+def text_digest(text: str) -> str:
+    """Return the SHA-256 hex digest of a text."""
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+def _parse(text: str, digest: str) -> ParsedResume:
+    sections = segment_resume(text)
+    return ParsedResume(
+        text=text,
+        skills=extract_skills(text, sections),
+        experience=extract_experience(text, sections),
+        education=extract_education(text, sections),
+        skill_terms=skill_registry.find(sections.text),
+        digest=digest
+    )
+
+_parsed_resumes = LRUCache(PARSED_RESUME_CACHE_MAX_ENTRIES)
+
+def parse_resume(text: str) -> ParsedResume:
+    """
+    Parse a resume, reusing the result for text that was parsed before.
+
+    Args:
+        text: The text content of the resume
+
+    Returns:
+        The ParsedResume for the text
+    """
+    digest = text_digest(text)
+    parsed = _parsed_resumes.get(digest)
+    if parsed is None:
+        parsed = _parse(text, digest)
+        _parsed_resumes.put(digest, parsed)
+    return parsed
+
+def parse_resume_uncached(text: str) -> ParsedResume:
+    """
+    Parse a resume without reading or filling the memo, for bulk parsing
+    that must reflect the current skills taxonomy.
+
+    Args:
+        text: The text content of the resume
+
+    Returns:
+        A new ParsedResume for the text
+    """
+    return _parse(text, text_digest(text))
+
+def parse_cache_stats() -> Dict[str, int]:
+    """Return the parsed resume cache counters."""
+    return _parsed_resumes.stats()
+
+def clear_parse_cache():
+    """Drop all memoized parses, e.g. after the skill vocabulary changes."""
+    _parsed_resumes.clear()
@@ -1,15 +1,119 @@
 """
 Resume parsing services to extract key information.
 """
-from typing import List, Dict, Any
+from bisect import bisect_left
+from typing import List, Dict, Any, Optional
 import re
 
-def extract_skills(resume_text: str) -> List[str]:
+from app.services.parse_limits import ParseBudget, field_window, limit_field
+from app.services.segmenter import ResumeSections, segment_resume
+from app.services.skill_registry import skill_registry
+
+# Skills looked for anywhere in the text when a resume has no skills section
+COMMON_SKILLS = [
+    "Python", "Java", "JavaScript", "C++", "C#", "Ruby", "SQL", "HTML", "CSS",
+    "React", "Angular", "Vue", "Node.js", "Django", "Flask", "Spring",
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Git", "Jenkins",
+    "TensorFlow", "PyTorch", "Scikit-learn", "Pandas", "NumPy",
+    "Machine Learning", "Deep Learning", "Natural Language Processing", "Computer Vision"
+]
+COMMON_SKILL_IDS = skill_registry.register_many(COMMON_SKILLS)
+
+DATE_RANGE = r"\d{1,2}/\d{4}\s*[-–]\s*(?:\d{1,2}/\d{4}|Present)"
+
+JOB_PATTERN = re.compile(
+    r"(?P<company>[\w\s&.,]+?),?\s+(?P<title>[\w\s&.,]+?),?\s+(?P<dates>" + DATE_RANGE + r")",
+    re.IGNORECASE
+)
+
+DEGREE_KEYWORDS = [
+    "Bachelor", "Master", "PhD", "Doctor", "B.S.", "M.S.", "Ph.D.",
+    "B.A.", "M.A.", "M.B.A.", "B.Tech", "M.Tech"
+]
+
+DEGREE_PATTERN = re.compile(
+    r"(?P<degree>(?:Bachelor|Master|PhD|Doctor|B\.S\.|M\.S\.|Ph\.D\.|B\.A\.|M\.A\.|M\.B\.A\.|B\.Tech|M\.Tech)[\w\s.,]+?),?\s+(?P<institution>[\w\s&.,]+?),?\s+(?P<dates>" + DATE_RANGE + r")",
+    re.IGNORECASE
+)
+_DEGREE_START = re.compile(r"(?=" + "|".join(re.escape(k) for k in DEGREE_KEYWORDS) + r")", re.IGNORECASE)
+
+# Every position where a date range can start an entry's dates: the entry
+# patterns require whitespace right before it
+_DATE_RANGE_START = re.compile(r"(?<=\s)(?=" + DATE_RANGE + r")", re.IGNORECASE)
+# Characters that cannot appear in an entry before its date range
+_ENTRY_BREAK = re.compile(r"[^\w\s&.,]")
+# Date range used to spot new entries when no entry header matched
+_LINE_DATE_RANGE = re.compile(r"\d{4}\s*[-–]\s*(?:\d{4}|Present)", re.IGNORECASE)
+
+def _find_dated_entries(
+    pattern: re.Pattern,
+    text: str,
+    budget: ParseBudget,
+    start_pattern: Optional[re.Pattern] = None
+) -> List[re.Match]:
+    """
+    Find the same matches as pattern.finditer(text), for a pattern made of
+    [\w\s&.,] text followed by whitespace and a DATE_RANGE.
+
+    Trying the pattern at every offset backtracks through each run of text
+    with no date after it, so instead date starts and break characters are
+    located once and the pattern is only tried in the run of entry
+    characters leading up to each date. A run holds at most one date start,
+    since the "/" in a date ends the run.
+
+    Args:
+        pattern: Entry pattern ending in a DATE_RANGE group
+        text: Text to search
+        budget: Parse budget; the search stops early once it expires
+        start_pattern: Where a match can start. When None, the pattern must
+            match from the start of a run whenever it matches anywhere in it.
+
+    Returns:
+        Non-overlapping matches, in order
+    """
+    breaks = [m.start() for m in _ENTRY_BREAK.finditer(text)]
+    starts = [m.start() for m in start_pattern.finditer(text)] if start_pattern else None
+    # In hardened mode an entry header may only start this far before its date
+    window = field_window()
+    length = len(text)
+
+    matches = []
+    pos = 0
+    for date_match in _DATE_RANGE_START.finditer(text):
+        date_start = date_match.start()
+        if date_start <= pos:
+            continue
+        if budget.expired():
+            break
+
+        break_index = bisect_left(breaks, date_start)
+        run_start = max(pos, breaks[break_index - 1] + 1 if break_index else 0)
+        endpos = length
+        if window is not None:
+            run_start = max(run_start, date_start - window)
+            endpos = min(length, date_start + window)
+
+        if starts is None:
+            candidates = [run_start]
+        else:
+            candidates = starts[bisect_left(starts, run_start):bisect_left(starts, date_start)]
+
+        for candidate in candidates:
+            match = pattern.match(text, candidate, endpos)
+            if match:
+                matches.append(match)
+                pos = match.end()
+                break
+
+    return matches
+
+def extract_skills(resume_text: str, sections: Optional[ResumeSections] = None) -> List[str]:
     """
     Extract skills from a resume text.
     
     Args:
         resume_text: The text content of the resume
+        sections: Segmentation of resume_text, to share one pass between extractors
         
     Returns:
         List of extracted skills
@@ -17,13 +121,11 @@ def extract_skills(resume_text: str) -> List[str]:
     # In a real implementation, this would use more sophisticated NLP techniques
     # For this example, we'll use a simplified approach
     
-    # Create a simple pattern to match common skill sections
-    skill_section_pattern = re.compile(
-        r"(?:technical skills|skills|technologies|tools|languages|frameworks|proficiencies)[\s\n:]+(.+?)(?:\n\n|\Z)",
-        re.IGNORECASE | re.DOTALL
-    )
+    if sections is None:
+        sections = segment_resume(resume_text)
     
-    skill_matches = skill_section_pattern.findall(resume_text)
+    # Match common skill sections
+    skill_matches = sections.bodies("skills")
     
     if skill_matches:
         # Extract skills from the matched sections
@@ -32,33 +134,22 @@ def extract_skills(resume_text: str) -> List[str]:
         # Split by common separators like commas, bullets, etc.
         skills = re.split(r'[,•|/\n]+', skills_text)
         
-        # Clean up and normalize skills
-        skills = [skill.strip() for skill in skills if skill.strip()]
+        # Clean up and normalize skills, correcting misspelled known skills
+        skills = [skill_registry.correct_spelling(limit_field(skill.strip())) for skill in skills if skill.strip()]
         
         return skills
     
     # Fallback method: look for common programming languages, tools, etc.
-    common_skills = [
-        "Python", "Java", "JavaScript", "C++", "C#", "Ruby", "SQL", "HTML", "CSS",
-        "React", "Angular", "Vue", "Node.js", "Django", "Flask", "Spring",
-        "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Git", "Jenkins",
-        "TensorFlow", "PyTorch", "Scikit-learn", "Pandas", "NumPy",
-        "Machine Learning", "Deep Learning", "Natural Language Processing", "Computer Vision"
-    ]
-    
-    found_skills = []
-    for skill in common_skills:
-        if re.search(r'\b' + re.escape(skill) + r'\b', resume_text, re.IGNORECASE):
-            found_skills.append(skill)
-    
-    return found_skills
-
-def extract_experience(resume_text: str) -> List[Dict[str, Any]]:
+    found = set(skill_registry.find_ids(sections.text))
+    return [skill for skill, skill_id in zip(COMMON_SKILLS, COMMON_SKILL_IDS) if skill_id in found]
+
+def extract_experience(resume_text: str, sections: Optional[ResumeSections] = None) -> List[Dict[str, Any]]:
     """
     Extract work experience from a resume text.
     
     Args:
         resume_text: The text content of the resume
+        sections: Segmentation of resume_text, to share one pass between extractors
         
     Returns:
         List of dictionaries containing job details
@@ -66,43 +157,35 @@ def extract_experience(resume_text: str) -> List[Dict[str, Any]]:
     # In a real implementation, this would use more sophisticated NLP techniques
     # For this example, we'll use a simplified approach
     
-    # Find the experience section
-    experience_section_pattern = re.compile(
-        r"(?:work experience|experience|employment|professional experience)[\s\n:]+(.+?)(?:\n\n|\Z)",
-        re.IGNORECASE | re.DOTALL
-    )
+    if sections is None:
+        sections = segment_resume(resume_text)
     
-    experience_matches = experience_section_pattern.findall(resume_text)
+    # Find the experience section
+    experiences_text = sections.first("experience")
     
-    if not experience_matches:
+    if experiences_text is None:
         return []
     
-    experiences_text = experience_matches[0]
-    
-    # Look for job entries
-    job_pattern = re.compile(
-        r"(?P<company>[\w\s&.,]+?),?\s+(?P<title>[\w\s&.,]+?),?\s+(?P<dates>\d{1,2}/\d{4}\s*[-–]\s*(?:\d{1,2}/\d{4}|Present))",
-        re.IGNORECASE
-    )
+    # Look for job entries, collecting every header in one pass
+    matches = _find_dated_entries(JOB_PATTERN, experiences_text, sections.budget)
     
     jobs = []
-    for match in job_pattern.finditer(experiences_text):
+    for index, match in enumerate(matches):
         company = match.group("company").strip()
         title = match.group("title").strip()
         dates = match.group("dates").strip()
         
-        # Get the description following this match until the next job or the end
+        # The description runs from this header to the next one or the end
         start_pos = match.end()
-        next_match = job_pattern.search(experiences_text, start_pos)
-        end_pos = next_match.start() if next_match else len(experiences_text)
+        end_pos = matches[index + 1].start() if index + 1 < len(matches) else len(experiences_text)
         
         description = experiences_text[start_pos:end_pos].strip()
         
         jobs.append({
-            "company": company,
-            "title": title,
-            "dates": dates,
-            "description": description
+            "company": limit_field(company),
+            "title": limit_field(title),
+            "dates": limit_field(dates),
+            "description": limit_field(description)
         })
     
     # If regular pattern matching fails, try a simpler approach
@@ -112,12 +195,14 @@ def extract_experience(resume_text: str) -> List[Dict[str, Any]]:
         current_job = {}
         
         for line in lines:
-            line = line.strip()
+            if sections.budget.expired():
+                break
+            line = limit_field(line.strip())
             if not line:
                 continue
                 
             # If we see something that looks like a date range, this is likely a new job
-            if re.search(r'\d{4}\s*[-–]\s*(?:\d{4}|Present)', line, re.IGNORECASE):
+            if _LINE_DATE_RANGE.search(line):
                 if current_job and "title" in current_job:
                     jobs.append(current_job)
                 current_job = {"dates": line}
@@ -128,72 +213,60 @@ def extract_experience(resume_text: str) -> List[Dict[str, Any]]:
             elif "description" not in current_job:
                 current_job["description"] = line
             else:
-                current_job["description"] += " " + line
+                current_job["description"] = limit_field(current_job["description"] + " " + line)
         
         if current_job and "title" in current_job:
             jobs.append(current_job)
     
     return jobs
 
-def extract_education(resume_text: str) -> List[Dict[str, Any]]:
+def extract_education(resume_text: str, sections: Optional[ResumeSections] = None) -> List[Dict[str, Any]]:
     """
     Extract education details from a resume text.
     
     Args:
         resume_text: The text content of the resume
+        sections: Segmentation of resume_text, to share one pass between extractors
         
     Returns:
         List of dictionaries containing education details
     """
-    # Find the education section
-    education_section_pattern = re.compile(
-        r"(?:education|educational background|academic background)[\s\n:]+(.+?)(?:\n\n|\Z)",
-        re.IGNORECASE | re.DOTALL
-    )
+    if sections is None:
+        sections = segment_resume(resume_text)
     
-    education_matches = education_section_pattern.findall(resume_text)
+    # Find the education section
+    education_text = sections.first("education")
     
-    if not education_matches:
+    if education_text is None:
         return []
     
-    education_text = education_matches[0]
-    
     # Look for degree entries
-    degree_pattern = re.compile(
-        r"(?P<degree>(?:Bachelor|Master|PhD|Doctor|B\.S\.|M\.S\.|Ph\.D\.|B\.A\.|M\.A\.|M\.B\.A\.|B\.Tech|M\.Tech)[\w\s.,]+?),?\s+(?P<institution>[\w\s&.,]+?),?\s+(?P<dates>\d{1,2}/\d{4}\s*[-–]\s*(?:\d{1,2}/\d{4}|Present))",
-        re.IGNORECASE
-    )
-    
     education = []
-    for match in degree_pattern.finditer(education_text):
+    for match in _find_dated_entries(DEGREE_PATTERN, education_text, sections.budget, _DEGREE_START):
         degree = match.group("degree").strip()
         institution = match.group("institution").strip()
         dates = match.group("dates").strip()
         
         education.append({
-            "degree": degree,
-            "institution": institution,
-            "dates": dates
+            "degree": limit_field(degree),
+            "institution": limit_field(institution),
+            "dates": limit_field(dates)
         })
     
     # If regular pattern matching fails, try a simpler approach
     if not education:
-        # Look for common degree keywords
-        degree_keywords = [
-            "Bachelor", "Master", "PhD", "Doctor", "B.S.", "M.S.", "Ph.D.",
-            "B.A.", "M.A.", "M.B.A.", "B.Tech", "M.Tech"
-        ]
-        
         lines = education_text.split('\n')
         current_edu = {}
         
         for line in lines:
-            line = line.strip()
+            if sections.budget.expired():
+                break
+            line = limit_field(line.strip())
             if not line:
                 continue
                 
             # Check if this line contains a degree keyword
-            has_degree = any(keyword in line for keyword in degree_keywords)
+            has_degree = any(keyword in line for keyword in DEGREE_KEYWORDS)
             
             if has_degree:
                 if current_edu and "degree" in current_edu:
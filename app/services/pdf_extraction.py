@@ -0,0 +1,156 @@
+"""
+Page-level PDF text extraction.
+
+Pages can be extracted serially inside one worker, or split into page ranges
+that are fanned out across the isolated extraction workers and joined once.
+Both paths support stopping early after a page limit, or once the skills,
+experience and education headers used by the parser have all been seen.
+"""
+from concurrent.futures import Executor
+from typing import Any, Callable, List, Optional, Tuple
+
+from app.services.segmenter import SECTION_HEADER_PATTERNS, find_section_headers
+from app.services.uploads import MappedStream, SpooledUpload
+
+class SectionTracker:
+    """
+    Tracks which resume section headers have been seen across pages.
+    """
+
+    def __init__(self):
+        self.seen = set()
+
+    def feed(self, page_text: str) -> bool:
+        """Record the headers on a page; return True once all have been seen."""
+        self.seen.update(find_section_headers(page_text))
+        return self.complete
+
+    @property
+    def complete(self) -> bool:
+        return len(self.seen) == len(SECTION_HEADER_PATTERNS)
+
+def read_pdf_text(content, max_pages: Optional[int] = None, stop_when_sections_found: bool = False) -> str:
+    """
+    Extract text from a PDF buffer page by page.
+
+    Args:
+        content: Bytes-like PDF buffer
+        max_pages: Stop after this many pages (None for no limit)
+        stop_when_sections_found: Stop after the page on which the last of the
+            skills, experience and education headers appears
+
+    Returns:
+        Text of the extracted pages, concatenated
+    """
+    from pypdf import PdfReader
+    with MappedStream(content) as stream:
+        reader = PdfReader(stream)
+        tracker = SectionTracker() if stop_when_sections_found else None
+        pages = []
+        for index, page in enumerate(reader.pages):
+            if max_pages and index >= max_pages:
+                break
+            page_text = page.extract_text()
+            pages.append(page_text)
+            if tracker is not None and tracker.feed(page_text):
+                break
+        return "".join(pages)
+
+def extract_page_range(content, start: int, stop: int) -> Tuple[List[str], int]:
+    """
+    Extract the text of pages [start, stop) from a PDF.
+
+    Args:
+        content: Bytes-like PDF buffer, or a SpooledUpload to open
+        start: Index of the first page to extract
+        stop: Index after the last page to extract
+
+    Returns:
+        Text of each page in the range, and the total page count of the document
+    """
+    from pypdf import PdfReader
+
+    if isinstance(content, SpooledUpload):
+        with content.open_view() as buffer:
+            return extract_page_range(buffer, start, stop)
+
+    with MappedStream(content) as stream:
+        reader = PdfReader(stream)
+        total_pages = len(reader.pages)
+        return [reader.pages[i].extract_text() for i in range(start, min(stop, total_pages))], total_pages
+
+def extract_pdf_parallel(
+    run: Callable[..., Any],
+    dispatcher: Executor,
+    content,
+    pages_per_task: int = 8,
+    max_parallel: int = 2,
+    max_pages: Optional[int] = None,
+    stop_when_sections_found: bool = False,
+    min_parallel_pages: int = 0,
+    deadline: Optional[float] = None
+) -> str:
+    """
+    Extract a PDF by fanning page ranges out across workers.
+
+    The first range is extracted on its own to learn the page count. With
+    early exit enabled the rest are submitted in waves of max_parallel ranges,
+    so later waves can be skipped; otherwise they are all submitted at once
+    and the worker pool bounds concurrency. Once a range fails or extraction
+    can stop, the ranges not started yet are cancelled.
+
+    Args:
+        run: Callable that executes a job in a worker, e.g. IsolatedWorkerPool.run
+        dispatcher: Thread pool used to wait on concurrent run() calls
+        content: PDF bytes or SpooledUpload (must be picklable for process workers)
+        pages_per_task: Number of pages extracted per job
+        max_parallel: Maximum number of jobs in flight
+        max_pages: Stop after this many pages (None for no limit)
+        stop_when_sections_found: Stop after the page on which the last resume
+            section header appears
+        min_parallel_pages: Documents shorter than this are finished in a
+            single follow-up job instead of being split
+        deadline: time.monotonic() value by which the whole document must be
+            extracted; passed to every run() so the ranges share one budget
+
+    Returns:
+        Text of the extracted pages, joined once in document order
+    """
+    first_pages, total_pages = run(extract_page_range, content, 0, pages_per_task, deadline=deadline)
+    limit = min(total_pages, max_pages) if max_pages else total_pages
+    tracker = SectionTracker() if stop_when_sections_found else None
+    pages: List[str] = []
+
+    def accept(batch: List[str]) -> bool:
+        """Append pages in order; return True once extraction can stop."""
+        for page_text in batch:
+            if len(pages) >= limit:
+                return True
+            pages.append(page_text)
+            if tracker is not None and tracker.feed(page_text):
+                return True
+        return len(pages) >= limit
+
+    done = accept(first_pages)
+    if limit < min_parallel_pages:
+        ranges = [(pages_per_task, limit)] if limit > pages_per_task else []
+    else:
+        ranges = [(start, min(start + pages_per_task, limit)) for start in range(pages_per_task, limit, pages_per_task)]
+    wave_size = max_parallel if stop_when_sections_found else max(len(ranges), 1)
+
+    while ranges and not done:
+        wave, ranges = ranges[:wave_size], ranges[wave_size:]
+        futures = [
+            dispatcher.submit(run, extract_page_range, content, start, stop, deadline=deadline)
+            for start, stop in wave
+        ]
+        try:
+            for future in futures:
+                done = accept(future.result()[0])
+                if done:
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+
+    return "".join(pages)
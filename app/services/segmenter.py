@@ -0,0 +1,151 @@
+"""
+Resume section segmenter.
+
+Splits a resume into typed sections (skills, experience, education) in a
+single pass over the text and records their offsets, so the extractors in
+app.services.parser can share one segmentation instead of each rescanning
+the whole resume with its own DOTALL pattern.
+"""
+from bisect import bisect_left
+from typing import Dict, List, NamedTuple, Optional
+import re
+
+from app.services.parse_limits import ParseBudget, limit_input
+
+# Section headers recognised by the resume extractors
+SKILL_SECTION_HEADERS = [
+    "technical skills", "skills", "technologies", "tools", "languages", "frameworks", "proficiencies"
+]
+EXPERIENCE_SECTION_HEADERS = [
+    "work experience", "experience", "employment", "professional experience"
+]
+EDUCATION_SECTION_HEADERS = [
+    "education", "educational background", "academic background"
+]
+
+SECTION_HEADERS = {
+    "skills": SKILL_SECTION_HEADERS,
+    "experience": EXPERIENCE_SECTION_HEADERS,
+    "education": EDUCATION_SECTION_HEADERS,
+}
+
+def _header_alternation(headers: List[str]) -> str:
+    return r"(?:" + "|".join(re.escape(h) for h in headers) + r")"
+
+# Header-only patterns, used to detect which sections a text contains
+SECTION_HEADER_PATTERNS = {
+    kind: re.compile(_header_alternation(headers) + r"[\s:]", re.IGNORECASE)
+    for kind, headers in SECTION_HEADERS.items()
+}
+
+# Every header of every kind, each in its own named group
+_HEADER_PATTERN = re.compile(
+    r"(?:"
+    + "|".join(f"(?P<{kind}>{_header_alternation(headers)})" for kind, headers in SECTION_HEADERS.items())
+    + r")(?=[\s:])",
+    re.IGNORECASE
+)
+_SEPARATOR_PATTERN = re.compile(r"[\s:]*")
+_BREAK_PATTERN = re.compile(r"(?=\n\n)")
+
+class Section(NamedTuple):
+    """
+    A section of a resume: its header and the body that follows it.
+
+    The body runs from the first character after the header and its
+    separators up to the next blank line, or the end of the text.
+    """
+    kind: str
+    header_start: int
+    start: int
+    end: int
+
+class ResumeSections:
+    """
+    Typed sections of one resume, in document order, along with the parse
+    budget that the extractors consuming them share.
+    """
+
+    def __init__(self, text: str, sections: Dict[str, List[Section]], budget: Optional[ParseBudget] = None):
+        self.text = text
+        self.sections = sections
+        self.budget = budget or ParseBudget()
+
+    def get(self, kind: str) -> List[Section]:
+        """Return the sections of one kind."""
+        return self.sections.get(kind, [])
+
+    def bodies(self, kind: str) -> List[str]:
+        """Return the body text of every section of one kind."""
+        return [self.text[section.start:section.end] for section in self.get(kind)]
+
+    def first(self, kind: str) -> Optional[str]:
+        """Return the body text of the first section of one kind, if any."""
+        sections = self.get(kind)
+        return self.text[sections[0].start:sections[0].end] if sections else None
+
+    def __contains__(self, kind: str) -> bool:
+        return bool(self.get(kind))
+
+def segment_resume(text: str) -> ResumeSections:
+    """
+    Split a resume into typed sections in one pass.
+
+    Headers are matched case-insensitively anywhere in the text. Sections of
+    the same kind never overlap: a header inside the body of an earlier
+    section of its kind is treated as body text. Sections of different kinds
+    may overlap.
+
+    In hardened parsing mode the text is truncated to the maximum parsed
+    length first, and the returned sections carry the document's time budget.
+
+    Args:
+        text: Resume text
+
+    Returns:
+        ResumeSections with the offsets of every skills, experience and
+        education section
+    """
+    budget = ParseBudget.for_document()
+    text = limit_input(text)
+    breaks = [m.start() for m in _BREAK_PATTERN.finditer(text)]
+    length = len(text)
+    sections: Dict[str, List[Section]] = {kind: [] for kind in SECTION_HEADERS}
+    # Where the last section of each kind ended, including its blank line
+    consumed = dict.fromkeys(SECTION_HEADERS, 0)
+
+    for header in _HEADER_PATTERN.finditer(text):
+        kind = header.lastgroup
+        if header.start() < consumed[kind]:
+            continue
+
+        start = _SEPARATOR_PATTERN.match(text, header.end()).end()
+        if start == length:
+            # Only separators follow the header; the body is its last character
+            if start - header.end() < 2:
+                continue
+            start -= 1
+
+        # The body is at least one character long and stops at the next blank line
+        index = bisect_left(breaks, start + 1)
+        if index < len(breaks):
+            end = breaks[index]
+            consumed[kind] = end + 2
+        else:
+            end = consumed[kind] = length
+
+        sections[kind].append(Section(kind, header.start(), start, end))
+
+    return ResumeSections(text, sections, budget)
+
+def find_section_headers(text: str) -> List[str]:
+    """
+    List which of the skills, experience and education headers appear in a text.
+
+    Args:
+        text: Resume text, or a fragment of it such as one PDF page
+
+    Returns:
+        Names of the sections whose headers were found
+    """
+    return [name for name, pattern in SECTION_HEADER_PATTERNS.items() if pattern.search(text)]
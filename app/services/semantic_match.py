@@ -0,0 +1,276 @@
+"""
+Semantic matching of a resume against a job description.
+
+Keyword matching only credits a requirement when the resume names the same
+skill. Here both documents are cut into short chunks (resume lines and skill
+list items, labeled with their section, and the job description's
+requirement lines), embedded with the vector store's embedding backend in one
+call, and compared in a single matrix product of the L2-normalized vectors.
+Each requirement is paired with its most similar resume chunk, and the
+requirement counts as covered when that similarity reaches
+SEMANTIC_MATCH_THRESHOLD.
+
+Chunks come from user documents, so they do not go through the vector
+store's shared, persisted embedding cache: they would evict its skill
+vectors and be written to disk. They use a separate in-memory cache of
+SEMANTIC_MATCH_CACHE_MAX_ENTRIES entries instead, so skill lines that recur
+across resumes and job descriptions are still embedded once. How semantic
+the similarities are depends on the backend: the default hashing backend
+compares words and character trigrams, while "chroma" uses a sentence
+embedding model. Results say which kind of similarity they report, and
+SEMANTIC_MATCH_ENABLED is only on by default with a sentence embedding
+backend.
+"""
+from typing import Any, Dict, List, NamedTuple, Optional
+import re
+import threading
+
+import numpy as np
+
+from app.config import (
+    SEMANTIC_MATCH_THRESHOLD, SEMANTIC_CHUNK_MAX_WORDS, SEMANTIC_MATCH_TOP_PAIRS, SEMANTIC_MATCH_CACHE_MAX_ENTRIES
+)
+from app.services.embedding_cache import CachedEmbeddingFunction, EmbeddingCache
+from app.services.embeddings import EmbeddingBackend, embed_texts, get_embedding_backend
+from app.services.parse_limits import limit_input
+from app.services.segmenter import SECTION_HEADERS, segment_resume
+
+LINE_PATTERN = re.compile(r"[^\n]+")
+BULLET_PREFIX_PATTERN = re.compile(r"^[\s•\-*–·>]+")
+SENTENCE_BREAK_PATTERN = re.compile(r"(?<=[.;!?])\s+")
+LIST_SEPARATOR_PATTERN = re.compile(r"\s*[,;|/]\s*")
+WORD_PATTERN = re.compile(r"\w")
+
+# Lines that are only a section header carry no content to match
+_HEADER_LINES = {header for headers in SECTION_HEADERS.values() for header in headers}
+_JOB_HEADER_LINES = _HEADER_LINES | {
+    "requirements", "qualifications", "preferred qualifications", "responsibilities", "nice to have",
+    "about the role", "about you", "what you'll do", "what you'll need", "what you will need", "benefits"
+}
+
+# Backends whose vectors encode the text's surface form, not its meaning
+LEXICAL_BACKENDS = {"hashing"}
+
+class TextChunk(NamedTuple):
+    """A chunk of a document and the section it comes from."""
+    text: str
+    section: str
+
+def _clean_line(line: str) -> str:
+    return " ".join(BULLET_PREFIX_PATTERN.sub("", line).split()).strip(" :")
+
+def _split_words(text: str, max_words: int) -> List[str]:
+    """Split a text at sentence breaks, and then into windows of at most max_words words."""
+    pieces = []
+    for sentence in SENTENCE_BREAK_PATTERN.split(text):
+        words = sentence.split()
+        for start in range(0, len(words), max_words):
+            pieces.append(" ".join(words[start:start + max_words]))
+    return [piece for piece in pieces if WORD_PATTERN.search(piece)]
+
+def chunk_resume(text: str, max_words: int = SEMANTIC_CHUNK_MAX_WORDS) -> List[TextChunk]:
+    """
+    Cut a resume into chunks to embed.
+
+    Every non-empty line is a chunk, labeled with the section it falls in
+    ("skills", "experience", "education" or "other"); long lines are split
+    into sentences and windows of at most max_words words. Lines of a skills
+    section are split into their list items, so each skill is compared on
+    its own.
+
+    Args:
+        text: Resume text
+        max_words: Maximum words per chunk
+
+    Returns:
+        Chunks in document order, without duplicates
+    """
+    sections = segment_resume(text)
+    text = sections.text
+    spans = sorted(
+        (section.header_start, section.start, section.end, kind)
+        for kind in SECTION_HEADERS for section in sections.get(kind)
+    )
+
+    chunks: List[TextChunk] = []
+    seen = set()
+    for match in LINE_PATTERN.finditer(text):
+        line_start, line_end = match.span()
+        # The last section whose header starts at or before the line, if it
+        # still runs there; a header on the line itself is left out
+        section = "other"
+        for header_start, start, end, kind in spans:
+            if header_start > line_start:
+                break
+            if line_start < end:
+                section = kind
+                line_start = max(line_start, start)
+        line = _clean_line(text[line_start:line_end])
+        if not line or line.lower() in _HEADER_LINES:
+            continue
+        if section == "skills":
+            pieces = [item for item in LIST_SEPARATOR_PATTERN.split(line) if WORD_PATTERN.search(item)]
+        else:
+            pieces = _split_words(line, max_words)
+        for piece in pieces:
+            if piece.lower() not in seen:
+                seen.add(piece.lower())
+                chunks.append(TextChunk(piece, section))
+    return chunks
+
+def chunk_job_description(text: str, max_words: int = SEMANTIC_CHUNK_MAX_WORDS) -> List[str]:
+    """
+    Cut a job description into requirement chunks to embed.
+
+    Every non-empty line other than a heading is a requirement; long lines
+    are split into sentences and windows of at most max_words words.
+
+    Args:
+        text: Job description text
+        max_words: Maximum words per chunk
+
+    Returns:
+        Requirement chunks in document order, without duplicates
+    """
+    chunks = []
+    seen = set()
+    for match in LINE_PATTERN.finditer(limit_input(text)):
+        line = _clean_line(match.group())
+        # Headings ("Requirements:", "What you'll do") are not requirements
+        if not line or match.group().rstrip().endswith(":") or line.lower() in _JOB_HEADER_LINES:
+            continue
+        for piece in _split_words(line, max_words):
+            if piece.lower() not in seen:
+                seen.add(piece.lower())
+                chunks.append(piece)
+    return chunks
+
+_chunk_backend: Optional[EmbeddingBackend] = None
+_chunk_backend_lock = threading.Lock()
+
+def get_chunk_embedding_backend() -> EmbeddingBackend:
+    """
+    Get the vector store's embedding backend with its shared cache replaced
+    by a memory-only cache for request chunks, creating it on first use.
+    """
+    global _chunk_backend
+    if _chunk_backend is None:
+        with _chunk_backend_lock:
+            if _chunk_backend is None:
+                backend = get_embedding_backend()
+                function = backend.function
+                if isinstance(function, CachedEmbeddingFunction):
+                    function = function.function
+                if SEMANTIC_MATCH_CACHE_MAX_ENTRIES > 0:
+                    function = CachedEmbeddingFunction(function, EmbeddingCache(backend.model_id, SEMANTIC_MATCH_CACHE_MAX_ENTRIES))
+                _chunk_backend = backend._replace(function=function)
+    return _chunk_backend
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+def semantic_match(
+    resume_text: str,
+    job_description: str,
+    threshold: float = SEMANTIC_MATCH_THRESHOLD,
+    top_pairs: int = SEMANTIC_MATCH_TOP_PAIRS,
+    backend: Optional[EmbeddingBackend] = None
+) -> Dict[str, Any]:
+    """
+    Match the chunks of a resume against the requirements of a job description
+    by embedding similarity.
+
+    Args:
+        resume_text: Resume text
+        job_description: Job description text
+        threshold: Cosine similarity at which a requirement counts as covered
+        top_pairs: Number of best (requirement, resume chunk) pairs to report
+        backend: Embedding backend; defaults to the vector store's, with
+            the in-memory chunk cache
+
+    Returns:
+        Dictionary with the best resume chunk for every requirement, the
+        best-matching pairs overall, the requirements below the threshold,
+        the percentage of requirements covered, and under "similarity"
+        whether the backend compares meaning ("semantic") or wording
+        ("lexical")
+    """
+    resume_chunks = chunk_resume(resume_text)
+    requirements = chunk_job_description(job_description)
+    backend = backend or get_chunk_embedding_backend()
+    result: Dict[str, Any] = {
+        "similarity": "lexical" if backend.name in LEXICAL_BACKENDS else "semantic",
+        "requirements": [],
+        "top_pairs": [],
+        "uncovered_requirements": [],
+        "match_percentage": 0.0,
+        "average_similarity": 0.0,
+        "threshold": threshold,
+    }
+    if not resume_chunks or not requirements:
+        return result
+
+    # One embedding call for both documents; repeated chunks hit the cache
+    vectors = _normalize(embed_texts(requirements + [chunk.text for chunk in resume_chunks], backend))
+    similarities = vectors[:len(requirements)] @ vectors[len(requirements):].T
+
+    best_rows = similarities.argmax(axis=1)
+    best = similarities[np.arange(len(requirements)), best_rows]
+    for requirement, row, similarity in zip(requirements, best_rows.tolist(), best.tolist()):
+        chunk = resume_chunks[row]
+        result["requirements"].append({
+            "requirement": requirement,
+            "resume_text": chunk.text,
+            "section": chunk.section,
+            "similarity": round(similarity, 4),
+            "covered": similarity >= threshold,
+        })
+    result["uncovered_requirements"] = [match["requirement"] for match in result["requirements"] if not match["covered"]]
+
+    flat = similarities.ravel()
+    k = min(top_pairs, flat.size)
+    if k > 0:
+        top = np.argpartition(-flat, k - 1)[:k]
+        top = top[np.argsort(-flat[top], kind="stable")]
+        for index in top.tolist():
+            requirement_row, chunk_row = divmod(index, len(resume_chunks))
+            chunk = resume_chunks[chunk_row]
+            result["top_pairs"].append({
+                "requirement": requirements[requirement_row],
+                "resume_text": chunk.text,
+                "section": chunk.section,
+                "similarity": round(float(flat[index]), 4),
+            })
+
+    result["match_percentage"] = round(float(np.mean(best >= threshold)) * 100, 2)
+    result["average_similarity"] = round(float(np.mean(np.clip(best, 0.0, None))), 4)
+    return result
+
+def summarize_semantic_match(match: Dict[str, Any], limit: int = 5) -> Dict[str, Any]:
+    """
+    Reduce a semantic_match() result to what fits in an agent observation.
+
+    Args:
+        match: Result of semantic_match()
+        limit: Maximum number of matched and of missing requirements listed
+
+    Returns:
+        Dictionary with the kind of similarity, the match percentage, the
+        best-covered requirements with the resume text covering them, and the
+        uncovered requirements
+    """
+    covered = sorted(
+        (requirement for requirement in match["requirements"] if requirement["covered"]),
+        key=lambda requirement: -requirement["similarity"]
+    )
+    return {
+        "similarity": match["similarity"],
+        "match_percentage": match["match_percentage"],
+        "matched_requirements": [
+            {"requirement": requirement["requirement"], "resume_text": requirement["resume_text"], "similarity": requirement["similarity"]}
+            for requirement in covered[:limit]
+        ],
+        "missing_requirements": match["uncovered_requirements"][:limit],
+        "requirements": len(match["requirements"]),
+    }
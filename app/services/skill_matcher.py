@@ -0,0 +1,150 @@
+"""
+Multi-keyword skill matcher.
+
+Skill names from every part of the app are registered with one shared
+Aho-Corasick automaton, which finds all of them in a single pass over a
+text. Matching is case-insensitive, and a match must not continue a word: a
+term that starts (or ends) with a letter, digit or underscore cannot be
+preceded (or followed) by one. Terms that start or end with a symbol, such
+as "C++" or ".NET", only need the boundary on their word-character side.
+"""
+import threading
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+def _lower_preserving_offsets(text: str) -> str:
+    """Lowercase a text without changing its length, so offsets stay valid."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. "İ") lowercase to more than one character
+    return "".join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+class _Automaton:
+    """Compiled goto/fail/output tables for a fixed set of terms."""
+
+    def __init__(self, terms: Dict[str, str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        # (term length, payload, needs start boundary, needs end boundary)
+        self.outputs: List[List[Tuple[int, str, bool, bool]]] = [[]]
+
+        for key, payload in terms.items():
+            state = 0
+            for ch in key:
+                next_state = self.goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][ch] = next_state
+                    self.goto.append({})
+                    self.outputs.append([])
+                state = next_state
+            self.outputs[state].append((len(key), payload, _is_word_char(key[0]), _is_word_char(key[-1])))
+
+        # Breadth-first pass to link each state to its longest proper suffix
+        self.fail = [0] * len(self.goto)
+        pending = deque(self.goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for ch, next_state in self.goto[state].items():
+                pending.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(ch, 0)
+                self.outputs[next_state].extend(self.outputs[self.fail[next_state]])
+
+class SkillMatcher:
+    """
+    Thread-safe, case-insensitive matcher for a growing vocabulary of terms.
+
+    Terms can be added at any time; the automaton is rebuilt lazily on the
+    next search after the vocabulary changes.
+    """
+
+    def __init__(self, terms: Optional[Iterable[str]] = None):
+        self._terms: Dict[str, str] = {}
+        self._automaton: Optional[_Automaton] = None
+        self._lock = threading.Lock()
+        if terms:
+            self.add_many(terms)
+
+    def add(self, term: str):
+        """Register a term. The first spelling registered is the one reported."""
+        self.add_many([term])
+
+    def add_many(self, terms: Iterable[str]):
+        """Register several terms."""
+        with self._lock:
+            for term in terms:
+                term = term.strip()
+                key = _lower_preserving_offsets(term)
+                if key and key not in self._terms:
+                    self._terms[key] = term
+                    self._automaton = None
+
+    def _get_automaton(self) -> _Automaton:
+        automaton = self._automaton
+        if automaton is None:
+            with self._lock:
+                if self._automaton is None:
+                    self._automaton = _Automaton(self._terms)
+                automaton = self._automaton
+        return automaton
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """
+        Find every occurrence of every registered term.
+
+        Overlapping and nested occurrences are all reported.
+
+        Args:
+            text: Text to search
+
+        Yields:
+            (start, end, term) for each match, ordered by end offset
+        """
+        automaton = self._get_automaton()
+        goto, fail, outputs = automaton.goto, automaton.fail, automaton.outputs
+        length = len(text)
+        state = 0
+
+        for index, ch in enumerate(_lower_preserving_offsets(text)):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not outputs[state]:
+                continue
+
+            end = index + 1
+            ends_word = end < length and _is_word_char(text[end])
+            for term_length, term, check_start, check_end in outputs[state]:
+                start = end - term_length
+                if check_end and ends_word:
+                    continue
+                if check_start and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                yield start, end, term
+
+    def find(self, text: str) -> List[str]:
+        """
+        Find which registered terms occur in a text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Registered spelling of each term found, in order of first occurrence
+        """
+        found: Dict[str, None] = {}
+        for _, _, term in self.finditer(text):
+            found.setdefault(term, None)
+        return list(found)
+
+    def __contains__(self, term: str) -> bool:
+        return _lower_preserving_offsets(term.strip()) in self._terms
+
+    def __len__(self) -> int:
+        return len(self._terms)
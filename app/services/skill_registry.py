@@ -0,0 +1,342 @@
+"""
+Canonical skill registry.
+
+Every skill name the app knows about (the parser's and analyzer's keyword
+lists, the skills knowledge base and the career path skills) is registered
+here and mapped to one small integer ID, together with its aliases ("k8s",
+"JS", "Postgres", ...). Names and aliases are compiled into one shared
+Aho-Corasick trie, so a text is scanned once and yields skill IDs, and
+comparisons between skills elsewhere are integer comparisons. Single skill
+names that are not registered are also looked up in a typo-tolerant index
+(see app.services.fuzzy_skills), so "Pytorch", "Tensor Flow" or
+"Scikit learn" resolve to the registered skill.
+
+Short names that are also ordinary words or abbreviations ("go", "R&D",
+"ml") are only found in text written as registered, and the shortest of them
+only as an item of a list ("Python, Go, SQL").
+
+Names come from two places: modules register their fixed vocabularies at
+import time, and a loaded skills KB registers its names as a layer, which is
+replaced as a whole when the KB is reloaded, so names of a removed KB stop
+matching.
+
+IDs are assigned in registration order and are only meaningful inside the
+current process; anything that crosses a process boundary carries canonical
+names instead. A name dropped with its layer keeps its ID for when it is
+registered again.
+"""
+import threading
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple, Union
+
+from app.config import FUZZY_SKILL_MAX_DISTANCE, FUZZY_SKILL_CACHE_MAX_ENTRIES
+from app.services.fuzzy_skills import FuzzySkillIndex
+from app.services.skill_matcher import SkillMatcher
+from app.utils.helpers import LRUCache
+
+# Alternative spellings and abbreviations of skills, by canonical name
+SKILL_ALIASES: Dict[str, List[str]] = {
+    "Kubernetes": ["k8s"],
+    "JavaScript": ["JS", "ECMAScript"],
+    "PostgreSQL": ["Postgres", "psql"],
+    "MongoDB": ["Mongo"],
+    "Elasticsearch": ["Elastic Search"],
+    "Go": ["Golang"],
+    "Node.js": ["NodeJS", "Node JS"],
+    "React": ["ReactJS", "React.js"],
+    "Vue": ["VueJS", "Vue.js"],
+    "Angular": ["AngularJS"],
+    "C#": ["C Sharp", "CSharp"],
+    "C++": ["cpp"],
+    "Scikit-learn": ["sklearn", "scikit learn"],
+    "Hugging Face": ["HuggingFace"],
+    "Natural Language Processing": ["NLP"],
+    "Machine Learning": ["ML"],
+    "AWS": ["Amazon Web Services"],
+    "GCP": ["Google Cloud Platform", "Google Cloud"],
+    "Azure": ["Microsoft Azure"],
+    "CI/CD": ["CICD", "Continuous Integration"],
+}
+
+# Ordinary resume words that are a few edits away from a skill name; they are
+# never corrected to a skill ("Mentoring" is not a misspelling of Monitoring)
+COMMON_WORDS = frozenset({
+    "mentoring", "monitoring", "marketing", "training", "teaching", "coaching", "consulting",
+    "leadership", "management", "planning", "research", "reporting", "recruiting", "budgeting",
+    "scheduling", "testing", "writing", "speaking", "presenting", "negotiation", "networking",
+    "operations", "analysis", "analytics", "security", "support", "design", "strategy",
+    "communication", "collaboration", "documentation", "customer service", "sales", "finance",
+})
+
+# Skill names and aliases that are also ordinary words or abbreviations; in
+# text they only match written exactly like this ("Spring", not "spring")
+CASE_SENSITIVE_TERMS = frozenset({
+    "Go", "R", "ML", "Swift", "Spring", "Storm", "Pig", "Hive", "Lambda", "Ruby", "Julia", "Rust",
+})
+
+# Case-sensitive terms that are still too common ("Go to market", "R&D") to
+# count unless they stand alone as a list item: between line breaks or list
+# separators such as ",", ";", "/", "|" or parentheses
+LIST_ITEM_TERMS = frozenset({"Go", "R"})
+
+_CASE_SENSITIVE_SPELLINGS = {term.lower(): term for term in CASE_SENSITIVE_TERMS}
+_ITEM_START = frozenset(",;:/|(\n\r•·*-–")
+_ITEM_END = frozenset(",;/|).\n\r")
+
+def _is_list_item(text: str, start: int, end: int) -> bool:
+    """Whether text[start:end] is a whole list item: only spaces separate it from list separators."""
+    before = start - 1
+    while before >= 0 and text[before] in " \t":
+        before -= 1
+    after = end
+    while after < len(text) and text[after] in " \t":
+        after += 1
+    return (before < 0 or text[before] in _ITEM_START) and (after >= len(text) or text[after] in _ITEM_END)
+
+def normalize_skill(name: str) -> str:
+    """Normalize a skill name for lookup: lowercase with single spaces."""
+    return " ".join(name.lower().split())
+
+class SkillRegistry:
+    """
+    Thread-safe registry of canonical skills, their aliases and integer IDs.
+    """
+
+    def __init__(
+        self,
+        aliases: Optional[Dict[str, List[str]]] = None,
+        max_distance: int = FUZZY_SKILL_MAX_DISTANCE,
+        fuzzy_cache_entries: int = FUZZY_SKILL_CACHE_MAX_ENTRIES
+    ):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        # Spelling of each registered term, and the layers that registered it
+        # (None for names registered outside a layer)
+        self._terms: Dict[str, str] = {}
+        self._owners: Dict[str, Set[Optional[str]]] = {}
+        self._layers: Dict[str, Set[str]] = {}
+        # IDs of names dropped with their layer
+        self._dropped_ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._max_distance = max_distance
+        self._matcher = SkillMatcher()
+        self._fuzzy: FuzzySkillIndex[int] = FuzzySkillIndex(max_distance)
+        # Fuzzy matches by normalized name, as returned by _fuzzy_match
+        self._fuzzy_cache = LRUCache(fuzzy_cache_entries)
+        for name, name_aliases in (aliases or {}).items():
+            self.register(name, name_aliases)
+
+    def _add(self, name: str, aliases: Iterable[str], layer: Optional[str]) -> Tuple[int, List[str]]:
+        """
+        Register a skill and its aliases for a layer. Must be called with
+        _lock held.
+
+        Returns:
+            The skill's ID, and the terms that were not registered before
+        """
+        terms = [name.strip(), *(alias.strip() for alias in aliases)]
+        key = normalize_skill(terms[0])
+        if not key:
+            raise ValueError("Skill name is empty")
+        skill_id = self._ids.get(key)
+        if skill_id is None:
+            skill_id = self._dropped_ids.pop(key, None)
+        if skill_id is None:
+            skill_id = len(self._names)
+            self._names.append(terms[0])
+        added = []
+        for term in terms:
+            term_key = normalize_skill(term)
+            if not term_key:
+                continue
+            if term_key not in self._ids:
+                self._ids[term_key] = skill_id
+                self._terms[term_key] = term
+                self._dropped_ids.pop(term_key, None)
+                added.append(term)
+            if self._ids[term_key] == skill_id:
+                self._owners.setdefault(term_key, set()).add(layer)
+                if layer is not None:
+                    self._layers.setdefault(layer, set()).add(term_key)
+        return skill_id, added
+
+    def register(self, name: str, aliases: Iterable[str] = ()) -> int:
+        """
+        Register a skill and its aliases.
+
+        A name that is already registered, directly or as an alias, keeps its
+        ID and canonical name, and the new aliases are added to it. An alias
+        that already belongs to another skill is left with that skill.
+
+        Args:
+            name: Skill name; becomes the canonical name if it is new
+            aliases: Other spellings of the same skill
+
+        Returns:
+            The skill's ID
+        """
+        with self._lock:
+            skill_id, added = self._add(name, aliases, None)
+            for term in added:
+                self._fuzzy.add(normalize_skill(term), skill_id)
+        if added:
+            # A new name can change how earlier misspellings resolve
+            self._fuzzy_cache.clear()
+            self._matcher.add_many(added)
+        return skill_id
+
+    def replace_layer(self, layer: str, skills: Iterable[Tuple[str, Iterable[str]]]):
+        """
+        Replace the skills registered for a layer, such as a loaded skills KB.
+
+        Names the layer registered before and does not register now are
+        dropped, unless they were also registered outside it; the matcher
+        and the typo-tolerant index are rebuilt without them. Names that are
+        kept keep their IDs.
+
+        Args:
+            layer: Name of the layer
+            skills: (name, aliases) of each skill in the layer
+        """
+        with self._lock:
+            for term_key in self._layers.pop(layer, set()):
+                owners = self._owners[term_key]
+                owners.discard(layer)
+                if not owners:
+                    del self._owners[term_key]
+                    del self._terms[term_key]
+                    self._dropped_ids[term_key] = self._ids.pop(term_key)
+            for name, aliases in skills:
+                self._add(name, aliases, layer)
+            matcher = SkillMatcher(self._terms.values())
+            fuzzy: FuzzySkillIndex[int] = FuzzySkillIndex(self._max_distance)
+            for term_key, skill_id in self._ids.items():
+                fuzzy.add(term_key, skill_id)
+            self._matcher, self._fuzzy = matcher, fuzzy
+        self._fuzzy_cache.clear()
+
+    def register_many(self, names: Iterable[str]) -> List[int]:
+        """Register several skills without aliases, returning their IDs."""
+        return [self.register(name) for name in names]
+
+    def get_id(self, name: str) -> Optional[int]:
+        """Return the ID of a skill name or alias, or None if it is unknown."""
+        return self._ids.get(normalize_skill(name))
+
+    def resolve(self, name: str) -> Optional[int]:
+        """
+        Return the ID of a skill name or alias, allowing for typos.
+
+        A name that is not registered, and is not one of COMMON_WORDS,
+        resolves to the skill whose name or alias is closest within the
+        allowed edit distance, provided no other skill is equally close.
+
+        Args:
+            name: Skill name as written
+
+        Returns:
+            The skill's ID, or None if nothing matches
+        """
+        key = normalize_skill(name)
+        skill_id = self._ids.get(key)
+        if skill_id is not None or not key:
+            return skill_id
+        closest, _ = self._fuzzy_match(key)
+        return closest if closest >= 0 else None
+
+    def _fuzzy_match(self, key: str) -> Tuple[int, bool]:
+        """
+        Look up an unregistered normalized name in the typo-tolerant index.
+
+        Returns:
+            The ID of the single closest skill, or -1 if there is none or
+            several are equally close, and whether every skill within the
+            allowed distance is that one
+        """
+        cached = self._fuzzy_cache.get(key)
+        if cached is None:
+            matches = self._fuzzy.lookup(key) if key not in COMMON_WORDS else []
+            closest = {match_id for _, match_id, distance in matches if distance == matches[0][2]}
+            closest_id = closest.pop() if len(closest) == 1 else -1
+            cached = (closest_id, closest_id >= 0 and all(match_id == closest_id for _, match_id, _ in matches))
+            self._fuzzy_cache.put(key, cached)
+        return cached
+
+    def key(self, name: str) -> Hashable:
+        """
+        Return a key that compares equal for all spellings of a skill,
+        including misspellings: its ID when it resolves, otherwise the
+        normalized name.
+        """
+        skill_id = self.resolve(name)
+        return skill_id if skill_id is not None else normalize_skill(name)
+
+    def correct_spelling(self, name: str) -> str:
+        """
+        Return the canonical name for a misspelled skill name, or the name
+        unchanged if it is registered as written, or does not match exactly
+        one skill within the allowed edit distance.
+        """
+        key = normalize_skill(name)
+        if not key or key in self._ids:
+            return name
+        skill_id, unambiguous = self._fuzzy_match(key)
+        return self._names[skill_id] if unambiguous else name
+
+    def name(self, skill_id: int) -> str:
+        """Return the canonical name of a skill ID."""
+        return self._names[skill_id]
+
+    def canonical(self, name: str) -> Optional[str]:
+        """Return the canonical name of a skill name or alias, if registered."""
+        skill_id = self.get_id(name)
+        return self._names[skill_id] if skill_id is not None else None
+
+    def finditer(self, text: str) -> Iterable[Tuple[int, int, int]]:
+        """
+        Find every occurrence of every registered name and alias in a text.
+
+        Occurrences of CASE_SENSITIVE_TERMS count only written as
+        registered, and of LIST_ITEM_TERMS only as a list item.
+
+        Yields:
+            (start, end, skill ID) for each match, ordered by end offset
+        """
+        ids = self._ids
+        for start, end, term in self._matcher.finditer(text):
+            key = normalize_skill(term)
+            spelling = _CASE_SENSITIVE_SPELLINGS.get(key)
+            if spelling is not None and (
+                text[start:end] != spelling or (spelling in LIST_ITEM_TERMS and not _is_list_item(text, start, end))
+            ):
+                continue
+            skill_id = ids.get(key)
+            # None if the term was dropped with its layer during the scan
+            if skill_id is not None:
+                yield start, end, skill_id
+
+    def find_ids(self, text: str) -> List[int]:
+        """
+        Find which skills occur in a text, under any of their names.
+
+        Returns:
+            Skill IDs in order of first occurrence
+        """
+        found: Dict[int, None] = {}
+        for _, _, skill_id in self.finditer(text):
+            found.setdefault(skill_id, None)
+        return list(found)
+
+    def find(self, text: str) -> List[str]:
+        """Find which skills occur in a text, as canonical names in order of first occurrence."""
+        return [self._names[skill_id] for skill_id in self.find_ids(text)]
+
+    def __contains__(self, name: Union[str, int]) -> bool:
+        if isinstance(name, int):
+            return 0 <= name < len(self._names)
+        return normalize_skill(name) in self._ids
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+# Shared registry; modules that know skill names register them at import time
+skill_registry = SkillRegistry(SKILL_ALIASES)
@@ -2,8 +2,22 @@
 Skills knowledge base for smarter skill matching without relying on API calls.
 """
 import json
-from pathlib import Path
+import logging
 import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from app.config import SKILLS_KB_PATH
+from app.services.kb_binary import read_skills_kb
+from app.services.parsed_resume import clear_parse_cache
+from app.services.skill_registry import skill_registry
+from app.services.skills_search import SkillSearchIndex
+
+logger = logging.getLogger(__name__)
 
 # Main skills categories and related skills
 SKILLS_RELATIONSHIPS = {
@@ -64,17 +78,36 @@ SKILLS_RELATIONSHIPS = {
     ]
 }
 
-def create_skills_index():
+skill_registry.register_many(SKILLS_RELATIONSHIPS)
+skill_registry.register_many(skill for skills in SKILLS_RELATIONSHIPS.values() for skill in skills)
+
+# Serialized copy of the index; loaded in place of SKILLS_RELATIONSHIPS when present
+SKILLS_INDEX_PATH = Path(__file__).resolve().parent.parent / "data" / "skills_index.json"
+# Compiled binary KB (see app.services.kb_binary); preferred over the JSON index
+SKILLS_KB_BINARY_PATH = Path(SKILLS_KB_PATH)
+
+# Source of an index built from SKILLS_RELATIONSHIPS; also accepted as a path to load it
+BUILT_IN_SOURCE = "built-in"
+
+UNKNOWN_SKILL = MappingProxyType({"category": "Unknown", "related_skills": (), "related_skills_lower": (), "related_ids": ()})
+
+def build_skills_index(relationships: Mapping[str, List[str]] = SKILLS_RELATIONSHIPS) -> Dict[str, Dict[str, Any]]:
     """
-    Create a flat skill index with related skills for faster matching.
+    Build a flat skill index with related skills for faster matching.
+
+    Args:
+        relationships: Categories mapped to their skills
+
+    Returns:
+        Lowercase skill and category names mapped to their category and related skills
     """
     skill_index = {}
     
-    for category, skills in SKILLS_RELATIONSHIPS.items():
+    for category, skills in relationships.items():
         # Add category itself as a skill
         skill_index[category.lower()] = {
             "category": category,
-            "related_skills": skills
+            "related_skills": list(skills)
         }
         
         # Add each skill in the category
@@ -84,52 +117,180 @@ def create_skills_index():
                 "related_skills": [s for s in skills if s != skill] + [category]
             }
     
-    # Save the index for faster loading
-    skills_dir = Path("app/data")
-    skills_dir.mkdir(exist_ok=True)
+    return skill_index
+
+def create_skills_index(path: Path = SKILLS_INDEX_PATH) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the skills index from SKILLS_RELATIONSHIPS and save it.
+
+    The file is written atomically next to this package, regardless of the
+    working directory. The in-memory index is not changed; call
+    reload_skills_index() to load the new file.
+    """
+    skill_index = build_skills_index()
+    path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(skills_dir / "skills_index.json", "w") as f:
-        json.dump(skill_index, f, indent=2)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".skills_index-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(skill_index, f, indent=2)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
     
     return skill_index
 
-def get_skills_index():
+# Registry layer holding the names of the loaded index
+REGISTRY_LAYER = "skills_kb"
+
+def _freeze(
+    skill_index: Mapping[str, Mapping[str, Any]],
+    aliases: Mapping[str, List[str]] = MappingProxyType({})
+) -> Mapping[str, Mapping[str, Any]]:
+    """
+    Make an index read-only, precomputing lowercase related skills and their
+    registry IDs. The index's names and aliases replace those of the
+    previously loaded index in the skill registry.
+    """
+    skill_registry.replace_layer(REGISTRY_LAYER, [
+        *aliases.items(),
+        *((name, ()) for name in skill_index),
+        *((s, ()) for entry in skill_index.values() for s in entry.get("related_skills", ())),
+    ])
+    frozen = {}
+    for name, entry in skill_index.items():
+        related = tuple(entry.get("related_skills", ()))
+        frozen[name] = MappingProxyType({
+            "category": entry.get("category", "Unknown"),
+            "related_skills": related,
+            "related_skills_lower": tuple(s.lower() for s in related),
+            "related_ids": tuple(skill_registry.get_id(s) for s in related),
+        })
+    return MappingProxyType(frozen)
+
+def _default_source() -> Path:
+    return SKILLS_KB_BINARY_PATH if SKILLS_KB_BINARY_PATH.exists() else SKILLS_INDEX_PATH
+
+def _load_skills_index(path: Path) -> Tuple[Mapping[str, Mapping[str, Any]], str]:
+    """Load an index from a binary KB or JSON file, falling back to SKILLS_RELATIONSHIPS."""
+    if str(path) != BUILT_IN_SOURCE and path.exists():
+        if path.suffix == ".bin":
+            skill_index, aliases = read_skills_kb(path)
+            return _freeze(skill_index, aliases), str(path)
+        with open(path, "r") as f:
+            return _freeze(json.load(f)), str(path)
+    return _freeze(build_skills_index()), BUILT_IN_SOURCE
+
+class SkillsKB(NamedTuple):
+    """A loaded skills index, the search index over its names and its names by registry ID."""
+    index: Mapping[str, Mapping[str, Any]]
+    search: SkillSearchIndex
+    names_by_id: Mapping[int, str]
+    # File the index was loaded from, or BUILT_IN_SOURCE
+    source: str
+
+    def resolve(self, skill_name_lower: str) -> Optional[str]:
+        """
+        Find the index entry for a lowercase skill name: the exact entry if
+        there is one, else the entry for another alias or a close misspelling
+        of the same skill, else the best ranked partial match, else None.
+        """
+        if skill_name_lower in self.index:
+            return skill_name_lower
+        name = self.names_by_id.get(skill_registry.resolve(skill_name_lower))
+        if name is not None:
+            return name
+        return self.search.best_match(skill_name_lower) or None
+
+def _load_skills_kb(path: Path) -> SkillsKB:
+    skill_index, source = _load_skills_index(path)
+    names_by_id: Dict[int, str] = {}
+    for name in skill_index:
+        names_by_id.setdefault(skill_registry.get_id(name), name)
+    return SkillsKB(skill_index, SkillSearchIndex(skill_index), MappingProxyType(names_by_id), source)
+
+_skills_index_lock = threading.Lock()
+# Process-wide index and its search index, replaced together by reload_skills_index()
+_skills_kb = _load_skills_kb(_default_source())
+
+def reload_skills_index(path: Optional[Path] = None) -> Mapping[str, Mapping[str, Any]]:
+    """
+    Reload the skills index from disk, or rebuild it from SKILLS_RELATIONSHIPS
+    if the file does not exist, and swap it in for all callers.
+
+    The new index is fully built before it replaces the old one, so requests
+    in flight keep using the old index and a file that fails to load leaves
+    it in place. Memoized resume parses are dropped once it is swapped in.
+
+    Args:
+        path: Binary KB or JSON index to load (defaults to SKILLS_KB_BINARY_PATH
+            when it exists, else SKILLS_INDEX_PATH); BUILT_IN_SOURCE rebuilds
+            it from SKILLS_RELATIONSHIPS
+
+    Returns:
+        The new read-only index
+    """
+    global _skills_kb
+    with _skills_index_lock:
+        start_time = time.perf_counter()
+        skills_kb = _load_skills_kb(path or _default_source())
+        _skills_kb = skills_kb
+        # Memoized parses hold skills from the previous taxonomy
+        clear_parse_cache()
+        load_ms = (time.perf_counter() - start_time) * 1000
+    logger.info(f"Loaded skills index with {len(skills_kb.index)} entries from {skills_kb.source} in {load_ms:.1f} ms")
+    return skills_kb.index
+
+def get_skills_index() -> Mapping[str, Mapping[str, Any]]:
     """
-    Get or create the skills index.
+    Get the in-memory, read-only skills index.
     """
-    skills_path = Path("app/data/skills_index.json")
+    return _skills_kb.index
+
+def get_skills_kb() -> SkillsKB:
+    """
+    Get the current skills index together with its search index.
+
+    Both come from the same load, so a caller holding the result sees a
+    consistent pair even if the index is reloaded meanwhile.
+    """
+    return _skills_kb
+
+def _lookup(skills_kb: SkillsKB, skill_name_lower: str) -> Mapping[str, Any]:
+    # Exact match, else the best ranked partial match
+    name = skills_kb.resolve(skill_name_lower)
+    if name is not None:
+        return skills_kb.index[name]
     
-    if skills_path.exists():
-        with open(skills_path, "r") as f:
-            return json.load(f)
-    else:
-        return create_skills_index()
+    # No match found
+    return UNKNOWN_SKILL
+
+def search_skills(skill_name: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Find the indexed skills that best match a partial or longer skill name.
+
+    Args:
+        skill_name: Skill name to look up
+        limit: Maximum number of results
+
+    Returns:
+        Matching skills with their category and match score, best first
+    """
+    skills_kb = _skills_kb
+    return [
+        {"skill": name, "category": skills_kb.index[name]["category"], "score": score}
+        for name, score in skills_kb.search.search(skill_name, limit)
+    ]
 
 def get_related_skills(skill_name):
     """
     Get related skills for a given skill name.
     """
-    skill_index = get_skills_index()
-    skill_name_lower = skill_name.lower()
-    
-    # Check for exact match
-    if skill_name_lower in skill_index:
-        return skill_index[skill_name_lower]
-    
-    # Check for partial matches
-    partial_matches = []
-    for indexed_skill in skill_index:
-        if skill_name_lower in indexed_skill or indexed_skill in skill_name_lower:
-            partial_matches.append(skill_index[indexed_skill])
-    
-    if partial_matches:
-        # Return the first partial match
-        return partial_matches[0]
-    
-    # No match found
+    entry = _lookup(_skills_kb, skill_name.lower())
     return {
-        "category": "Unknown",
-        "related_skills": []
+        "category": entry["category"],
+        "related_skills": list(entry["related_skills"])
     }
 
 def match_skills(resume_skills, job_skills):
@@ -143,34 +304,29 @@ def match_skills(resume_skills, job_skills):
     Returns:
         Dictionary with match results
     """
-    skill_index = get_skills_index()
+    skills_kb = _skills_kb
     matches = []
     missing = []
     related_matches = []
     
-    # Normalize all skills to lowercase
-    resume_skills_lower = [s.lower() for s in resume_skills]
+    # Compare skills by registry key, so aliases such as "k8s" and "Kubernetes" match
+    resume_skill_keys = set(skill_registry.key(s) for s in resume_skills)
     job_skills_lower = [s.lower() for s in job_skills]
     
     for job_skill in job_skills_lower:
         # Check for direct match
-        if job_skill in resume_skills_lower:
+        if skill_registry.key(job_skill) in resume_skill_keys:
             matches.append(job_skill)
             continue
             
         # Check if any related skill is in resume
-        related_info = get_related_skills(job_skill)
-        related_skills_lower = [s.lower() for s in related_info.get("related_skills", [])]
-        
-        found_related = False
-        matched_related = []
-        
-        for related_skill in related_skills_lower:
-            if related_skill in resume_skills_lower:
-                found_related = True
-                matched_related.append(related_skill)
+        related_info = _lookup(skills_kb, job_skill)
+        matched_related = [
+            s for s, skill_id in zip(related_info["related_skills_lower"], related_info["related_ids"])
+            if skill_id in resume_skill_keys
+        ]
         
-        if found_related:
+        if matched_related:
             related_matches.append({
                 "job_skill": job_skill,
                 "matched_via": matched_related
@@ -0,0 +1,240 @@
+"""
+Sparse-matrix skill matching for batches of resumes and job descriptions.
+
+The skills index is compiled into a sparse adjacency matrix over skill
+registry IDs, so related-skill matches for many resume/job pairs come out of a
+few matrix products instead of nested loops over lowercase strings. Results
+have the same direct/related/missing breakdown and the same 75% weight for
+related matches as app.services.skills_kb.match_skills.
+"""
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from app.services.skill_registry import skill_registry
+from app.services.skills_kb import SkillsKB, get_skills_kb
+
+# Weight of a job skill covered only through a related skill
+RELATED_MATCH_WEIGHT = 0.75
+
+class _Batch:
+    """Skill columns of one batch of resumes and jobs."""
+
+    def __init__(self, matrix: "SkillsMatrix", resume_sets: Sequence[Sequence[str]], job_sets: Sequence[Sequence[str]]):
+        # Skills registered when the matrix was compiled use their registry ID
+        # as column. Other skills still match directly, so they get
+        # batch-local columns after those.
+        self.columns = matrix.columns
+        self.extra_columns: Dict[Hashable, int] = {}
+        self.resume_keys = [{skill_registry.key(s) for s in skills} for skills in resume_sets]
+        self.job_skills = [[s.lower() for s in skills] for skills in job_sets]
+
+        rows, cols = [], []
+        for row, keys in enumerate(self.resume_keys):
+            for key in keys:
+                rows.append(row)
+                cols.append(self._column(key))
+        self.job_offsets = np.cumsum([0] + [len(skills) for skills in self.job_skills])
+        self.job_columns = np.fromiter(
+            (self._column(skill_registry.key(skill)) for skills in self.job_skills for skill in skills),
+            dtype=np.int64, count=self.job_offsets[-1]
+        )
+
+        # Resolved by SkillsMatrix when the batch is scored
+        self.entry_rows: Optional[np.ndarray] = None
+
+        self.resumes = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(len(self.resume_keys), self.columns + len(self.extra_columns))
+        )
+
+    def _column(self, key: Hashable) -> int:
+        if isinstance(key, int) and key < self.columns:
+            return key
+        return self.extra_columns.setdefault(key, self.columns + len(self.extra_columns))
+
+class SkillsMatrix:
+    """
+    Skills index compiled to a CSR adjacency matrix.
+
+    Each row is an index entry and holds its related skills, with registry
+    IDs as columns.
+    """
+
+    def __init__(self, skills_kb: SkillsKB):
+        self.skills_kb = skills_kb
+        self.entries = list(skills_kb.index.values())
+        self.rows: Dict[str, int] = {name: row for row, name in enumerate(skills_kb.index)}
+        # Every related skill was registered when the index was loaded
+        self.columns = len(skill_registry)
+
+        indptr = [0]
+        indices: List[int] = []
+        for entry in self.entries:
+            indices.extend(entry["related_ids"])
+            indptr.append(len(indices))
+
+        self.adjacency = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(len(self.entries), self.columns)
+        )
+
+    def _entry_rows(self, batch: _Batch) -> np.ndarray:
+        """Row of the index entry each job skill resolves to, or -1 if none."""
+        resolved: Dict[str, int] = {}
+        for skills in batch.job_skills:
+            for skill in skills:
+                if skill not in resolved:
+                    name = self.skills_kb.resolve(skill)
+                    resolved[skill] = self.rows[name] if name is not None else -1
+        return np.fromiter(
+            (resolved[skill] for skills in batch.job_skills for skill in skills),
+            dtype=np.int64, count=len(batch.job_columns)
+        )
+
+    def _score(self, batch: _Batch) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Direct and related hits of every resume against every job skill.
+
+        Returns:
+            Two boolean arrays of shape (resumes, job skills across all jobs)
+        """
+        resumes = batch.resumes
+        direct = resumes[:, batch.job_columns].toarray() > 0
+
+        entry_rows = batch.entry_rows = self._entry_rows(batch)
+        related = np.zeros_like(direct)
+        known = entry_rows >= 0
+        if known.any():
+            unique_rows, positions = np.unique(entry_rows[known], return_inverse=True)
+            # Number of each entry's related skills present in each resume
+            counts = (resumes[:, :self.columns] @ self.adjacency[unique_rows].T).toarray()
+            related[:, known] = counts[:, positions] > 0
+        related &= ~direct
+        return direct, related
+
+    def score(self, resume_sets: Sequence[Sequence[str]], job_sets: Sequence[Sequence[str]]) -> np.ndarray:
+        """
+        Match percentage of every resume against every job.
+
+        Args:
+            resume_sets: Skills of each resume
+            job_sets: Required skills of each job
+
+        Returns:
+            Array of shape (len(resume_sets), len(job_sets)) with percentages
+            rounded to one decimal
+        """
+        batch = _Batch(self, resume_sets, job_sets)
+        direct, related = self._score(batch)
+        return np.round(self._percentages(batch, direct, related), 1)
+
+    def _percentages(self, batch: _Batch, direct: np.ndarray, related: np.ndarray) -> np.ndarray:
+        sizes = np.diff(batch.job_offsets)
+        starts = batch.job_offsets[:-1][sizes > 0]
+        percentages = np.zeros((direct.shape[0], len(sizes)))
+        if len(starts):
+            direct_counts = np.add.reduceat(direct.astype(np.int64), starts, axis=1)
+            related_counts = np.add.reduceat(related.astype(np.int64), starts, axis=1)
+            percentages[:, sizes > 0] = (direct_counts + related_counts * RELATED_MATCH_WEIGHT) / sizes[sizes > 0] * 100
+        return percentages
+
+    def _breakdown(self, batch: _Batch, direct: np.ndarray, related: np.ndarray, resume: int, job: int) -> Dict[str, Any]:
+        start, end = int(batch.job_offsets[job]), int(batch.job_offsets[job + 1])
+        resume_keys = batch.resume_keys[resume]
+        matches, related_matches, missing = [], [], []
+
+        hits = zip(
+            batch.job_skills[job],
+            direct[resume, start:end].tolist(),
+            related[resume, start:end].tolist(),
+            batch.entry_rows[start:end].tolist()
+        )
+        for job_skill, is_direct, is_related, entry_row in hits:
+            if is_direct:
+                matches.append(job_skill)
+            elif is_related:
+                entry = self.entries[entry_row]
+                related_matches.append({
+                    "job_skill": job_skill,
+                    "matched_via": [
+                        s for s, skill_id in zip(entry["related_skills_lower"], entry["related_ids"])
+                        if skill_id in resume_keys
+                    ]
+                })
+            else:
+                missing.append(job_skill)
+
+        total_job_skills = end - start
+        match_percentage = (
+            ((len(matches) + (len(related_matches) * RELATED_MATCH_WEIGHT)) / total_job_skills) * 100
+            if total_job_skills > 0 else 0
+        )
+        return {
+            "match_percentage": round(match_percentage, 1),
+            "direct_matches": matches,
+            "related_matches": related_matches,
+            "missing_skills": missing
+        }
+
+    def match_one_to_many(self, resume_skills: Sequence[str], job_sets: Sequence[Sequence[str]]) -> List[Dict[str, Any]]:
+        """
+        Match one resume against many jobs.
+
+        Args:
+            resume_skills: Skills extracted from the resume
+            job_sets: Required skills of each job
+
+        Returns:
+            One match_skills-style result per job
+        """
+        batch = _Batch(self, [resume_skills], job_sets)
+        direct, related = self._score(batch)
+        return [self._breakdown(batch, direct, related, 0, job) for job in range(len(job_sets))]
+
+    def match_many_to_one(self, resume_sets: Sequence[Sequence[str]], job_skills: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Match many resumes against one job.
+
+        Args:
+            resume_sets: Skills extracted from each resume
+            job_skills: Skills required by the job
+
+        Returns:
+            One match_skills-style result per resume
+        """
+        batch = _Batch(self, resume_sets, [job_skills])
+        direct, related = self._score(batch)
+        return [self._breakdown(batch, direct, related, resume, 0) for resume in range(len(resume_sets))]
+
+_matrix: Optional[SkillsMatrix] = None
+_matrix_lock = threading.Lock()
+
+def get_skills_matrix() -> SkillsMatrix:
+    """
+    Get the matrix compiled from the current skills index, recompiling it
+    after the index has been reloaded.
+    """
+    global _matrix
+    skills_kb = get_skills_kb()
+    matrix = _matrix
+    if matrix is None or matrix.skills_kb is not skills_kb:
+        with _matrix_lock:
+            if _matrix is None or _matrix.skills_kb is not skills_kb:
+                _matrix = SkillsMatrix(skills_kb)
+            matrix = _matrix
+    return matrix
+
+def match_skills_one_to_many(resume_skills: Sequence[str], job_sets: Sequence[Sequence[str]]) -> List[Dict[str, Any]]:
+    """Match one resume's skills against the required skills of many jobs."""
+    return get_skills_matrix().match_one_to_many(resume_skills, job_sets)
+
+def match_skills_many_to_one(resume_sets: Sequence[Sequence[str]], job_skills: Sequence[str]) -> List[Dict[str, Any]]:
+    """Match the skills of many resumes against one job's required skills."""
+    return get_skills_matrix().match_many_to_one(resume_sets, job_skills)
+
+def score_skills(resume_sets: Sequence[Sequence[str]], job_sets: Sequence[Sequence[str]]) -> np.ndarray:
+    """Match percentage of every resume against every job, as a (resumes, jobs) array."""
+    return get_skills_matrix().score(resume_sets, job_sets)
@@ -0,0 +1,155 @@
+"""
+Inverted index for partial skill name lookups.
+
+Skill names are indexed by token and by character trigram, so a lookup only
+touches the names that share tokens or rare trigrams with the query instead
+of scanning the whole vocabulary. Results are ranked:
+
+1. The exact name.
+2. Token-aligned matches: the query is a run of whole tokens of the name
+   ("learning" -> "machine learning"), or the name is a run of whole tokens
+   of the query ("senior python developer" -> "python").
+3. Substring matches inside a token ("postgres" -> "postgresql"), only for
+   queries of at least three characters.
+
+Within a rank, names whose length is closest to the query's come first.
+Names shorter than three characters (e.g. "r", "go", "c#") have no trigrams
+and only match as whole tokens, so "r" does not match "react".
+"""
+import re
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"[\w+#]+")
+
+TRIGRAM_SIZE = 3
+
+# Rarest query trigrams intersected before candidates are verified directly
+_INTERSECTED_TRIGRAMS = 2
+
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Split a lowercase skill name into tokens."""
+    return tuple(_TOKEN_PATTERN.findall(text))
+
+def trigrams(text: str) -> Set[str]:
+    """Return the distinct character trigrams of a text."""
+    return {text[i:i + TRIGRAM_SIZE] for i in range(len(text) - TRIGRAM_SIZE + 1)}
+
+def _contains_run(tokens: Sequence[str], run: Sequence[str]) -> bool:
+    """Check whether run occurs as a contiguous slice of tokens."""
+    size = len(run)
+    first = run[0]
+    for i in range(len(tokens) - size + 1):
+        if tokens[i] == first and tuple(tokens[i:i + size]) == tuple(run):
+            return True
+    return False
+
+class SkillSearchIndex:
+    """
+    Read-only token and trigram index over a fixed list of skill names.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._tokens: List[Tuple[str, ...]] = []
+        self._token_postings: Dict[str, List[int]] = {}
+        self._trigram_postings: Dict[str, List[int]] = {}
+        self._by_tokens: Dict[Tuple[str, ...], List[int]] = {}
+        self._max_name_tokens = 0
+
+        for name in names:
+            name = name.lower()
+            if not name or name in self._ids:
+                continue
+            name_id = len(self.names)
+            self.names.append(name)
+            self._ids[name] = name_id
+
+            tokens = tokenize(name)
+            self._tokens.append(tokens)
+            self._by_tokens.setdefault(tokens, []).append(name_id)
+            self._max_name_tokens = max(self._max_name_tokens, len(tokens))
+            for token in set(tokens):
+                self._token_postings.setdefault(token, []).append(name_id)
+            for trigram in trigrams(name):
+                self._trigram_postings.setdefault(trigram, []).append(name_id)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _token_matches(self, query_tokens: Tuple[str, ...]) -> Set[int]:
+        matches: Set[int] = set()
+        if not query_tokens:
+            return matches
+
+        # The query is a run of tokens inside a name
+        postings = [self._token_postings.get(token) for token in set(query_tokens)]
+        if all(postings):
+            postings.sort(key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+            matches.update(i for i in candidates if _contains_run(self._tokens[i], query_tokens))
+
+        # A name is a run of tokens inside the query
+        count = len(query_tokens)
+        for start in range(count):
+            for stop in range(start + 1, min(count, start + self._max_name_tokens) + 1):
+                matches.update(self._by_tokens.get(query_tokens[start:stop], ()))
+
+        return matches
+
+    def _substring_matches(self, query: str) -> Set[int]:
+        query_trigrams = trigrams(query)
+        if not query_trigrams:
+            return set()
+
+        postings = []
+        for trigram in query_trigrams:
+            posting = self._trigram_postings.get(trigram)
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:_INTERSECTED_TRIGRAMS])
+        return {i for i in candidates if query in self.names[i]}
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """
+        Find the skill names that best match a partial or longer name.
+
+        Args:
+            query: Skill name as written in a resume or job description
+            limit: Maximum number of results
+
+        Returns:
+            (name, score) pairs, best first. The integer part of the score is
+            the match rank (3 exact, 2 token-aligned, 1 substring) and the
+            fraction is the length similarity between query and name.
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+
+        scored: Dict[int, float] = {}
+
+        def add(name_ids: Iterable[int], rank: int):
+            for name_id in name_ids:
+                if name_id in scored:
+                    continue
+                name = self.names[name_id]
+                scored[name_id] = rank + min(len(name), len(query)) / max(len(name), len(query))
+
+        exact = self._ids.get(query)
+        if exact is not None:
+            add([exact], 3)
+        add(self._token_matches(tokenize(query)), 2)
+        if len(query) >= TRIGRAM_SIZE:
+            add(self._substring_matches(query), 1)
+
+        ranked = sorted(scored.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.names[name_id], round(score, 4)) for name_id, score in ranked[:limit]]
+
+    def best_match(self, query: str) -> str:
+        """Return the best matching name, or an empty string if none match."""
+        results = self.search(query, limit=1)
+        return results[0][0] if results else ""
@@ -3,9 +3,32 @@ Advanced resume analyzer with structured output.
 """
 from typing import Dict, List, Any, Optional
 import re
-from app.services.parser import extract_skills, extract_experience, extract_education
+from app.config import SEMANTIC_MATCH_ENABLED
+from app.services.parse_limits import ParseBudget, limit_field, limit_input
+from app.services.parsed_resume import ParsedResume, parse_resume
+from app.services.semantic_match import semantic_match
 from app.services.skills_kb import match_skills, get_related_skills
 
+# Sections of a job description that list skills; the skills text is the last group
+JOB_SKILLS_SECTION_PATTERNS = [
+    re.compile(r"(?:skills|requirements|qualifications|what you('ll| will) need)[:\s]+(.+?)(?:\n\n|\Z)", re.IGNORECASE | re.DOTALL),
+    re.compile(r"technical skills[:\s]+(.+?)(?:\n\n|\Z)", re.IGNORECASE | re.DOTALL),
+    re.compile(r"you have[:\s]+(.+?)(?:\n\n|\Z)", re.IGNORECASE | re.DOTALL),
+]
+
+# Phrases that introduce a skill anywhere in a job description
+JOB_SKILL_PHRASE_PATTERNS = [
+    re.compile(r"experience (?:with|in) ([^,.]+)", re.IGNORECASE),
+    re.compile(r"knowledge of ([^,.]+)", re.IGNORECASE),
+    re.compile(r"familiarity with ([^,.]+)", re.IGNORECASE),
+    re.compile(r"proficiency in ([^,.]+)", re.IGNORECASE),
+    re.compile(r"proficient (?:with|in) ([^,.]+)", re.IGNORECASE),
+    re.compile(r"understanding of ([^,.]+)", re.IGNORECASE),
+]
+
+BULLET_ITEM_PATTERN = re.compile(r'[•\-*]\s*([^•\-*\n]+)')
+SKILL_SUFFIX_PATTERN = re.compile(r'(?:is required|required|a must|a plus|preferred)$', re.IGNORECASE)
+
 class StructuredAnalyzer:
     """
     Analyzes resumes and produces structured output without heavy API usage.
@@ -21,22 +44,21 @@ class StructuredAnalyzer:
         """
         if not job_description:
             return []
+        
+        budget = ParseBudget.for_document()
+        job_description = limit_input(job_description)
             
         # Look for skills sections in job description
-        skills_section_patterns = [
-            r"(?:skills|requirements|qualifications|what you('ll| will) need)[:\s]+(.+?)(?:\n\n|\Z)",
-            r"technical skills[:\s]+(.+?)(?:\n\n|\Z)",
-            r"you have[:\s]+(.+?)(?:\n\n|\Z)",
-        ]
-        
         skills = []
-        for pattern in skills_section_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE | re.DOTALL)
-            if matches:
-                skills_text = matches[0] if isinstance(matches[0], str) else matches[0][1]
+        for pattern in JOB_SKILLS_SECTION_PATTERNS:
+            if budget.expired():
+                break
+            match = pattern.search(job_description)
+            if match:
+                skills_text = match.group(match.re.groups)
                 
                 # Extract skills from bullet points or commas
-                skill_items = re.findall(r'[•\-*]\s*([^•\-*\n]+)', skills_text)
+                skill_items = BULLET_ITEM_PATTERN.findall(skills_text)
                 if skill_items:
                     skills.extend([s.strip() for s in skill_items])
                 else:
@@ -44,45 +66,56 @@ class StructuredAnalyzer:
                     skills.extend([s.strip() for s in skills_text.split(',')])
         
         # Look for specific skill keywords throughout the text
-        common_skill_patterns = [
-            r"experience (?:with|in) ([^,.]+)",
-            r"knowledge of ([^,.]+)",
-            r"familiarity with ([^,.]+)",
-            r"proficiency in ([^,.]+)",
-            r"proficient (?:with|in) ([^,.]+)",
-            r"understanding of ([^,.]+)",
-        ]
-        
-        for pattern in common_skill_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
+        for pattern in JOB_SKILL_PHRASE_PATTERNS:
+            if budget.expired():
+                break
+            matches = pattern.findall(job_description)
             skills.extend([s.strip() for s in matches])
         
         # Clean up skills
         cleaned_skills = []
+        seen = set()
         for skill in skills:
             # Remove common endings
-            skill = re.sub(r'(?:is required|required|a must|a plus|preferred)$', '', skill, flags=re.IGNORECASE)
+            skill = SKILL_SUFFIX_PATTERN.sub('', limit_field(skill))
             skill = skill.strip()
-            if skill and len(skill) > 2 and skill not in cleaned_skills:
+            if skill and len(skill) > 2 and skill not in seen:
+                seen.add(skill)
                 cleaned_skills.append(skill)
         
         return cleaned_skills
     
-    def analyze_resume(self, resume_text: str, job_description: Optional[str] = None) -> Dict[str, Any]:
+    def analyze_resume(
+        self,
+        resume_text: str,
+        job_description: Optional[str] = None,
+        parsed: Optional[ParsedResume] = None,
+        include_similar_skills: bool = False,
+        similar_skills_k: int = 3,
+        include_semantic_match: bool = SEMANTIC_MATCH_ENABLED
+    ) -> Dict[str, Any]:
         """
         Analyze a resume and optionally match it against a job description.
         
         Args:
             resume_text: The text content of the resume
             job_description: Optional job description to match against
+            parsed: Already parsed resume, to skip parsing resume_text again
+            include_similar_skills: Also look up skills similar to the resume's
+                skills in the vector store, with one batched query
+            similar_skills_k: Number of similar skills per resume skill
+            include_semantic_match: Also match the resume against the job
+                description's requirement lines by embedding similarity
             
         Returns:
             Dictionary with structured analysis results
         """
-        # Extract basic components from the resume
-        resume_skills = extract_skills(resume_text)
-        resume_experience = extract_experience(resume_text)
-        resume_education = extract_education(resume_text)
+        # Extract basic components from the resume (memoized per resume text)
+        if parsed is None:
+            parsed = parse_resume(resume_text)
+        resume_skills = parsed.skills
+        resume_experience = parsed.experience
+        resume_education = parsed.education
         
         # Analyze experience level
         years_experience = sum(1 for _ in resume_experience)  # Simplified, assumes 1 year per job
@@ -130,6 +163,8 @@ class StructuredAnalyzer:
         if job_description:
             job_skills = self.extract_job_skills(job_description)
             job_match = match_skills(resume_skills, job_skills)
+            if include_semantic_match:
+                job_match["semantic_match"] = semantic_match(resume_text, job_description)
             
             # Add match-based strengths/weaknesses
             match_percent = job_match.get("match_percentage", 0)
@@ -176,6 +211,11 @@ class StructuredAnalyzer:
         if job_match:
             result["job_match"] = job_match
         
+        if include_similar_skills:
+            # Imported here so the analyzer works without the vector store
+            from app.services.vector_store import get_similar_skills_many
+            result["similar_skills"] = get_similar_skills_many(resume_skills, similar_skills_k)
+        
         # Generate a human-readable summary
         summary = self._generate_summary(result, job_description is not None)
         result["summary"] = summary
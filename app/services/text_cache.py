@@ -0,0 +1,117 @@
+"""
+Content-addressed cache for text extracted from uploaded documents.
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config import TEXT_CACHE_MAX_ENTRIES, TEXT_CACHE_DIR
+from app.utils.helpers import LRUCache
+
+logger = logging.getLogger(__name__)
+
+def content_digest(content: bytes) -> str:
+    """Return the SHA-256 hex digest of raw document bytes."""
+    return hashlib.sha256(content).hexdigest()
+
+class TextCache:
+    """
+    Two-tier cache mapping document content hashes to normalized text.
+
+    The in-memory tier is an LRU; the optional disk tier stores one UTF-8 file
+    per document so repeat uploads survive restarts and are shared by workers.
+    """
+
+    def __init__(self, max_entries: int = 256, cache_dir: Optional[str] = None):
+        self.memory = LRUCache(max_entries)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._lock = threading.Lock()
+        self.disk_hits = 0
+        self.disk_misses = 0
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _disk_path(self, key: str) -> Path:
+        # Shard by digest prefix to keep directories small
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up cached text, falling back to the disk tier on a memory miss.
+
+        Args:
+            key: Cache key built by make_key
+
+        Returns:
+            The cached text, or None if the document has not been seen
+        """
+        text = self.memory.get(key)
+        if text is not None or self.cache_dir is None:
+            return text
+
+        path = self._disk_path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            text = None
+        except OSError as e:
+            logger.warning(f"Failed to read text cache entry {path}: {str(e)}")
+            text = None
+
+        with self._lock:
+            if text is None:
+                self.disk_misses += 1
+            else:
+                self.disk_hits += 1
+        if text is not None:
+            self.memory.put(key, text)
+        return text
+
+    def put(self, key: str, text: str):
+        """Store text in memory and, if configured, on disk."""
+        self.memory.put(key, text)
+        if self.cache_dir is None:
+            return
+
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            # Write to a temp file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write text cache entry {path}: {str(e)}")
+
+    @staticmethod
+    def make_key(document_format: str, digest: str) -> str:
+        """
+        Build a cache key from the content digest of the document bytes.
+
+        The format is part of the key because the same bytes uploaded as
+        ".txt" and ".pdf" go through different extractors.
+        """
+        return f"{digest}{document_format}"
+
+    def clear(self):
+        """Clear the in-memory tier and all counters."""
+        self.memory.clear()
+        with self._lock:
+            self.disk_hits = 0
+            self.disk_misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for both tiers."""
+        stats = self.memory.stats()
+        with self._lock:
+            stats["disk_enabled"] = self.cache_dir is not None
+            stats["disk_hits"] = self.disk_hits
+            stats["disk_misses"] = self.disk_misses
+        return stats
+
+text_cache = TextCache(TEXT_CACHE_MAX_ENTRIES, TEXT_CACHE_DIR)
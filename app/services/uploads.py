@@ -0,0 +1,270 @@
+"""
+Bounded-memory handling of uploaded documents.
+
+Small uploads are kept in memory. Larger ones are exposed to extractors as a
+read-only memory map of a file on disk, so a 20 MB upload never needs a full
+in-memory copy: the temporary file Starlette already spooled the body to is
+mapped in place, and any other large body is streamed in chunks to a
+temporary file of our own.
+
+Starlette receives the whole multipart body before a handler runs, so the
+size limit is enforced on the body as it arrives by
+RequestSizeLimitMiddleware, including chunked requests without a
+Content-Length.
+"""
+import hashlib
+import io
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Iterator, Optional, Union
+
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+
+from app.config import MAX_UPLOAD_BYTES, UPLOAD_SPOOL_THRESHOLD_BYTES, UPLOAD_CHUNK_BYTES
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds the configured size limit."""
+
+    def __init__(self, limit: int):
+        super().__init__(f"Upload exceeds the maximum size of {limit // (1024 * 1024)} MB")
+        self.limit = limit
+
+class MappedStream(io.RawIOBase):
+    """
+    Seekable, read-only file object over a memory map.
+
+    mmap objects lack seekable() before Python 3.13, which zipfile (and so
+    python-docx) requires.
+    """
+
+    def __init__(self, buffer: Union[mmap.mmap, memoryview, bytes]):
+        self._view = memoryview(buffer)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        count = min(len(target), len(self._view) - self._position)
+        if count <= 0:
+            return 0
+        target[:count] = self._view[self._position:self._position + count]
+        self._position += count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self):
+        self._view.release()
+        super().close()
+
+class SpooledUpload:
+    """
+    An upload body held either in memory or in a temporary file on disk.
+
+    Instances are picklable, so they can be handed to extraction worker
+    processes, which open their own view of the spooled file.
+    """
+
+    def __init__(self, filename: Optional[str], size: int, digest: str,
+                 data: Optional[bytes] = None, path: Optional[str] = None, delete: bool = True):
+        self.filename = filename
+        self.size = size
+        self.digest = digest
+        self.data = data
+        self.path = path
+        # Whether close() deletes the file; false for a file owned by Starlette
+        self.delete = delete
+
+    @property
+    def spooled_to_disk(self) -> bool:
+        return self.path is not None
+
+    @contextmanager
+    def open_view(self) -> Iterator[Union[bytes, mmap.mmap]]:
+        """
+        Yield the upload contents as a bytes-like buffer without copying.
+
+        Disk-spooled uploads are memory-mapped read-only for the duration of
+        the context.
+        """
+        if self.path is None:
+            yield self.data
+            return
+
+        if self.size == 0:
+            yield b""
+            return
+
+        with open(self.path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield mapped
+            finally:
+                mapped.close()
+
+    def close(self):
+        """Delete the temporary file, if any and owned by the upload."""
+        if self.path is not None and self.delete:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+        self.path = None
+
+def _rolled_file(file) -> Optional[IO[bytes]]:
+    """Return the disk file Starlette spooled an UploadFile's body to, if it rolled over to disk."""
+    spooled = getattr(file, "file", None)
+    if isinstance(spooled, tempfile.SpooledTemporaryFile) and getattr(spooled, "_rolled", False):
+        return spooled._file
+    return None
+
+def _map_rolled_upload(file, max_bytes: int) -> Optional[SpooledUpload]:
+    """
+    Expose an upload Starlette spooled to disk without copying it.
+
+    Starlette's temporary file has no name, so it is reached through
+    /proc/<pid>/fd, which worker processes can open as well; returns None
+    where there is no /proc.
+    """
+    rolled = _rolled_file(file)
+    if rolled is None:
+        return None
+    fd = rolled.fileno()
+    path = f"/proc/{os.getpid()}/fd/{fd}"
+    if not os.path.exists(path):
+        return None
+
+    size = os.fstat(fd).st_size
+    if size > max_bytes:
+        raise UploadTooLarge(max_bytes)
+    hasher = hashlib.sha256()
+    if size:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+            hasher.update(mapped)
+    return SpooledUpload(file.filename, size, hasher.hexdigest(), path=path, delete=False)
+
+async def spool_upload(file, max_bytes: int = MAX_UPLOAD_BYTES,
+                       spool_threshold: int = UPLOAD_SPOOL_THRESHOLD_BYTES) -> SpooledUpload:
+    """
+    Read an upload in chunks, enforcing the size limit as it goes.
+
+    A body Starlette already spooled to disk is mapped in place instead.
+
+    Args:
+        file: FastAPI UploadFile to read
+        max_bytes: Maximum accepted upload size
+        spool_threshold: Uploads larger than this are spooled to a temp file
+
+    Returns:
+        SpooledUpload with the body, its size and its SHA-256 digest
+
+    Raises:
+        UploadTooLarge: If the upload is larger than max_bytes
+    """
+    # Reject early when the size is already known
+    if file.size is not None and file.size > max_bytes:
+        raise UploadTooLarge(max_bytes)
+
+    upload = _map_rolled_upload(file, max_bytes)
+    if upload is not None:
+        return upload
+
+    hasher = hashlib.sha256()
+    buffer = bytearray()
+    spool = None
+    size = 0
+
+    try:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLarge(max_bytes)
+            hasher.update(chunk)
+
+            if spool is not None:
+                spool.write(chunk)
+            elif len(buffer) + len(chunk) > spool_threshold:
+                spool = tempfile.NamedTemporaryFile(prefix="upload-", delete=False)
+                spool.write(buffer)
+                spool.write(chunk)
+                buffer = bytearray()
+            else:
+                buffer += chunk
+    except BaseException:
+        if spool is not None:
+            spool.close()
+            os.unlink(spool.name)
+        raise
+
+    if spool is None:
+        return SpooledUpload(file.filename, size, hasher.hexdigest(), data=bytes(buffer))
+
+    spool.close()
+    return SpooledUpload(file.filename, size, hasher.hexdigest(), path=spool.name)
+
+class RequestSizeLimitMiddleware:
+    """
+    ASGI middleware rejecting request bodies over a size limit with 413.
+
+    A Content-Length over the limit is rejected before the body is read.
+    Otherwise, and for chunked requests without one, the body is counted as
+    it is received and the request fails as soon as it passes the limit,
+    rather than after the whole body has been spooled.
+    """
+
+    def __init__(self, app, max_bytes: int = MAX_UPLOAD_BYTES):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        detail = f"Request body exceeds the maximum size of {self.max_bytes // (1024 * 1024)} MB"
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > self.max_bytes:
+            response = JSONResponse(status_code=413, content={"detail": detail})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_limited():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # Raised into whatever is reading the body; FastAPI
+                    # passes HTTPExceptions from body parsing through
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, receive_limited, send)
@@ -0,0 +1,322 @@
+"""
+In-process vector index backed by NumPy.
+
+The knowledge collection holds a few thousand documents, which an exact
+search over one contiguous float32 matrix answers faster than a round trip
+through SQLite and an HNSW graph. Vectors are L2-normalized when added, so
+cosine similarity is a single matrix-vector product, and the top k rows come
+from np.argpartition.
+
+NumpyVectorIndex implements the subset of Chroma's collection interface the
+app uses (add, upsert, query, count, metadata), so it can stand in for a Chroma
+collection. On disk an index is a directory with:
+
+    vectors.npy     float32[count, dim], memory-mapped when loaded
+    records.json    embedding model ID, IDs, documents and metadata
+
+Both files are written to temporary files and moved into place.
+"""
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.embeddings import EmbeddingBackend, embed_texts
+
+VECTORS_FILE = "vectors.npy"
+RECORDS_FILE = "records.json"
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize the rows of a float32 array; zero rows stay zero."""
+    vectors = np.array(vectors, dtype=np.float32, ndmin=2)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+def _replace_file(path: Path, write):
+    """Write a file through a temporary file in the same directory and move it into place."""
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}-", suffix=path.suffix)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+class _IndexState(NamedTuple):
+    """Contents of an index; replaced as a whole on every add."""
+    vectors: Optional[np.ndarray]
+    ids: List[str]
+    documents: List[str]
+    metadatas: List[Dict[str, Any]]
+    positions: Dict[str, int]
+    # Rows matching each metadata filter queried so far, with a contiguous
+    # copy of their vectors
+    filtered: Dict[Any, Tuple[np.ndarray, np.ndarray]]
+
+_EMPTY_STATE = _IndexState(None, [], [], [], {}, {})
+
+class NumpyVectorIndex:
+    """
+    Exact cosine-similarity index over a contiguous float32 matrix.
+
+    Queries may run concurrently with each other and with adds: an add
+    builds new arrays and swaps them in at once, so a query sees the index
+    either before or after it.
+    """
+
+    def __init__(self, backend: EmbeddingBackend, path: Optional[Path] = None):
+        """
+        Args:
+            backend: Embedding backend for documents and query texts
+            path: Directory the index is saved to
+        """
+        self.backend = backend
+        self.path = Path(path) if path is not None else None
+        self._state = _EMPTY_STATE
+        # Preallocated matrix the current state's vectors are a prefix of;
+        # None while they are memory-mapped from disk
+        self._buffer: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    @property
+    def metadata(self) -> Dict[str, str]:
+        """Collection metadata, in the shape of a Chroma collection's."""
+        return {"embedding_model": self.backend.model_id}
+
+    def count(self) -> int:
+        """Number of documents in the index."""
+        return len(self._state.ids)
+
+    def add(
+        self,
+        ids: Sequence[str],
+        documents: Sequence[str],
+        metadatas: Optional[Sequence[Mapping[str, Any]]] = None,
+        embeddings: Optional[Any] = None
+    ):
+        """
+        Add documents, embedding them unless embeddings are given.
+
+        Raises:
+            ValueError: If an ID is already in the index or repeated
+        """
+        self._write(ids, documents, metadatas, embeddings, replace=False)
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        documents: Sequence[str],
+        metadatas: Optional[Sequence[Mapping[str, Any]]] = None,
+        embeddings: Optional[Any] = None
+    ):
+        """
+        Add documents, replacing those whose ID is already in the index.
+        Within one call, the last document with a given ID wins.
+        """
+        self._write(ids, documents, metadatas, embeddings, replace=True)
+
+    def _write(self, ids, documents, metadatas, embeddings, replace: bool):
+        ids = list(ids)
+        documents = list(documents)
+        metadatas = [dict(m) for m in metadatas] if metadatas is not None else [{} for _ in ids]
+        if not len(ids) == len(documents) == len(metadatas):
+            raise ValueError("ids, documents and metadatas must have the same length")
+        vectors = _normalize(embed_texts(documents, self.backend) if embeddings is None else embeddings)
+        if len(vectors) != len(ids):
+            raise ValueError(f"Got {len(vectors)} embeddings for {len(ids)} documents")
+
+        batch_rows = {record_id: row for row, record_id in enumerate(ids)}
+        if len(batch_rows) != len(ids):
+            if not replace:
+                raise ValueError("Duplicate IDs in add")
+            # Keep the last occurrence of each ID
+            keep = sorted(batch_rows.values())
+            ids = [ids[row] for row in keep]
+            documents = [documents[row] for row in keep]
+            metadatas = [metadatas[row] for row in keep]
+            vectors = vectors[keep]
+
+        with self._lock:
+            state = self._state
+            size = len(state.ids)
+            replaced = [(row, state.positions[record_id]) for row, record_id in enumerate(ids) if record_id in state.positions]
+            if replaced and not replace:
+                raise ValueError(f"IDs already in the index: {[ids[row] for row, _ in replaced][:5]}")
+            if state.vectors is not None and vectors.shape[1] != state.vectors.shape[1]:
+                raise ValueError(f"Expected {state.vectors.shape[1]}-dimensional embeddings, got {vectors.shape[1]}")
+
+            added = [row for row, record_id in enumerate(ids) if record_id not in state.positions]
+            total = size + len(added)
+            buffer = self._buffer
+            if replaced or buffer is None or state.vectors is None or len(buffer) < total:
+                # Rows are appended in place past the end of the current
+                # state; replacing rows copies the matrix, so queries on the
+                # previous state are not affected
+                buffer = np.empty((max(total, 2 * size, 256), vectors.shape[1]), dtype=np.float32)
+                if size:
+                    buffer[:size] = state.vectors
+                self._buffer = buffer
+
+            all_ids = state.ids + [ids[row] for row in added]
+            all_documents = state.documents + [documents[row] for row in added]
+            all_metadatas = state.metadatas + [metadatas[row] for row in added]
+            positions = dict(state.positions)
+            for offset, row in enumerate(added):
+                positions[ids[row]] = size + offset
+            buffer[size:total] = vectors[added]
+            if replaced:
+                for row, position in replaced:
+                    buffer[position] = vectors[row]
+                    all_documents[position] = documents[row]
+                    all_metadatas[position] = metadatas[row]
+
+            self._state = _IndexState(buffer[:total], all_ids, all_documents, all_metadatas, positions, {})
+
+    @staticmethod
+    def _filter(state: _IndexState, where: Mapping[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rows matching a metadata filter of equality conditions, and their
+        vectors. Cached per filter, so a filtered query scans a contiguous
+        matrix of only the matching rows instead of gathering them each time.
+        """
+        conditions = {}
+        for key, value in where.items():
+            if isinstance(value, Mapping):
+                if set(value) != {"$eq"}:
+                    raise ValueError(f"Unsupported filter on {key}: {value}")
+                value = value["$eq"]
+            conditions[key] = value
+        cache_key = tuple(sorted(conditions.items()))
+        filtered = state.filtered.get(cache_key)
+        if filtered is None:
+            mask = np.fromiter(
+                (all(m.get(key) == value for key, value in conditions.items()) for m in state.metadatas),
+                dtype=bool, count=len(state.ids)
+            )
+            rows = np.flatnonzero(mask)
+            filtered = state.filtered[cache_key] = (rows, np.ascontiguousarray(state.vectors[rows]))
+        return filtered
+
+    def query(
+        self,
+        query_texts: Optional[Sequence[str]] = None,
+        n_results: int = 10,
+        where: Optional[Mapping[str, Any]] = None,
+        query_embeddings: Optional[Any] = None,
+        include: Sequence[str] = ("documents", "metadatas", "distances")
+    ) -> Dict[str, Any]:
+        """
+        Find the documents most similar to each query.
+
+        Args:
+            query_texts: Query texts, embedded with the index's backend
+            n_results: Number of results per query
+            where: Metadata equality filter, e.g. {"type": "skill_data"}
+            query_embeddings: Query vectors, instead of query_texts
+            include: Result fields besides "ids"
+
+        Returns:
+            Chroma-style results: "ids" and each included field hold one
+            list per query, closest first. Distances are cosine distances
+            (1 - cosine similarity).
+        """
+        if query_embeddings is None:
+            if query_texts is None:
+                raise ValueError("Either query_texts or query_embeddings is required")
+            query_embeddings = embed_texts(query_texts, self.backend)
+        queries = _normalize(query_embeddings)
+
+        state = self._state
+        results: Dict[str, Any] = {"ids": [], **{field: [] for field in include}}
+        if state.vectors is None or n_results <= 0:
+            for field in results:
+                results[field] = [[] for _ in queries]
+            return results
+
+        vectors = state.vectors
+        rows, candidates = self._filter(state, where) if where else (None, vectors)
+        k = min(n_results, len(candidates))
+
+        similarities = queries @ candidates.T if k else np.empty((len(queries), 0), dtype=np.float32)
+        for scores in similarities:
+            if k < len(scores):
+                top = np.argpartition(-scores, k - 1)[:k]
+                top = top[np.argsort(-scores[top], kind="stable")]
+            else:
+                top = np.argsort(-scores, kind="stable")
+            positions = (rows[top] if rows is not None else top).tolist()
+            results["ids"].append([state.ids[p] for p in positions])
+            if "documents" in results:
+                results["documents"].append([state.documents[p] for p in positions])
+            if "metadatas" in results:
+                results["metadatas"].append([state.metadatas[p] for p in positions])
+            if "distances" in results:
+                results["distances"].append((1.0 - scores[top]).tolist())
+            if "embeddings" in results:
+                results["embeddings"].append(np.asarray(vectors[positions]).tolist())
+        return results
+
+    def save(self, path: Optional[Path] = None):
+        """Write the index to a directory, by default the one it was opened from."""
+        path = Path(path) if path is not None else self.path
+        if path is None:
+            raise ValueError("No path to save the index to")
+        path.mkdir(parents=True, exist_ok=True)
+        state = self._state
+        vectors = state.vectors if state.vectors is not None else np.zeros((0, 0), dtype=np.float32)
+        records = {
+            "embedding_model": self.backend.model_id,
+            "count": len(state.ids),
+            "ids": state.ids,
+            "documents": state.documents,
+            "metadatas": state.metadatas,
+        }
+        _replace_file(path / VECTORS_FILE, lambda f: np.save(f, np.ascontiguousarray(vectors, dtype=np.float32)))
+        _replace_file(path / RECORDS_FILE, lambda f: f.write(json.dumps(records).encode("utf-8")))
+        self.path = path
+
+    @classmethod
+    def load(cls, path: Path, backend: EmbeddingBackend) -> "NumpyVectorIndex":
+        """
+        Open a saved index, memory-mapping its vectors.
+
+        A directory without an index opens as an empty index that saves to it.
+
+        Raises:
+            ValueError: If the index was built with another embedding model or
+                its files do not match
+        """
+        path = Path(path)
+        index = cls(backend, path)
+        records_path = path / RECORDS_FILE
+        if not records_path.exists():
+            return index
+
+        with open(records_path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+        if records.get("embedding_model") != backend.model_id:
+            raise ValueError(
+                f"Index at {path} was built with {records.get('embedding_model')}, not {backend.model_id}"
+            )
+        vectors = np.load(path / VECTORS_FILE, mmap_mode="r")
+        count = records["count"]
+        if vectors.dtype != np.float32 or vectors.ndim != 2 or len(vectors) != count:
+            raise ValueError(f"Index at {path} has vectors of shape {vectors.shape}, expected {count} rows")
+        if not len(records["ids"]) == len(records["documents"]) == len(records["metadatas"]) == count:
+            raise ValueError(f"Index at {path} has inconsistent records")
+
+        index._state = _IndexState(
+            vectors if count else None,
+            records["ids"],
+            records["documents"],
+            records["metadatas"],
+            {record_id: i for i, record_id in enumerate(records["ids"])},
+            {}
+        )
+        return index
@@ -1,104 +1,204 @@
 """
 Vector store service for ChromaDB integration.
+
+The Chroma client and the collection handle are created lazily, once per
+process, and shared by every caller: opening a PersistentClient opens its
+SQLite database and resolving the collection is another round trip, which
+used to be paid on every skills or industry lookup.
+
+With VECTOR_BACKEND set to "numpy", the collection is an in-process
+NumpyVectorIndex (see app.services.vector_index) saved in
+VECTOR_INDEX_DIRECTORY instead, behind the same functions.
+
+The collection is built by app.services.kb_builder into a fresh directory
+under the backend's root, and the active build is the one named by the
+root's CURRENT file. Documents are embedded with the backend from
+app.services.embeddings, which by default runs locally without downloading
+a model. The backend's model ID is stored in the collection metadata; when
+there is no build yet, or the active one was embedded with a different
+model, a new build is made on open instead of changing the store in place.
 """
-from typing import List, Dict, Any
-import os
+from contextlib import contextmanager
+from typing import Iterator, List, Dict, Any, Optional
 import json
-import chromadb
-from chromadb.config import Settings
+import logging
+import threading
+import time
+from pathlib import Path
+
+from app.config import COLLECTION_NAME, VECTOR_BACKEND
+from app.services.embeddings import get_embedding_backend, embedding_cache_stats, flush_embedding_cache
+from app.services.kb_builder import active_build_directory, build_vector_kb, close_client, default_root, open_store
+
+logger = logging.getLogger(__name__)
+
+class _OpenStore:
+    """
+    The client and collection of one build, and the lookups using them.
+
+    A store replaced by a reload, or shut down, is retired: its client is
+    closed once the last lookup using it has finished.
+    """
+
+    def __init__(self, client, collection):
+        self.client = client
+        self.collection = collection
+        self.readers = 0
+        self.retired = False
+
+_store: Optional[_OpenStore] = None
+_vector_store_lock = threading.Lock()
+
+def _open_collection():
+    """
+    Open the client and collection of the configured vector backend's active
+    build, building the knowledge collection first if there is no usable one.
+    """
+    root = default_root(VECTOR_BACKEND)
+    backend = get_embedding_backend()
+    directory = active_build_directory(root)
+    if directory is not None:
+        try:
+            return open_store(VECTOR_BACKEND, directory, backend)
+        except ValueError as e:
+            # Vectors from another model are not comparable with the query
+            # vectors, so the collection is rebuilt
+            logger.warning(f"Rebuilding vector KB: {str(e)}")
+    else:
+        logger.info(f"No vector KB build in {root}, building one")
+    
+    stats = build_vector_kb(VECTOR_BACKEND, root)
+    return open_store(VECTOR_BACKEND, Path(stats["directory"]), backend)
+
+def _get_store(readers: int = 0) -> _OpenStore:
+    """
+    Get the shared store, opening it on first use, and add readers to it.
+    Must be called with _vector_store_lock held.
+    """
+    global _store
+    if _store is None:
+        start_time = time.perf_counter()
+        _store = _OpenStore(*_open_collection())
+        logger.info(
+            f"Opened {VECTOR_BACKEND} vector store collection {COLLECTION_NAME} in "
+            f"{(time.perf_counter() - start_time) * 1000:.1f} ms"
+        )
+    _store.readers += readers
+    return _store
 
-from app.config import CHROMA_PERSIST_DIRECTORY, COLLECTION_NAME
+def _retire(store: Optional[_OpenStore]):
+    """Close a store that is no longer shared once no lookup is using it."""
+    if store is None:
+        return
+    with _vector_store_lock:
+        store.retired = True
+        idle = store.readers == 0
+    if idle:
+        # Stops the client's system components and closes its database
+        close_client(store.client)
+
+@contextmanager
+def _reading() -> Iterator[Any]:
+    """
+    Use the shared collection for one lookup. A reload or shutdown meanwhile
+    swaps in another store but leaves this one open until the lookup ends.
+    """
+    with _vector_store_lock:
+        store = _get_store(readers=1)
+    try:
+        yield store.collection
+    finally:
+        with _vector_store_lock:
+            store.readers -= 1
+            idle = store.retired and store.readers == 0
+        if idle:
+            close_client(store.client)
+
+def get_collection():
+    """
+    Get the shared collection, opening the vector store on first use.
+
+    The collection may be closed by a later reload; lookups in this module
+    hold it open while they run.
+    """
+    store = _store
+    if store is None:
+        with _vector_store_lock:
+            store = _get_store()
+    return store.collection
 
 def initialize_vector_store():
     """
     Initialize the ChromaDB vector store.
     """
-    # Create the directory if it doesn't exist
-    os.makedirs(CHROMA_PERSIST_DIRECTORY, exist_ok=True)
-    
-    # Initialize the client
-    client = chromadb.PersistentClient(
-        path=CHROMA_PERSIST_DIRECTORY,
-        settings=Settings(anonymized_telemetry=False)
-    )
-    
-    # Get or create the collection
+    return get_collection()
+
+def reload_vector_store() -> Dict[str, Any]:
+    """
+    Rebuild the knowledge collection into a fresh directory, make it the
+    active build and switch the shared collection over to it.
+
+    Lookups keep using the previous build until the new one is complete and
+    open; lookups already running on it finish before it is closed.
+
+    Returns:
+        Build statistics from app.services.kb_builder.build_vector_kb
+    """
+    global _store
+    stats = build_vector_kb(VECTOR_BACKEND, default_root(VECTOR_BACKEND))
+    store = _OpenStore(*open_store(VECTOR_BACKEND, Path(stats["directory"]), get_embedding_backend()))
+    with _vector_store_lock:
+        previous, _store = _store, store
+    _retire(previous)
+    return stats
+
+def vector_store_health() -> Dict[str, Any]:
+    """
+    Check that the vector store answers.
+
+    Opens the store if it is not open yet. A store that fails the check is
+    closed, so the next lookup opens it again.
+
+    Returns:
+        Dictionary with the status, the number of documents in the
+        collection and the check latency, or the error
+    """
+    start_time = time.perf_counter()
     try:
-        collection = client.get_collection(COLLECTION_NAME)
-    except Exception as e:  # Change this line to catch all exceptions
-        # Collection doesn't exist, create it
-        collection = client.create_collection(COLLECTION_NAME)
-        
-        # Populate with some initial data (in a real app, this would be more extensive)
-        populate_initial_data(collection)
-    
-    return collection
-
-def populate_initial_data(collection):
-    """
-    Populate the vector store with initial data.
-    """
-    # Add common skills with related skills
-    skills_data = [
-        {
-            "skill": "Python",
-            "related_skills": "NumPy, Pandas, Scikit-learn, TensorFlow, PyTorch, Django, Flask",
-            "category": "Programming Language"
-        },
-        {
-            "skill": "Machine Learning",
-            "related_skills": "Deep Learning, Neural Networks, NLP, Computer Vision, Regression, Classification",
-            "category": "AI/Data Science"
-        },
-        {
-            "skill": "AWS",
-            "related_skills": "EC2, S3, Lambda, DynamoDB, CloudFormation, SageMaker",
-            "category": "Cloud"
-        },
-        {
-            "skill": "Docker",
-            "related_skills": "Kubernetes, Containerization, Microservices, CI/CD, DevOps",
-            "category": "DevOps"
-        },
-        {
-            "skill": "JavaScript",
-            "related_skills": "TypeScript, React, Angular, Vue.js, Node.js, Express.js",
-            "category": "Web Development"
-        }
-    ]
-    
-    # Add industry standards
-    industry_standards = [
-        {
-            "industry": "Software Engineering",
-            "standards": "Clean, ATS-friendly format. Include: languages, frameworks, methodologies. Highlight metrics and achievements. Include GitHub, personal projects."
-        },
-        {
-            "industry": "Data Science",
-            "standards": "Lead with technical skills (Python, R, ML libraries). Highlight impactful projects with measurable results. Include domain expertise and visualization skills."
-        },
-        {
-            "industry": "Cloud Engineering",
-            "standards": "Focus on cloud platforms (AWS/Azure/GCP), certifications, infrastructure as code, security, and cost optimization experience. Include architecture diagrams if possible."
-        },
-        {
-            "industry": "Full Stack Development",
-            "standards": "Balance frontend and backend skills. Show end-to-end project experience. Highlight performance optimization, responsive design, and API development."
-        }
-    ]
-    
-    # Add to collection
-    collection.add(
-        documents=[json.dumps(item) for item in skills_data],
-        metadatas=[{"type": "skill_data"} for _ in skills_data],
-        ids=[f"skill_{i}" for i in range(len(skills_data))]
-    )
-    
-    collection.add(
-        documents=[json.dumps(item) for item in industry_standards],
-        metadatas=[{"type": "industry_standard"} for _ in industry_standards],
-        ids=[f"industry_{i}" for i in range(len(industry_standards))]
-    )
+        # Counting reads the collection from the database
+        with _reading() as collection:
+            count = collection.count()
+    except Exception as e:
+        logger.warning(f"Vector store health check failed: {str(e)}")
+        shutdown_vector_store()
+        return {"status": "unhealthy", "error": str(e)}
+    return {
+        "status": "healthy",
+        "collection": COLLECTION_NAME,
+        "documents": count,
+        "latency_ms": round((time.perf_counter() - start_time) * 1000, 3),
+        "embedding_cache": embedding_cache_stats()
+    }
+
+def shutdown_vector_store():
+    """Release the shared client and collection, and persist cached embeddings."""
+    global _store
+    flush_embedding_cache()
+    with _vector_store_lock:
+        store, _store = _store, None
+    _retire(store)
+
+def _skill_record(document: str, distance: Optional[float] = None) -> Dict[str, Any]:
+    """Turn a stored skill document into a similar-skill result."""
+    skill_data = json.loads(document)
+    record = {
+        "skill": skill_data.get("skill"),
+        "related_skills": [s.strip() for s in skill_data.get("related_skills", "").split(",") if s.strip()],
+        "category": skill_data.get("category", "Unknown")
+    }
+    if distance is not None:
+        record["distance"] = distance
+    return record
 
 def get_similar_skills(skill: str) -> Dict[str, Any]:
     """
@@ -110,14 +210,13 @@ def get_similar_skills(skill: str) -> Dict[str, Any]:
     Returns:
         Dictionary with related skills information
     """
-    collection = initialize_vector_store()
-    
     # Query the collection for similar skills
-    results = collection.query(
-        query_texts=[skill],
-        n_results=1,
-        where={"type": "skill_data"}
-    )
+    with _reading() as collection:
+        results = collection.query(
+            query_texts=[skill],
+            n_results=1,
+            where={"type": "skill_data"}
+        )
     
     if not results["documents"] or not results["documents"][0]:
         return {
@@ -127,16 +226,59 @@ def get_similar_skills(skill: str) -> Dict[str, Any]:
         }
     
     # Parse the result
-    skill_data = json.loads(results["documents"][0][0])
-    
-    related_skills = [s.strip() for s in skill_data.get("related_skills", "").split(",")]
+    record = _skill_record(results["documents"][0][0])
     
     return {
-        "skill": skill_data.get("skill", skill),
-        "related_skills": related_skills,
-        "category": skill_data.get("category", "Unknown")
+        "skill": record["skill"] or skill,
+        "related_skills": record["related_skills"],
+        "category": record["category"]
     }
 
+def get_similar_skills_many(skills: List[str], k: int = 3) -> List[Dict[str, Any]]:
+    """
+    Find similar or related skills for several skills with one batched query.
+
+    Every distinct skill is embedded and searched in the same collection
+    query instead of one query per skill.
+
+    Args:
+        skills: The skills to find related skills for
+        k: Number of similar skills to return per skill
+        
+    Returns:
+        One dictionary per input skill, in input order, with the skill and
+        its closest stored skills ("similar", closest first)
+    """
+    # Skills differing only in case or spacing share one query text
+    keys = [" ".join(skill.split()).lower() for skill in skills]
+    queries: Dict[str, int] = {}
+    for key in keys:
+        if key:
+            queries.setdefault(key, len(queries))
+    if not queries or k <= 0:
+        return [{"skill": skill, "similar": []} for skill in skills]
+    
+    query_texts = list(queries)
+    with _reading() as collection:
+        results = collection.query(
+            query_texts=query_texts,
+            n_results=k,
+            where={"type": "skill_data"},
+            include=["documents", "distances"]
+        )
+    
+    documents = results.get("documents") or [[] for _ in query_texts]
+    distances = results.get("distances") or [[None] * len(docs) for docs in documents]
+    similar = [
+        [_skill_record(document, distance) for document, distance in zip(docs, dists)]
+        for docs, dists in zip(documents, distances)
+    ]
+    
+    return [
+        {"skill": skill, "similar": similar[queries[key]] if key else []}
+        for skill, key in zip(skills, keys)
+    ]
+
 def get_industry_standards(industry: str) -> Dict[str, Any]:
     """
     Get industry standards for resumes in a specific field.
@@ -147,14 +289,13 @@ def get_industry_standards(industry: str) -> Dict[str, Any]:
     Returns:
         Dictionary with industry standards information
     """
-    collection = initialize_vector_store()
-    
     # Query the collection for industry standards
-    results = collection.query(
-        query_texts=[industry],
-        n_results=1,
-        where={"type": "industry_standard"}
-    )
+    with _reading() as collection:
+        results = collection.query(
+            query_texts=[industry],
+            n_results=1,
+            where={"type": "industry_standard"}
+        )
     
     if not results["documents"] or not results["documents"][0]:
         return {
@@ -0,0 +1,59 @@
+"""
+Benchmark the streaming DOCX reader against python-docx.
+
+Usage:
+    python -m benchmarks.bench_docx_reader [paragraph counts...]
+"""
+import sys
+import time
+import tracemalloc
+from io import BytesIO
+
+import docx
+
+from app.services.docx_reader import read_docx_text
+
+def build_docx(paragraphs: int) -> bytes:
+    """Build a resume-like DOCX with the given number of paragraphs."""
+    document = docx.Document()
+    for i in range(paragraphs):
+        paragraph = document.add_paragraph(f"Role {i}: Senior Engineer at Company {i}, 01/2015 - 12/2018. ")
+        paragraph.add_run("Built data pipelines in Python, SQL and Spark; ").bold = True
+        paragraph.add_run("led a team of five engineers.\tKubernetes, Docker, AWS.")
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+def python_docx_text(content: bytes) -> str:
+    document = docx.Document(BytesIO(content))
+    return "\n".join(p.text for p in document.paragraphs)
+
+def measure(func, content: bytes, repeat: int = 3):
+    """Return (best wall time in seconds, peak traced memory in bytes, result)."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(content)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+def main(sizes):
+    print(f"{'paragraphs':>10} {'size KB':>8} {'python-docx ms':>15} {'streaming ms':>13} {'speedup':>8} {'python-docx MB':>15} {'streaming MB':>13}")
+    for paragraphs in sizes:
+        content = build_docx(paragraphs)
+        docx_time, docx_peak, expected = measure(python_docx_text, content)
+        stream_time, stream_peak, actual = measure(read_docx_text, content)
+        assert actual == expected, "streaming reader output differs from python-docx"
+        print(
+            f"{paragraphs:>10} {len(content) // 1024:>8} {docx_time * 1000:>15.1f} {stream_time * 1000:>13.1f} "
+            f"{docx_time / stream_time:>7.1f}x {docx_peak / 2**20:>15.1f} {stream_peak / 2**20:>13.1f}"
+        )
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 5000, 20000])
@@ -0,0 +1,77 @@
+"""
+Benchmark extract_experience on synthetic resumes with many roles.
+
+The previous implementation, which re-searched for the next job header
+after every match, is kept here as the baseline.
+
+Usage:
+    python -m benchmarks.bench_extract_experience [role counts...]
+"""
+import random
+import re
+import sys
+import time
+
+from app.services.parser import extract_experience
+
+LEGACY_JOB_PATTERN = re.compile(
+    r"(?P<company>[\w\s&.,]+?),?\s+(?P<title>[\w\s&.,]+?),?\s+(?P<dates>\d{1,2}/\d{4}\s*[-–]\s*(?:\d{1,2}/\d{4}|Present))",
+    re.IGNORECASE
+)
+
+def legacy_find_jobs(experiences_text: str):
+    jobs = []
+    for match in LEGACY_JOB_PATTERN.finditer(experiences_text):
+        start_pos = match.end()
+        next_match = LEGACY_JOB_PATTERN.search(experiences_text, start_pos)
+        end_pos = next_match.start() if next_match else len(experiences_text)
+        jobs.append({
+            "company": match.group("company").strip(),
+            "title": match.group("title").strip(),
+            "dates": match.group("dates").strip(),
+            "description": experiences_text[start_pos:end_pos].strip()
+        })
+    return jobs
+
+WORDS = (
+    "built scalable data pipelines services for customers and partners using Python SQL Kafka "
+    "improved latency reliability by migrating legacy systems to Kubernetes on AWS with the team"
+).split()
+
+def build_resume(roles: int, seed: int = 0) -> str:
+    """Build an experience section with the given number of roles."""
+    rng = random.Random(seed)
+    entries = []
+    for i in range(roles):
+        year = 2024 - i
+        sentences = [
+            " ".join(rng.choices(WORDS, k=rng.randint(12, 24))).capitalize() + "."
+            for _ in range(rng.randint(2, 5))
+        ]
+        entries.append(
+            f"Company {i} Inc, Senior Engineer {i}, {rng.randint(1, 12):02d}/{year - 1} - {rng.randint(1, 12):02d}/{year}\n"
+            + "\n".join(sentences)
+        )
+    return "Work Experience:\n" + "\n".join(entries) + "\n\nEducation:\nBachelor of Science, State University, 09/2000 - 06/2004\n"
+
+def timed(func, *args, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main(role_counts):
+    print(f"{'roles':>6} {'chars':>8} {'legacy ms':>10} {'current ms':>11} {'speedup':>8}")
+    for roles in role_counts:
+        resume = build_resume(roles)
+        experiences_text = resume.split("Work Experience:\n", 1)[1].split("\n\n", 1)[0]
+        legacy_time, expected = timed(legacy_find_jobs, experiences_text)
+        current_time, actual = timed(extract_experience, resume)
+        assert actual == expected, "extract_experience output differs from the legacy implementation"
+        assert len(actual) == roles
+        print(f"{roles:>6} {len(resume):>8} {legacy_time * 1000:>10.1f} {current_time * 1000:>11.1f} {legacy_time / current_time:>7.1f}x")
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10, 50, 100, 200])
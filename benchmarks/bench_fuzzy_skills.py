@@ -0,0 +1,96 @@
+"""
+Benchmark typo-tolerant skill lookups: the deletion index in
+app.services.fuzzy_skills against computing the edit distance to every
+vocabulary term.
+
+Usage:
+    python -m benchmarks.bench_fuzzy_skills [vocabulary sizes...]
+"""
+import random
+import string
+import sys
+import time
+import tracemalloc
+
+from app.services.fuzzy_skills import FuzzySkillIndex, allowed_distance, edit_distance
+
+QUERIES = 1000
+# The linear scan is slow, so it only runs on a sample of the queries
+SCAN_QUERIES = 50
+
+def build_vocabulary(size: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    vocabulary = set()
+    while len(vocabulary) < size:
+        vocabulary.add(" ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(rng.randint(1, 3))))
+    return sorted(vocabulary)
+
+def misspell(term: str, rng: random.Random) -> str:
+    """Apply one or two random edits: insert, delete, substitute or transpose."""
+    chars = list(term)
+    for _ in range(rng.randint(1, 2)):
+        position = rng.randrange(len(chars))
+        edit = rng.randrange(4)
+        if edit == 0:
+            chars.insert(position, rng.choice(string.ascii_lowercase))
+        elif edit == 1 and len(chars) > 1:
+            del chars[position]
+        elif edit == 2:
+            chars[position] = rng.choice(string.ascii_lowercase)
+        elif position + 1 < len(chars):
+            chars[position], chars[position + 1] = chars[position + 1], chars[position]
+    return "".join(chars)
+
+def build_index(vocabulary) -> FuzzySkillIndex:
+    index = FuzzySkillIndex()
+    index.add_many((term, term_id) for term_id, term in enumerate(vocabulary))
+    return index
+
+def scan(vocabulary, term):
+    matches = []
+    for candidate in vocabulary:
+        if candidate[0] != term[0]:
+            continue
+        limit = min(allowed_distance(len(term)), allowed_distance(len(candidate)))
+        distance = edit_distance(term, candidate, limit)
+        if distance <= limit:
+            matches.append((candidate, distance))
+    return sorted(matches, key=lambda item: (item[1], item[0]))
+
+def main(sizes):
+    print(f"{'terms':>8} {'build s':>8} {'index MB':>9} {'scan us':>10} {'index us':>9} {'hit rate':>9}")
+    for size in sizes:
+        vocabulary = build_vocabulary(size)
+        rng = random.Random(1)
+        queries = [misspell(rng.choice(vocabulary), rng) for _ in range(QUERIES)]
+
+        # Tracing allocations slows the build down, so it is timed separately
+        tracemalloc.start()
+        traced_index = build_index(vocabulary)
+        index_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del traced_index
+
+        start_time = time.perf_counter()
+        index = build_index(vocabulary)
+        build_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        results = [index.lookup(query) for query in queries]
+        index_time = (time.perf_counter() - start_time) / len(queries)
+
+        start_time = time.perf_counter()
+        expected = [scan(vocabulary, query) for query in queries[:SCAN_QUERIES]]
+        scan_time = (time.perf_counter() - start_time) / SCAN_QUERIES
+
+        for found, scanned in zip(results, expected):
+            assert [(term, distance) for term, _, distance in found] == scanned, "index and scan results differ"
+
+        hit_rate = sum(1 for found in results if found) / len(results)
+        print(
+            f"{size:>8} {build_time:>8.2f} {index_bytes / 2**20:>9.1f} {scan_time * 1e6:>10.0f} "
+            f"{index_time * 1e6:>9.1f} {hit_rate:>8.0%}"
+        )
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000])
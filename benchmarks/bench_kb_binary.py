@@ -0,0 +1,65 @@
+"""
+Benchmark loading the skills knowledge base from the binary format against
+the JSON index, for synthetic taxonomies of increasing size.
+
+Usage:
+    python -m benchmarks.bench_kb_binary [skill counts...]
+"""
+import json
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app.services.kb_binary import read_skills_kb, write_skills_kb
+from app.services.skills_kb import build_skills_index
+
+SKILLS_PER_CATEGORY = 20
+
+def build_relationships(size: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < size:
+        names.add(" ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(rng.randint(1, 3))).title())
+    names = sorted(names)
+    return {
+        f"Category {i // SKILLS_PER_CATEGORY}": names[i:i + SKILLS_PER_CATEGORY]
+        for i in range(0, len(names), SKILLS_PER_CATEGORY)
+    }
+
+def timed(func, *args, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def load_json(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+def main(sizes):
+    print(f"{'skills':>8} {'json KB':>9} {'binary KB':>10} {'json ms':>8} {'binary ms':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            skill_index = build_skills_index(build_relationships(size))
+            json_path = Path(directory) / f"index-{size}.json"
+            binary_path = Path(directory) / f"kb-{size}.bin"
+            with open(json_path, "w") as f:
+                json.dump(skill_index, f, indent=2)
+            write_skills_kb(binary_path, skill_index, {})
+
+            json_time, from_json = timed(load_json, json_path)
+            binary_time, (from_binary, _) = timed(read_skills_kb, binary_path)
+            assert from_binary == from_json, "binary KB does not round-trip"
+            print(
+                f"{size:>8} {os.path.getsize(json_path) / 1024:>9.0f} {os.path.getsize(binary_path) / 1024:>10.0f} "
+                f"{json_time * 1000:>8.1f} {binary_time * 1000:>10.1f}"
+            )
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000])
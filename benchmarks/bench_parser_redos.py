@@ -0,0 +1,129 @@
+"""
+Fuzz the resume and job description parsers with adversarial inputs and
+assert a worst-case parse time.
+
+Each generator builds inputs that target backtracking in one of the
+parsing patterns (lazy entry headers with no usable date, long words before
+dates, digit runs followed by whitespace, repeated section headers, ...),
+plus randomly mutated resumes. Every input is parsed end to end with
+StructuredAnalyzer and the slowest case per generator is reported.
+
+Usage:
+    python -m benchmarks.bench_parser_redos [--size CHARS] [--rounds N] [--max-seconds S]
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+
+from app.config import PARSER_HARDENED, PARSER_MAX_INPUT_CHARS, PARSER_TIME_BUDGET_SECONDS
+from app.services.structured_analyzer import StructuredAnalyzer
+
+SAMPLE_RESUME = """Jane Doe
+Summary: Backend engineer
+
+Technical Skills: Python, SQL, Docker, Kubernetes | AWS
+
+Work Experience:
+Acme Corp, Senior Engineer, 01/2019 - Present
+Built data pipelines and APIs.
+Beta LLC, Engineer, 02/2015 - 12/2018
+Maintained services.
+
+Education:
+Bachelor of Science, State University, 09/2011 - 06/2015
+"""
+
+SAMPLE_JOB = """Requirements:
+- Experience with Python and SQL
+- Knowledge of Kubernetes
+
+You have: strong communication skills, 3+ years experience
+"""
+
+def repeat_to(unit: str, size: int) -> str:
+    return (unit * (size // max(len(unit), 1) + 1))[:size]
+
+def entry_without_spaced_date(size, rng):
+    # Lazy company/title groups with a date that is not preceded by whitespace
+    return "Experience: " + repeat_to("a ", size) + "x01/2019 - Present", SAMPLE_JOB
+
+def long_word_before_date(size, rng):
+    return "Experience: " + "a" * size + " 01/2019 - Present", SAMPLE_JOB
+
+def degree_without_date(size, rng):
+    return "Education: " + repeat_to("Bachelor ", size), SAMPLE_JOB
+
+def degree_without_spaced_date(size, rng):
+    return "Education: Bachelor " + repeat_to("a ", size) + "x01/2019 - Present", SAMPLE_JOB
+
+def digits_then_whitespace(size, rng):
+    # Fallback experience lines: \d{4}\s*[-–] over digit runs followed by spaces
+    return "Experience: " + "1" * (size // 2) + " " * (size // 2) + "x", SAMPLE_JOB
+
+def many_short_entries(size, rng):
+    entry = "Co, T, 01/2019 - Present\n"
+    return "Experience: " + repeat_to(entry, size), SAMPLE_JOB
+
+def repeated_headers(size, rng):
+    return repeat_to("skills: experience: education: ", size), SAMPLE_JOB
+
+def job_description_phrases(size, rng):
+    job = repeat_to("experience with a" + "b" * 5 + " ", size // 2)
+    job += repeat_to("".join(f"knowledge of tool{i}, " for i in range(size // 20)), size // 2)
+    return SAMPLE_RESUME, job
+
+def job_description_bullets(size, rng):
+    return SAMPLE_RESUME, "skills: " + repeat_to("-" + " " * 7, size) + "\n"
+
+def mutated_resume(size, rng):
+    pieces = list(SAMPLE_RESUME)
+    alphabet = " \n,./-–&:0123456789aB"
+    while len(pieces) < size:
+        index = rng.randrange(len(pieces))
+        pieces[index:index] = rng.choice(alphabet) * rng.randint(1, 64)
+    return "".join(pieces[:size]), SAMPLE_JOB
+
+GENERATORS = [
+    entry_without_spaced_date, long_word_before_date, degree_without_date,
+    degree_without_spaced_date, digits_then_whitespace, many_short_entries,
+    repeated_headers, job_description_phrases, job_description_bullets, mutated_resume,
+]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=PARSER_MAX_INPUT_CHARS, help="Adversarial input size in characters")
+    parser.add_argument("--rounds", type=int, default=3, help="Inputs generated per generator")
+    parser.add_argument("--max-seconds", type=float, default=PARSER_TIME_BUDGET_SECONDS * 2 + 1,
+                        help="Fail if any single document takes longer than this")
+    args = parser.parse_args()
+    # Leave room for the fixed parts of each input, so the payload is not truncated
+    size = max(args.size - 200, 100)
+    # Truncation and budget warnings are expected here
+    logging.disable(logging.WARNING)
+
+    if not PARSER_HARDENED:
+        print("Warning: PARSER_HARDENED is off; worst-case times are unbounded")
+
+    analyzer = StructuredAnalyzer()
+    rng = random.Random(0)
+    worst_overall = 0.0
+
+    print(f"{'generator':>28} {'chars':>8} {'worst ms':>9}")
+    for generator in GENERATORS:
+        worst = 0.0
+        for _ in range(args.rounds):
+            resume, job = generator(size, rng)
+            start = time.perf_counter()
+            analyzer.analyze_resume(resume, job)
+            worst = max(worst, time.perf_counter() - start)
+        worst_overall = max(worst_overall, worst)
+        print(f"{generator.__name__:>28} {len(resume) + len(job):>8} {worst * 1000:>9.1f}")
+
+    print(f"worst case: {worst_overall * 1000:.1f} ms (limit {args.max_seconds * 1000:.0f} ms)")
+    if worst_overall > args.max_seconds:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
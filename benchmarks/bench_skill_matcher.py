@@ -0,0 +1,53 @@
+"""
+Benchmark the Aho-Corasick skill matcher against one regex search per skill.
+
+Usage:
+    python -m benchmarks.bench_skill_matcher [vocabulary sizes...]
+"""
+import random
+import re
+import string
+import sys
+import time
+
+from app.services.skill_matcher import SkillMatcher
+
+RESUME = (
+    "Senior engineer with 8 years of Python, SQL and Machine Learning experience. "
+    "Built Kubernetes platforms on AWS, data pipelines with Apache Spark and Kafka, "
+    "and React front ends. Mentored engineers; led migrations from Java to Go.\n"
+) * 20
+
+def build_vocabulary(size: int, seed: int = 0) -> list:
+    """Generate distinct one- to three-word skill names, including a few real ones."""
+    rng = random.Random(seed)
+    vocabulary = {"Python", "SQL", "Machine Learning", "Kubernetes", "AWS", "Apache Spark", "Kafka", "React", "Go"}
+    while len(vocabulary) < size:
+        words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(rng.randint(1, 3))]
+        vocabulary.add(" ".join(words).title())
+    return sorted(vocabulary)
+
+def regex_find(vocabulary, text):
+    return {skill for skill in vocabulary if re.search(r"\b" + re.escape(skill) + r"\b", text, re.IGNORECASE)}
+
+def timed(func, *args, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main(sizes):
+    print(f"{'vocabulary':>10} {'build ms':>9} {'regex ms':>9} {'matcher ms':>11} {'speedup':>8}")
+    for size in sizes:
+        vocabulary = build_vocabulary(size)
+        matcher = SkillMatcher(vocabulary)
+        build_time, _ = timed(matcher._get_automaton, repeat=1)
+        regex_time, expected = timed(regex_find, vocabulary, RESUME)
+        match_time, found = timed(matcher.find, RESUME)
+        assert set(found) == expected, "matcher and regex results differ"
+        print(f"{size:>10} {build_time * 1000:>9.1f} {regex_time * 1000:>9.1f} {match_time * 1000:>11.1f} {regex_time / match_time:>7.1f}x")
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1000, 5000])
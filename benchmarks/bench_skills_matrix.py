@@ -0,0 +1,51 @@
+"""
+Benchmark batch skill matching with the sparse skills matrix against calling
+skills_kb.match_skills once per resume/job pair.
+
+Usage:
+    python -m benchmarks.bench_skills_matrix [batch sizes...]
+"""
+import random
+import sys
+import time
+
+from app.services.skills_kb import SKILLS_RELATIONSHIPS, match_skills
+from app.services.skills_matrix import get_skills_matrix
+
+SKILLS = sorted({skill for skills in SKILLS_RELATIONSHIPS.values() for skill in skills} | set(SKILLS_RELATIONSHIPS))
+# Job skills that are not in the index, or only partially match it
+OTHER_SKILLS = ["Golang", "AWS Lambda", "Senior Python Developer", "Kube", "Communication", "Leadership"]
+
+def skill_sets(count: int, size: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [rng.sample(SKILLS, size - 2) + rng.sample(OTHER_SKILLS, 2) for _ in range(count)]
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+def main(sizes):
+    matrix = get_skills_matrix()
+    print(f"{'batch':>7} {'shape':>13} {'loop ms':>9} {'matrix ms':>10} {'speedup':>8}")
+    for size in sizes:
+        resumes = skill_sets(size, 20, seed=1)
+        jobs = skill_sets(size, 12, seed=2)
+
+        loop_time, expected = timed(lambda: [match_skills(resumes[0], job) for job in jobs])
+        matrix_time, results = timed(matrix.match_one_to_many, resumes[0], jobs)
+        assert results == expected, "one-to-many results differ from match_skills"
+        print(f"{size:>7} {'1 x ' + str(size):>13} {loop_time * 1000:>9.1f} {matrix_time * 1000:>10.1f} {loop_time / matrix_time:>7.1f}x")
+
+        loop_time, expected = timed(lambda: [match_skills(resume, jobs[0]) for resume in resumes])
+        matrix_time, results = timed(matrix.match_many_to_one, resumes, jobs[0])
+        assert results == expected, "many-to-one results differ from match_skills"
+        print(f"{size:>7} {str(size) + ' x 1':>13} {loop_time * 1000:>9.1f} {matrix_time * 1000:>10.1f} {loop_time / matrix_time:>7.1f}x")
+
+        loop_time, expected = timed(lambda: [[match_skills(resume, job)["match_percentage"] for job in jobs[:100]] for resume in resumes])
+        matrix_time, scores = timed(matrix.score, resumes, jobs[:100])
+        assert (abs(scores - expected) <= 0.05 + 1e-9).all(), "scores differ from match_skills"
+        print(f"{size:>7} {str(size) + ' x 100':>13} {loop_time * 1000:>9.1f} {matrix_time * 1000:>10.1f} {loop_time / matrix_time:>7.1f}x")
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000])
@@ -0,0 +1,90 @@
+"""
+Benchmark partial skill lookups: the inverted index in
+app.services.skills_search against a linear scan over every skill name.
+
+Usage:
+    python -m benchmarks.bench_skills_search [vocabulary sizes...]
+"""
+import random
+import string
+import sys
+import time
+import tracemalloc
+
+from app.services.skills_search import SkillSearchIndex
+
+QUERIES_PER_SIZE = 500
+
+def build_vocabulary(size: int, seed: int = 0) -> list:
+    """Generate distinct lowercase one- to three-word skill names."""
+    rng = random.Random(seed)
+    vocabulary = {"python", "r", "go", "machine learning", "postgresql", "kubernetes", "ci/cd"}
+    while len(vocabulary) < size:
+        words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(rng.randint(1, 3))]
+        vocabulary.add(" ".join(words))
+    return sorted(vocabulary)
+
+def build_queries(vocabulary: list, count: int, seed: int = 1) -> list:
+    """Mix word prefixes, single words, longer phrases around a name, and misses."""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        name = rng.choice(vocabulary)
+        word = rng.choice(name.split())
+        kind = rng.randrange(4)
+        if kind == 0:
+            queries.append(word[:max(3, len(word) - 2)])
+        elif kind == 1:
+            queries.append(word)
+        elif kind == 2:
+            queries.append(f"senior {name} engineer")
+        else:
+            queries.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))))
+    return queries
+
+def linear_first(names, query):
+    """The lookup skills_kb used before the index: first partial match in index order."""
+    for name in names:
+        if query in name or name in query:
+            return name
+    return ""
+
+def linear_all(names, query):
+    """Every partial match, which a linear scan must collect to rank results."""
+    return [name for name in names if query in name or name in query]
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+def main(sizes):
+    print(
+        f"{'skills':>8} {'build ms':>9} {'index MB':>9} {'scan first us':>14} "
+        f"{'scan all us':>12} {'index us':>9} {'speedup':>8}"
+    )
+    for size in sizes:
+        vocabulary = build_vocabulary(size)
+        queries = build_queries(vocabulary, QUERIES_PER_SIZE)
+
+        tracemalloc.start()
+        build_time, index = timed(SkillSearchIndex, vocabulary)
+        index_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        first_time, _ = timed(lambda: [linear_first(vocabulary, q) for q in queries])
+        all_time, expected = timed(lambda: [set(linear_all(vocabulary, q)) for q in queries])
+        index_time, results = timed(lambda: [index.search(q, limit=len(vocabulary)) for q in queries])
+
+        # Every indexed result is a partial match the scan also finds
+        for query, found, scanned in zip(queries, results, expected):
+            assert {name for name, _ in found} <= scanned, f"unexpected result for {query!r}"
+
+        per_query = 1e6 / len(queries)
+        print(
+            f"{size:>8} {build_time * 1000:>9.1f} {index_bytes / 2**20:>9.1f} {first_time * per_query:>14.1f} "
+            f"{all_time * per_query:>12.1f} {index_time * per_query:>9.1f} {all_time / index_time:>7.1f}x"
+        )
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10000, 100000])
@@ -0,0 +1,137 @@
+"""
+Benchmark the in-process NumPy vector index against a persistent Chroma
+collection holding the same vectors.
+
+Documents are embedded once with the hashing backend and both stores get the
+same vectors, so the timings cover indexing and search only. Chroma is
+skipped when it is not installed.
+
+Usage:
+    python -m benchmarks.bench_vector_index [collection sizes...]
+"""
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.services.embeddings import create_embedding_backend, embed_texts
+from app.services.vector_index import NumpyVectorIndex
+
+QUERIES = 200
+TOP_K = 5
+BATCH_QUERIES = 32
+
+def build_documents(size: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(5000)]
+    return [" ".join(rng.choices(words, k=rng.randint(5, 20))) for _ in range(size)]
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+def query_latency(query, vectors: np.ndarray) -> float:
+    """Mean seconds per single-vector query with a metadata filter."""
+    start = time.perf_counter()
+    for vector in vectors:
+        query(query_embeddings=vector[None, :].tolist(), n_results=TOP_K, where={"type": "skill_data"})
+    return (time.perf_counter() - start) / len(vectors)
+
+def bench_numpy(backend, ids, documents, metadatas, vectors, queries, directory: Path) -> dict:
+    index = NumpyVectorIndex(backend, directory)
+    add_time, _ = timed(index.add, ids, documents, metadatas, embeddings=vectors)
+    save_time, _ = timed(index.save)
+    load_time, index = timed(NumpyVectorIndex.load, directory, backend)
+    # The first query pages in the memory-mapped vectors and builds the filter cache
+    index.query(query_embeddings=queries[:1], n_results=TOP_K, where={"type": "skill_data"})
+    batch_time, results = timed(
+        index.query, query_embeddings=queries[:BATCH_QUERIES], n_results=TOP_K, where={"type": "skill_data"}
+    )
+    return {
+        "build": add_time + save_time,
+        "open": load_time,
+        "query": query_latency(index.query, queries),
+        "batch": batch_time,
+        "ids": results["ids"],
+    }
+
+def bench_chroma(ids, documents, metadatas, vectors, queries, directory: Path):
+    try:
+        import chromadb
+        from chromadb.config import Settings
+    except ImportError:
+        return None
+
+    settings = Settings(anonymized_telemetry=False)
+    client = chromadb.PersistentClient(path=str(directory), settings=settings)
+    collection = client.create_collection("bench", metadata={"hnsw:space": "cosine"})
+    max_batch = getattr(client, "get_max_batch_size", lambda: 5000)()
+    start = time.perf_counter()
+    for offset in range(0, len(ids), max_batch):
+        end = offset + max_batch
+        collection.add(
+            ids=ids[offset:end], documents=documents[offset:end],
+            metadatas=metadatas[offset:end], embeddings=vectors[offset:end].tolist()
+        )
+    build_time = time.perf_counter() - start
+    if hasattr(client, "clear_system_cache"):
+        client.clear_system_cache()
+
+    start = time.perf_counter()
+    client = chromadb.PersistentClient(path=str(directory), settings=settings)
+    collection = client.get_collection("bench")
+    open_time = time.perf_counter() - start
+    collection.query(query_embeddings=queries[:1].tolist(), n_results=TOP_K, where={"type": "skill_data"})
+    batch_time, results = timed(
+        collection.query, query_embeddings=queries[:BATCH_QUERIES].tolist(), n_results=TOP_K, where={"type": "skill_data"}
+    )
+    result = {
+        "build": build_time,
+        "open": open_time,
+        "query": query_latency(collection.query, queries),
+        "batch": batch_time,
+        "ids": results["ids"],
+    }
+    if hasattr(client, "clear_system_cache"):
+        client.clear_system_cache()
+    return result
+
+def main(sizes):
+    backend = create_embedding_backend("hashing")
+    print(
+        f"{'vectors':>8} {'store':>6} {'build s':>8} {'open ms':>8} {'query us':>9} "
+        f"{'batch ms':>9} {'recall@' + str(TOP_K):>9}"
+    )
+    for size in sizes:
+        documents = build_documents(size)
+        ids = [f"doc_{i}" for i in range(size)]
+        # Half of the documents match the filter used by the queries
+        metadatas = [{"type": "skill_data" if i % 2 else "industry_standard"} for i in range(size)]
+        vectors = embed_texts(documents, backend)
+        rng = random.Random(1)
+        queries = embed_texts([" ".join(rng.choice(documents).split()[:4]) for _ in range(QUERIES)], backend)
+
+        with tempfile.TemporaryDirectory() as directory:
+            exact = bench_numpy(backend, ids, documents, metadatas, vectors, queries, Path(directory) / "numpy")
+            chroma = bench_chroma(ids, documents, metadatas, vectors, queries, Path(directory) / "chroma")
+
+        for store, result in (("numpy", exact), ("chroma", chroma)):
+            if result is None:
+                print(f"{size:>8} {store:>6} {'chromadb is not installed':>48}")
+                continue
+            recall = np.mean([
+                len(set(found) & set(expected)) / len(expected)
+                for found, expected in zip(result["ids"], exact["ids"]) if expected
+            ])
+            print(
+                f"{size:>8} {store:>6} {result['build']:>8.2f} {result['open'] * 1000:>8.1f} "
+                f"{result['query'] * 1e6:>9.0f} {result['batch'] * 1000:>9.1f} {recall:>9.2f}"
+            )
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000])
@@ -0,0 +1,53 @@
+"""
+Tests that pooled and inline bulk parsing give the same results.
+"""
+import json
+
+import pytest
+
+from app.services import batch_parser
+from app.services.skills_kb import reload_skills_index
+
+RESUME = """Jane Doe
+
+Skills
+LangChain, RAG, Hugging Face, Kubernetes, XGBoost, Zorblax
+
+Experience
+ML Engineer at Acme Corp (2019 - 2023)
+Built RAG pipelines with LangChain and served XGBoost models on Kubernetes.
+
+Education
+BSc Computer Science, State University, 2018
+"""
+
+def _parse_both(texts, monkeypatch):
+    monkeypatch.setattr(batch_parser, "BATCH_PARSE_MIN_DOCUMENTS", 2)
+    inline = list(batch_parser.parse_many(texts, max_workers=1))
+    pooled = list(batch_parser.parse_many(texts, max_workers=2))
+    return inline, pooled
+
+def _fields(parsed):
+    return parsed.skills, parsed.experience, parsed.education, parsed.skill_terms
+
+@pytest.fixture
+def custom_kb(tmp_path):
+    path = tmp_path / "skills_index.json"
+    path.write_text(json.dumps({
+        "zorblax": {"category": "Custom", "related_skills": ["Kubernetes"]},
+        "kubernetes": {"category": "Custom", "related_skills": ["Zorblax"]},
+    }))
+    reload_skills_index(path)
+    yield path
+    reload_skills_index()
+
+def test_pooled_and_inline_parses_match(monkeypatch):
+    texts = [RESUME, RESUME.replace("Jane", "John"), "Python and Go developer", ""]
+    inline, pooled = _parse_both(texts, monkeypatch)
+    assert [_fields(parsed) for parsed in pooled] == [_fields(parsed) for parsed in inline]
+    assert {"LangChain", "RAG", "Hugging Face", "Kubernetes", "XGBoost"} <= set(inline[0].skill_terms)
+
+def test_pooled_workers_use_the_reloaded_kb(custom_kb, monkeypatch):
+    inline, pooled = _parse_both([RESUME, RESUME.replace("Jane", "John")], monkeypatch)
+    assert [_fields(parsed) for parsed in pooled] == [_fields(parsed) for parsed in inline]
+    assert "zorblax" in inline[0].skill_terms
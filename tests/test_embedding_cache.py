@@ -0,0 +1,91 @@
+"""
+Tests of the embedding cache: lookups through CachedEmbeddingFunction, the
+LRU bound and persistence across instances.
+"""
+import time
+
+import numpy as np
+
+from app.services.embedding_cache import (
+    KEYS_FILE, VECTORS_FILE, CachedEmbeddingFunction, EmbeddingCache, embedding_key
+)
+from app.services.embeddings import HashingEmbeddingFunction
+
+class CountingFunction:
+    """Embedding function that records the texts it is asked to embed."""
+
+    def __init__(self):
+        self.function = HashingEmbeddingFunction(dim=32)
+        self.calls = []
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        return self.function.embed(texts)
+
+def vectors(texts):
+    return HashingEmbeddingFunction(dim=32).embed(texts)
+
+def test_only_missing_texts_are_embedded():
+    function = CountingFunction()
+    cached = CachedEmbeddingFunction(function, EmbeddingCache("hashing-32"))
+    first = cached.embed(["Python", "Docker", "Python"])
+    assert function.calls == [["Python", "Docker"]]
+    second = cached.embed(["Docker", "AWS"])
+    assert function.calls == [["Python", "Docker"], ["AWS"]]
+    assert np.array_equal(first, vectors(["Python", "Docker", "Python"]))
+    assert np.array_equal(second, vectors(["Docker", "AWS"]))
+    assert cached(["AWS"]) == vectors(["AWS"]).tolist()
+    assert len(function.calls) == 2
+
+def test_model_id_is_part_of_the_key():
+    assert embedding_key("model-a", "Python") != embedding_key("model-b", "Python")
+    cache = EmbeddingCache("model-a")
+    cache.put_many(["Python"], vectors(["Python"]))
+    assert cache.get_many(["Python"])[0] is not None
+    assert EmbeddingCache("model-b").get_many(["Python"]) == [None]
+
+def test_lru_bound():
+    cache = EmbeddingCache("hashing-32", max_entries=2)
+    cache.put_many(["a", "b"], vectors(["a", "b"]))
+    cache.get_many(["a"])
+    cache.put_many(["c"], vectors(["c"]))
+    assert [vector is not None for vector in cache.get_many(["a", "b", "c"])] == [True, False, True]
+    assert cache.stats()["entries"] == 2
+
+def test_flush_and_reload(tmp_path):
+    texts = ["Python", "Docker", "AWS"]
+    cache = EmbeddingCache("hashing-32", cache_dir=str(tmp_path), flush_every=1000)
+    cache.put_many(texts, vectors(texts))
+    cache.get_many(["Python"])
+    assert not (tmp_path / "hashing-32").exists()
+    cache.flush()
+    assert (tmp_path / "hashing-32" / KEYS_FILE).exists()
+
+    loaded = EmbeddingCache("hashing-32", cache_dir=str(tmp_path))
+    assert loaded.stats()["persisted"]
+    assert all(np.array_equal(a, b) for a, b in zip(loaded.get_many(texts), vectors(texts)))
+    # Entries are loaded in LRU order, so the least recently used is evicted first
+    bounded = EmbeddingCache("hashing-32", max_entries=2, cache_dir=str(tmp_path))
+    assert [embedding_key("hashing-32", text) in bounded.memory for text in texts] == [True, False, True]
+
+    # Another model does not read this model's files
+    assert EmbeddingCache("hashing-64", cache_dir=str(tmp_path)).stats()["entries"] == 0
+
+def test_background_flush(tmp_path):
+    cache = EmbeddingCache("hashing-32", cache_dir=str(tmp_path), flush_every=2)
+    cache.put_many(["Python", "Docker"], vectors(["Python", "Docker"]))
+    keys_path = tmp_path / "hashing-32" / KEYS_FILE
+    deadline = time.monotonic() + 10
+    while not keys_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    with cache._write_lock:
+        assert len(np.load(keys_path)) == 2
+
+def test_inconsistent_files_are_ignored(tmp_path):
+    cache = EmbeddingCache("hashing-32", cache_dir=str(tmp_path))
+    cache.put_many(["Python", "Docker"], vectors(["Python", "Docker"]))
+    cache.flush()
+    np.save(tmp_path / "hashing-32" / VECTORS_FILE, vectors(["Python"]))
+    assert EmbeddingCache("hashing-32", cache_dir=str(tmp_path)).stats()["entries"] == 0
+    (tmp_path / "hashing-32" / KEYS_FILE).write_bytes(b"not an array")
+    assert EmbeddingCache("hashing-32", cache_dir=str(tmp_path)).stats()["entries"] == 0
@@ -0,0 +1,119 @@
+"""
+Tests for the isolated extraction worker pool and how upload handlers map
+its failures to HTTP errors.
+"""
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.services.extraction_pool import ExtractionError, ExtractionLimitExceeded, IsolatedWorkerPool
+from app.services.uploads import UploadTooLarge
+
+# Jobs run in spawned workers, so they must be module-level functions
+
+def echo(value):
+    return value
+
+def sleep_for(seconds):
+    time.sleep(seconds)
+    return seconds
+
+def allocate(megabytes):
+    # Non-zero bytes, so every page is resident
+    block = b"\x01" * (megabytes * 1024 * 1024)
+    time.sleep(30)
+    return len(block)
+
+def crash():
+    os._exit(1)
+
+def fail(message):
+    raise ValueError(message)
+
+@pytest.fixture
+def pool():
+    pool = IsolatedWorkerPool(max_workers=1, timeout_seconds=1.0, max_rss_mb=200)
+    yield pool
+    pool.shutdown()
+
+def _worker_pids(pool):
+    return {worker.process.pid for worker in pool._workers}
+
+def test_runs_job_and_reuses_worker(pool):
+    assert pool.run(echo, "resume") == "resume"
+    pids = _worker_pids(pool)
+    assert pool.run(echo, 42) == 42
+    assert _worker_pids(pool) == pids
+    assert pool.killed_workers == 0
+
+def test_timeout_kills_and_replaces_worker(pool):
+    pool.run(echo, None)
+    pids = _worker_pids(pool)
+    with pytest.raises(ExtractionLimitExceeded) as excinfo:
+        pool.run(sleep_for, 30)
+    assert excinfo.value.reason == "timeout"
+    assert pool.killed_workers == 1
+    assert pool.run(echo, "next") == "next"
+    assert _worker_pids(pool).isdisjoint(pids)
+
+def test_memory_limit_kills_worker(pool):
+    pool.timeout_seconds = 10.0
+    with pytest.raises(ExtractionLimitExceeded) as excinfo:
+        pool.run(allocate, 400)
+    assert excinfo.value.reason == "memory"
+    assert pool.killed_workers == 1
+    assert pool.run(echo, "next") == "next"
+
+def test_crashed_worker_is_replaced(pool):
+    with pytest.raises(ExtractionLimitExceeded) as excinfo:
+        pool.run(crash)
+    assert excinfo.value.reason == "crashed"
+    assert pool.run(echo, "next") == "next"
+
+def test_job_exception_keeps_worker(pool):
+    pool.run(echo, None)
+    pids = _worker_pids(pool)
+    with pytest.raises(ValueError, match="bad page"):
+        pool.run(fail, "bad page")
+    assert _worker_pids(pool) == pids
+    assert pool.killed_workers == 0
+
+def test_shared_deadline_in_the_past_times_out(pool):
+    with pytest.raises(ExtractionLimitExceeded) as excinfo:
+        pool.run(sleep_for, 0.5, deadline=time.monotonic())
+    assert excinfo.value.reason == "timeout"
+
+def test_waiting_for_a_worker_counts_against_the_deadline(pool):
+    pool._slots.acquire()
+    try:
+        with pytest.raises(ExtractionLimitExceeded) as excinfo:
+            pool.run(echo, None, deadline=time.monotonic() + 0.1)
+        assert excinfo.value.reason == "timeout"
+    finally:
+        pool._slots.release()
+
+def test_shut_down_pool_rejects_jobs():
+    pool = IsolatedWorkerPool(max_workers=1)
+    pool.shutdown()
+    with pytest.raises(ExtractionError):
+        pool.run(echo, None)
+
+@pytest.mark.parametrize("error, status_code", [
+    (UploadTooLarge(10 * 1024 * 1024), 413),
+    (ExtractionLimitExceeded("Document extraction exceeded the 10s time limit", "timeout"), 422),
+    (ExtractionLimitExceeded("Document extraction exceeded the 512 MB memory limit", "memory"), 422),
+])
+def test_read_resume_upload_maps_extraction_failures(error, status_code, monkeypatch):
+    main = pytest.importorskip("app.main", exc_type=ImportError)
+
+    async def extract_upload(file):
+        raise error
+
+    monkeypatch.setattr(main, "extract_upload", extract_upload)
+    file = main.UploadFile(file=None, filename="resume.pdf")
+    with pytest.raises(main.HTTPException) as excinfo:
+        asyncio.run(main.read_resume_upload(file))
+    assert excinfo.value.status_code == status_code
+    assert excinfo.value.detail == str(error)
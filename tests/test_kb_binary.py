@@ -0,0 +1,66 @@
+"""
+Tests for the binary skills KB format and how reloads treat bad files.
+"""
+import struct
+
+import pytest
+
+from app.services.kb_binary import (
+    FORMAT_VERSION, SkillsKBFile, SkillsKBFormatError, read_skills_kb, write_skills_kb
+)
+from app.services.skills_kb import build_skills_index, get_skills_kb, reload_skills_index
+
+ALIASES = {"Kubernetes": ["k8s"], "JavaScript": ["JS", "ECMAScript"]}
+
+@pytest.fixture
+def kb_path(tmp_path):
+    path = tmp_path / "skills_kb.bin"
+    write_skills_kb(path, build_skills_index(), ALIASES)
+    return path
+
+def test_round_trip(kb_path):
+    skill_index, aliases = read_skills_kb(kb_path)
+    assert skill_index == build_skills_index()
+    assert aliases == ALIASES
+
+def test_round_trip_of_non_ascii_names(tmp_path):
+    path = tmp_path / "skills_kb.bin"
+    index = {"café ops": {"category": "Ünïcode", "related_skills": ["日本語", "Café Ops"]}}
+    write_skills_kb(path, index, {})
+    assert read_skills_kb(path) == (index, {})
+
+def _corrupt(path, offset, value: bytes):
+    data = bytearray(path.read_bytes())
+    data[offset:offset + len(value)] = value
+    path.write_bytes(bytes(data))
+
+@pytest.mark.parametrize("damage, message", [
+    (lambda path: path.write_bytes(path.read_bytes()[:10]), "too small"),
+    (lambda path: path.write_bytes(path.read_bytes()[:-7]), "truncated"),
+    (lambda path: path.write_bytes(path.read_bytes() + b"\0"), "trailing data"),
+    (lambda path: _corrupt(path, 0, b"JUNK"), "not a skills KB"),
+    (lambda path: _corrupt(path, 4, struct.pack("<H", FORMAT_VERSION + 1)), "format version"),
+    (lambda path: _corrupt(path, len(path.read_bytes()) - 1, b"\xff"), "checksum"),
+])
+def test_rejects_damaged_files(kb_path, damage, message):
+    damage(kb_path)
+    with pytest.raises(SkillsKBFormatError, match=message):
+        read_skills_kb(kb_path)
+
+def test_rejects_empty_file(tmp_path):
+    path = tmp_path / "skills_kb.bin"
+    path.write_bytes(b"")
+    with pytest.raises((SkillsKBFormatError, ValueError)):
+        SkillsKBFile(path)
+
+def test_reload_keeps_previous_kb_when_file_is_bad(kb_path):
+    reload_skills_index(kb_path)
+    try:
+        loaded = get_skills_kb()
+        assert loaded.source == str(kb_path)
+        _corrupt(kb_path, len(kb_path.read_bytes()) - 1, b"\xff")
+        with pytest.raises(SkillsKBFormatError):
+            reload_skills_index(kb_path)
+        assert get_skills_kb() is loaded
+    finally:
+        reload_skills_index()
@@ -0,0 +1,85 @@
+"""
+Tests for the resume extractors: differential checks of the entry search
+against plain finditer, adversarial inputs, and the hardened-mode limits.
+"""
+import random
+import time
+
+import pytest
+
+from app.services import parse_limits
+from app.services.parse_limits import ParseBudget
+from app.services.parser import (
+    DEGREE_PATTERN, JOB_PATTERN, _DEGREE_START, _find_dated_entries, extract_education, extract_experience
+)
+from app.services.segmenter import segment_resume
+
+TOKENS = [
+    "Acme Corp", "Senior Engineer", "Bachelor", "Master of Science", "B.S.", "Ph.D.", "State University",
+    "01/2019 - Present", "02/2015 – 12/2018", "3/2020-4/2021", "x01/2019 - Present", "2019 - 2020",
+    "&", ".", ",", ";", "/", "(", "a", "Data", "12/2019", "Present",
+]
+GAPS = [" ", "  ", ", ", ",", "\n", "\t", "", " - "]
+
+def random_entries(rng: random.Random) -> str:
+    return "".join(rng.choice(TOKENS) + rng.choice(GAPS) for _ in range(rng.randint(0, 16)))
+
+def _spans(matches):
+    return [(match.span(), match.groupdict()) for match in matches]
+
+@pytest.mark.parametrize("seed", range(4))
+def test_entry_search_matches_finditer(seed):
+    rng = random.Random(seed)
+    for _ in range(2500):
+        text = random_entries(rng)
+        assert _spans(_find_dated_entries(JOB_PATTERN, text, ParseBudget())) == _spans(JOB_PATTERN.finditer(text)), text
+        assert _spans(_find_dated_entries(DEGREE_PATTERN, text, ParseBudget(), _DEGREE_START)) == _spans(DEGREE_PATTERN.finditer(text)), text
+
+def test_extracts_jobs_and_degrees():
+    text = (
+        "Work Experience:\nAcme Corp, Senior Engineer, 01/2019 - Present\nBuilt data pipelines.\n"
+        "Beta LLC, Engineer, 02/2015 - 12/2018\nMaintained services.\n\n"
+        "Education:\nBachelor of Science, State University, 09/2011 - 06/2015\n"
+    )
+    jobs = extract_experience(text)
+    assert [job["dates"] for job in jobs] == ["01/2019 - Present", "02/2015 - 12/2018"]
+    assert jobs[0]["company"] == "Acme"
+    assert jobs[1]["description"] == "Maintained services."
+    education = extract_education(text)
+    assert [edu["dates"] for edu in education] == ["09/2011 - 06/2015"]
+    assert education[0]["degree"].startswith("Bachelor")
+
+@pytest.mark.parametrize("text", [
+    "Experience: " + "a " * 1000 + "x01/2019 - Present",
+    "Experience: " + "a" * 2000 + " 01/2019 - Present",
+    "Education: Bachelor " + "a " * 1000 + "x01/2019 - Present",
+    "Education: " + "Bachelor " * 250,
+])
+def test_adversarial_sections_parse_quickly(text):
+    start_time = time.perf_counter()
+    extract_experience(text)
+    extract_education(text)
+    assert time.perf_counter() - start_time < 1.0
+
+def test_hardened_mode_truncates_documents_and_fields(monkeypatch):
+    monkeypatch.setattr(parse_limits, "PARSER_HARDENED", True)
+    monkeypatch.setattr(parse_limits, "PARSER_MAX_INPUT_CHARS", 200)
+    monkeypatch.setattr(parse_limits, "PARSER_MAX_FIELD_CHARS", 20)
+    text = "Experience:\nAcme Corp\n" + "Built " * 100
+    assert len(segment_resume(text).text) == 200
+    jobs = extract_experience(text)
+    assert jobs and all(len(value) <= 20 for job in jobs for value in job.values())
+
+def test_unhardened_mode_keeps_full_text(monkeypatch):
+    monkeypatch.setattr(parse_limits, "PARSER_HARDENED", False)
+    monkeypatch.setattr(parse_limits, "PARSER_MAX_INPUT_CHARS", 200)
+    text = "Experience:\nAcme Corp\n" + "Built " * 100
+    assert segment_resume(text).text == text
+
+def test_expired_budget_returns_partial_results():
+    text = "Experience:\n" + "".join(f"Company {n}, Engineer, 01/2019 - Present\n" for n in range(50))
+    sections = segment_resume(text)
+    sections.budget = ParseBudget(1e-9)
+    time.sleep(0.001)
+    assert extract_experience(text, sections) == []
+    assert len(extract_experience(text)) == 50
@@ -0,0 +1,124 @@
+"""
+Tests for page-level and parallel page-range PDF extraction.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("pypdf")
+
+from app.services.extraction_pool import IsolatedWorkerPool
+from app.services.pdf_extraction import extract_page_range, extract_pdf_parallel, read_pdf_text
+from app.services.uploads import SpooledUpload
+
+def make_pdf(pages):
+    """Build a PDF with one line of text on each page."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for text in pages:
+        content = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+PAGES = [f"Page {number}" for number in range(1, 21)]
+PDF = make_pdf(PAGES)
+
+class RecordingRun:
+    """Runs jobs inline, recording their page ranges and deadlines."""
+
+    def __init__(self, fail_at=None, delay=0.0):
+        self.calls = []
+        self.fail_at = fail_at
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self, func, content, start, stop, deadline=None):
+        with self.lock:
+            self.calls.append((start, stop, deadline))
+        if start == self.fail_at:
+            raise RuntimeError(f"Range at page {start} failed")
+        time.sleep(self.delay)
+        return func(content, start, stop)
+
+@pytest.fixture
+def dispatcher():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+def test_extract_page_range():
+    pages, total_pages = extract_page_range(PDF, 2, 5)
+    assert total_pages == 20
+    assert [page.strip() for page in pages] == PAGES[2:5]
+    assert extract_page_range(PDF, 18, 40)[0] == extract_page_range(PDF, 18, 20)[0]
+
+def test_extract_page_range_of_spooled_upload(tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(PDF)
+    upload = SpooledUpload("resume.pdf", len(PDF), "digest", path=str(path), delete=False)
+    assert extract_page_range(upload, 0, 3) == extract_page_range(PDF, 0, 3)
+
+@pytest.mark.parametrize("pages_per_task, max_pages", [(3, None), (8, None), (4, 10), (50, None)])
+def test_parallel_extraction_matches_serial(dispatcher, pages_per_task, max_pages):
+    run = RecordingRun()
+    text = extract_pdf_parallel(run, dispatcher, PDF, pages_per_task=pages_per_task, max_pages=max_pages)
+    assert text == read_pdf_text(PDF, max_pages=max_pages)
+
+def test_every_range_shares_the_document_deadline(dispatcher):
+    run = RecordingRun()
+    deadline = time.monotonic() + 30
+    extract_pdf_parallel(run, dispatcher, PDF, pages_per_task=4, deadline=deadline)
+    assert len(run.calls) == 5
+    assert {call_deadline for _, _, call_deadline in run.calls} == {deadline}
+
+def test_short_documents_are_not_split(dispatcher):
+    run = RecordingRun()
+    extract_pdf_parallel(run, dispatcher, PDF, pages_per_task=4, min_parallel_pages=32)
+    assert [(start, stop) for start, stop, _ in run.calls] == [(0, 4), (4, 20)]
+
+def test_early_exit_skips_later_waves(dispatcher):
+    pages = ["Skills: Python", "Experience: Acme", "Education: BSc"] + [f"Appendix {n}" for n in range(17)]
+    pdf = make_pdf(pages)
+    run = RecordingRun()
+    text = extract_pdf_parallel(run, dispatcher, pdf, pages_per_task=1, max_parallel=2, stop_when_sections_found=True)
+    assert text == read_pdf_text(pdf, stop_when_sections_found=True)
+    assert "Appendix" not in text
+    assert len(run.calls) <= 5
+
+def test_failed_range_cancels_ranges_not_started():
+    run = RecordingRun(fail_at=2, delay=0.05)
+    with ThreadPoolExecutor(max_workers=1) as dispatcher:
+        with pytest.raises(RuntimeError, match="page 2"):
+            extract_pdf_parallel(run, dispatcher, PDF, pages_per_task=2)
+    # The first range, the failed one and at most the one already queued behind it
+    assert len(run.calls) <= 3
+
+def test_parallel_extraction_in_isolated_workers(dispatcher):
+    pool = IsolatedWorkerPool(max_workers=2, timeout_seconds=30)
+    try:
+        text = extract_pdf_parallel(pool.run, dispatcher, PDF, pages_per_task=5, deadline=time.monotonic() + 30)
+    finally:
+        pool.shutdown()
+    assert text == read_pdf_text(PDF)
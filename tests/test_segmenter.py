@@ -0,0 +1,69 @@
+"""
+Differential tests of the single-pass segmenter against the per-section
+DOTALL patterns the extractors used before it.
+"""
+import random
+import re
+
+import pytest
+
+from app.services.segmenter import SECTION_HEADERS, find_section_headers, segment_resume
+
+# The section patterns of the extractors before segment_resume()
+REFERENCE_PATTERNS = {
+    "skills": re.compile(
+        r"(?:technical skills|skills|technologies|tools|languages|frameworks|proficiencies)[\s\n:]+(.+?)(?:\n\n|\Z)",
+        re.IGNORECASE | re.DOTALL
+    ),
+    "experience": re.compile(
+        r"(?:work experience|experience|employment|professional experience)[\s\n:]+(.+?)(?:\n\n|\Z)",
+        re.IGNORECASE | re.DOTALL
+    ),
+    "education": re.compile(
+        r"(?:education|educational background|academic background)[\s\n:]+(.+?)(?:\n\n|\Z)",
+        re.IGNORECASE | re.DOTALL
+    ),
+}
+
+HEADERS = [header for headers in SECTION_HEADERS.values() for header in headers]
+WORDS = ["Python", "Acme Corp", "Engineer", "01/2020 - Present", "BSc", "the", "and", "skill", "tooling", "x"]
+SEPARATORS = [" ", ":", ": ", "\n", "\n\n", "\n\n\n", " \n", ":\n", "\t", ", ", "\n \n", ""]
+
+def random_resume(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(0, 14)):
+        roll = rng.random()
+        if roll < 0.35:
+            header = rng.choice(HEADERS)
+            parts.append(rng.choice([header, header.upper(), header.title()]))
+        elif roll < 0.75:
+            parts.append(rng.choice(WORDS))
+        else:
+            parts.append(rng.choice(SEPARATORS))
+        parts.append(rng.choice(SEPARATORS))
+    return "".join(parts)
+
+@pytest.mark.parametrize("seed", range(4))
+def test_section_bodies_match_reference_patterns(seed):
+    rng = random.Random(seed)
+    for _ in range(5000):
+        text = random_resume(rng)
+        sections = segment_resume(text)
+        for kind, pattern in REFERENCE_PATTERNS.items():
+            assert sections.bodies(kind) == pattern.findall(text), (kind, text)
+
+def test_sections_of_a_resume():
+    text = (
+        "Jane Doe\n\nTechnical Skills: Python, SQL\nDocker\n\n"
+        "Work Experience\nAcme Corp, Engineer, 01/2020 - Present\nBuilt things\n\n"
+        "Education:\nBSc Computer Science"
+    )
+    sections = segment_resume(text)
+    assert sections.first("skills") == "Python, SQL\nDocker"
+    assert sections.first("experience") == "Acme Corp, Engineer, 01/2020 - Present\nBuilt things"
+    assert sections.first("education") == "BSc Computer Science"
+    assert find_section_headers(text) == ["skills", "experience", "education"]
+
+def test_header_inside_a_section_of_its_kind_is_body_text():
+    sections = segment_resume("Skills: Python, tools: Docker\n\nTools: Git")
+    assert sections.bodies("skills") == ["Python, tools: Docker", "Git"]
@@ -0,0 +1,39 @@
+"""
+Tests of semantic resume-to-job matching with the hashing backend.
+"""
+from app.services.embeddings import EmbeddingBackend, create_embedding_backend
+from app.services.semantic_match import semantic_match, summarize_semantic_match
+
+RESUME = """Jane Doe
+
+Skills
+Python, Docker, Kubernetes
+
+Experience
+Built data pipelines in Python and deployed them with Docker.
+"""
+
+JOB_DESCRIPTION = """Requirements:
+Experience building data pipelines
+Kubernetes
+Fluent in Mandarin
+"""
+
+def test_hashing_backend_is_labeled_lexical():
+    match = semantic_match(RESUME, JOB_DESCRIPTION, backend=create_embedding_backend("hashing"))
+    assert match["similarity"] == "lexical"
+    covered = {requirement["requirement"]: requirement["covered"] for requirement in match["requirements"]}
+    assert covered == {
+        "Experience building data pipelines": True,
+        "Kubernetes": True,
+        "Fluent in Mandarin": False,
+    }
+    summary = summarize_semantic_match(match)
+    assert summary["similarity"] == "lexical"
+    assert summary["missing_requirements"] == ["Fluent in Mandarin"]
+
+def test_sentence_embedding_backend_is_labeled_semantic():
+    hashing = create_embedding_backend("hashing")
+    backend = EmbeddingBackend("chroma", "chroma-default", hashing.function)
+    assert semantic_match(RESUME, JOB_DESCRIPTION, backend=backend)["similarity"] == "semantic"
+    assert semantic_match("", JOB_DESCRIPTION, backend=backend)["similarity"] == "semantic"
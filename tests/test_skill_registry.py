@@ -0,0 +1,80 @@
+"""
+Tests for typo-tolerant skill lookups in the skill registry.
+"""
+import pytest
+
+# Registers the knowledge base, analyzer and career path skill names
+import app.services.analyzer  # noqa: F401
+import app.services.skills_kb  # noqa: F401
+from app.services.parser import extract_skills
+from app.services.skill_registry import SkillRegistry, skill_registry
+
+# Ordinary words, or real skills, that are a few edits from another skill
+NOT_MISSPELLINGS = ["REST", "Rest", "Scale", "Shift", "Rugby", "Lava", "Flash", "Locker", "Lumpy", "Mentoring"]
+
+MISSPELLINGS = {
+    "Kubernets": "Kubernetes",
+    "Pyhton": "Python",
+    "Tensor Flow": "TensorFlow",
+    "Djnago": "Django",
+    "Javascrpt": "JavaScript",
+}
+
+@pytest.mark.parametrize("word", NOT_MISSPELLINGS)
+def test_word_is_not_corrected_to_another_skill(word):
+    assert skill_registry.correct_spelling(word) == word
+    skill_id = skill_registry.resolve(word)
+    assert skill_id is None or skill_registry.get_id(word) == skill_id
+
+@pytest.mark.parametrize("misspelling, canonical", MISSPELLINGS.items())
+def test_misspelling_is_corrected(misspelling, canonical):
+    assert skill_registry.correct_spelling(misspelling) == canonical
+    assert skill_registry.key(misspelling) == skill_registry.key(canonical)
+
+def test_parser_keeps_rest_and_corrects_typos():
+    skills = extract_skills("Skills: REST, Python, Mentoring, Kubernets\n")
+    assert "REST" in skills
+    assert "Rust" not in skills
+    assert "Mentoring" in skills
+    assert "Kubernetes" in skills
+
+@pytest.mark.parametrize("text", [
+    "Ready to go live with the new R&D lab.",
+    "We go above and beyond; 5 ml samples were measured.",
+    "Go to market strategy for a new product line.",
+    "Enjoys long walks in the spring and a swift response.",
+])
+def test_ambiguous_words_in_prose_are_not_skills(text):
+    found = skill_registry.find(text)
+    assert not {"Go", "R", "Machine Learning", "Spring", "Swift"} & set(found)
+
+def test_ambiguous_skills_in_lists_are_found():
+    found = skill_registry.find("Languages: Python, Go, R\nML, Swift / Rust")
+    assert {"Go", "R", "Machine Learning", "Swift", "Rust"} <= set(found)
+
+def test_replacing_a_layer_drops_its_names():
+    registry = SkillRegistry({"Kubernetes": ["k8s"]})
+    registry.replace_layer("kb", [("Zorblax", ["zbx"]), ("Kubernetes", ())])
+    zorblax = registry.get_id("Zorblax")
+    assert registry.find("Zorblax and zbx on k8s") == ["Zorblax", "Kubernetes"]
+
+    registry.replace_layer("kb", [("Quuxly", ())])
+    assert registry.get_id("zbx") is None
+    assert registry.resolve("Zorblaxx") is None
+    assert registry.find("Zorblax and Quuxly on Kubernetes") == ["Quuxly", "Kubernetes"]
+
+    registry.replace_layer("kb", [("Zorblax", ())])
+    assert registry.get_id("Zorblax") == zorblax
+
+def test_reloading_the_kb_drops_names_of_the_previous_one(tmp_path):
+    from app.services.skills_kb import reload_skills_index
+
+    path = tmp_path / "skills_index.json"
+    path.write_text('{"zorblax": {"category": "Custom", "related_skills": ["Kubernetes"]}}')
+    reload_skills_index(path)
+    try:
+        assert "zorblax" in skill_registry.find("Zorblax and Kubernetes")
+    finally:
+        reload_skills_index()
+    assert skill_registry.find("Zorblax and Kubernetes") == ["Kubernetes"]
+    assert "LangChain" in skill_registry.find("LangChain")
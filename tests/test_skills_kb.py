@@ -0,0 +1,100 @@
+"""
+Tests for the in-memory skills index and its hot reload.
+"""
+import builtins
+import json
+import threading
+
+import pytest
+
+from app.services import skills_kb
+from app.services.parsed_resume import parse_resume
+from app.services.skills_kb import (
+    get_related_skills, get_skills_index, get_skills_kb, match_skills, reload_skills_index
+)
+
+CUSTOM_INDEX = {
+    "zorblax": {"category": "Custom", "related_skills": ["Quuxly"]},
+    "quuxly": {"category": "Custom", "related_skills": ["Zorblax"]},
+}
+
+@pytest.fixture
+def restore_kb():
+    yield
+    reload_skills_index()
+
+def _write_index(path, index):
+    path.write_text(json.dumps(index))
+    return path
+
+def test_reload_swaps_index_for_new_callers(tmp_path, restore_kb):
+    before = get_skills_kb()
+    reload_skills_index(_write_index(tmp_path / "index.json", CUSTOM_INDEX))
+    after = get_skills_kb()
+
+    assert after is not before
+    assert after.source == str(tmp_path / "index.json")
+    assert set(get_skills_index()) == set(CUSTOM_INDEX)
+    assert get_related_skills("Zorblax") == {"category": "Custom", "related_skills": ["Quuxly"]}
+    # A caller holding the previous KB keeps a consistent view of it
+    assert "python" in before.index
+    assert before.search.best_match("pyth") == "python"
+
+def test_failed_reload_keeps_previous_index(tmp_path, restore_kb):
+    before = get_skills_kb()
+    path = tmp_path / "index.json"
+    path.write_text("{not json")
+    with pytest.raises(ValueError):
+        reload_skills_index(path)
+    assert get_skills_kb() is before
+
+def test_reload_clears_memoized_parses(tmp_path, restore_kb):
+    text = "Skills: Python, Docker\n"
+    parsed = parse_resume(text)
+    assert parse_resume(text) is parsed
+    reload_skills_index(_write_index(tmp_path / "index.json", CUSTOM_INDEX))
+    assert parse_resume(text) is not parsed
+
+def test_lookups_do_no_io(monkeypatch):
+    def fail_open(*args, **kwargs):
+        raise AssertionError("lookup opened a file")
+
+    monkeypatch.setattr(builtins, "open", fail_open)
+    assert get_related_skills("python")["category"] == "Programming Languages"
+    result = match_skills(["Python", "k8s"], ["python", "kubernetes", "docker", "cobol"])
+    assert result["direct_matches"] == ["python", "kubernetes"]
+    assert result["related_matches"] == [{"job_skill": "docker", "matched_via": ["kubernetes"]}]
+    assert result["missing_skills"] == ["cobol"]
+
+def test_index_is_read_only():
+    entry = get_skills_index()["python"]
+    with pytest.raises(TypeError):
+        entry["category"] = "Other"
+    related = get_related_skills("python")["related_skills"]
+    related.append("Cobol")
+    assert "Cobol" not in get_related_skills("python")["related_skills"]
+
+def test_readers_see_consistent_kb_during_reloads(tmp_path, restore_kb):
+    custom = _write_index(tmp_path / "index.json", CUSTOM_INDEX)
+    errors = []
+    stop = threading.Event()
+
+    def read():
+        while not stop.is_set():
+            kb = get_skills_kb()
+            name = next(iter(kb.index))
+            if kb.resolve(name) != name or kb.search.best_match(name) not in kb.index:
+                errors.append(kb.source)
+
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    for reader in readers:
+        reader.start()
+    try:
+        for _ in range(5):
+            reload_skills_index(custom)
+            reload_skills_index(skills_kb.BUILT_IN_SOURCE)
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+    assert errors == []
@@ -0,0 +1,69 @@
+"""
+Tests for upload spooling and the request body size limit.
+"""
+import hashlib
+import os
+
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from app.services.uploads import RequestSizeLimitMiddleware, spool_upload
+
+LIMIT = 4 * 1024 * 1024
+
+def _make_client():
+    app = FastAPI()
+    app.add_middleware(RequestSizeLimitMiddleware, max_bytes=LIMIT)
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        spooled = await spool_upload(file, max_bytes=LIMIT, spool_threshold=1024)
+        try:
+            with spooled.open_view() as buffer:
+                contents_digest = hashlib.sha256(buffer).hexdigest()
+            path = spooled.path
+        finally:
+            spooled.close()
+        return {
+            "size": spooled.size,
+            "digest": spooled.digest,
+            "contents_digest": contents_digest,
+            "path": path,
+            "path_exists_after_close": path is not None and os.path.exists(path),
+        }
+
+    return TestClient(app)
+
+def test_small_upload_is_kept_in_memory():
+    body = b"%PDF-1.4 small"
+    response = _make_client().post("/upload", files={"file": ("resume.pdf", body)})
+    assert response.status_code == 200
+    result = response.json()
+    assert result["path"] is None
+    assert result["size"] == len(body)
+    assert result["digest"] == hashlib.sha256(body).hexdigest()
+
+def test_upload_spooled_by_starlette_is_mapped_in_place():
+    body = os.urandom(2 * 1024 * 1024)
+    response = _make_client().post("/upload", files={"file": ("resume.pdf", body)})
+    assert response.status_code == 200
+    result = response.json()
+    assert result["path"].startswith("/proc/")
+    assert result["size"] == len(body)
+    assert result["digest"] == result["contents_digest"] == hashlib.sha256(body).hexdigest()
+    # The file belongs to Starlette and is not deleted by close()
+    assert result["path_exists_after_close"]
+
+def test_content_length_over_limit_is_rejected():
+    response = _make_client().post("/upload", files={"file": ("resume.pdf", b"x" * (LIMIT + 1))})
+    assert response.status_code == 413
+
+def test_chunked_body_over_limit_is_rejected():
+    def chunks():
+        for _ in range(8):
+            yield b"x" * (1024 * 1024)
+
+    response = _make_client().post(
+        "/upload", content=chunks(), headers={"Content-Type": "multipart/form-data; boundary=xyz"}
+    )
+    assert response.status_code == 413
@@ -0,0 +1,127 @@
+"""
+Tests of the NumPy vector index: writes, filtered queries and the on-disk
+round trip.
+"""
+import numpy as np
+import pytest
+
+from app.services.embeddings import create_embedding_backend
+from app.services.vector_index import NumpyVectorIndex
+
+DOCUMENTS = {
+    "python": ("Python programming language", {"type": "skill_data"}),
+    "docker": ("Docker container platform", {"type": "skill_data"}),
+    "kubernetes": ("Kubernetes container orchestration", {"type": "skill_data"}),
+    "data-science": ("Data science industry standards", {"type": "industry_data"}),
+}
+
+@pytest.fixture
+def backend():
+    return create_embedding_backend("hashing")
+
+@pytest.fixture
+def index(backend):
+    index = NumpyVectorIndex(backend)
+    index.add(
+        ids=list(DOCUMENTS),
+        documents=[document for document, _ in DOCUMENTS.values()],
+        metadatas=[metadata for _, metadata in DOCUMENTS.values()]
+    )
+    return index
+
+def test_add_and_query(index):
+    assert index.count() == len(DOCUMENTS)
+    results = index.query(query_texts=["Docker container"], n_results=2)
+    assert results["ids"][0][0] == "docker"
+    assert len(results["ids"][0]) == 2
+    assert results["documents"][0][0] == "Docker container platform"
+    assert results["metadatas"][0][0] == {"type": "skill_data"}
+    assert results["distances"][0] == sorted(results["distances"][0])
+
+def test_add_rejects_existing_and_repeated_ids(index):
+    with pytest.raises(ValueError):
+        index.add(ids=["python"], documents=["Python again"])
+    with pytest.raises(ValueError):
+        index.add(ids=["rust", "rust"], documents=["Rust", "Rust"])
+    assert index.count() == len(DOCUMENTS)
+
+def test_upsert_replaces_and_appends(index):
+    index.upsert(
+        ids=["python", "rust", "rust"],
+        documents=["Python scripting", "Rust draft", "Rust systems programming"],
+        metadatas=[{"type": "skill_data"}, {"type": "draft"}, {"type": "skill_data"}]
+    )
+    assert index.count() == len(DOCUMENTS) + 1
+    results = index.query(query_texts=["Rust systems programming"], n_results=1)
+    assert results["ids"] == [["rust"]]
+    assert results["documents"] == [["Rust systems programming"]]
+    assert results["metadatas"] == [[{"type": "skill_data"}]]
+    results = index.query(query_texts=["Python scripting"], n_results=1)
+    assert results["documents"] == [["Python scripting"]]
+
+def test_query_does_not_see_later_writes(index):
+    state = index._state
+    index.upsert(ids=["python"], documents=["Python scripting"])
+    assert state.documents[0] == "Python programming language"
+    assert np.allclose(np.linalg.norm(state.vectors, axis=1), 1.0)
+
+def test_filtered_query(index):
+    for where in ({"type": "industry_data"}, {"type": {"$eq": "industry_data"}}):
+        results = index.query(query_texts=["Docker container"], n_results=3, where=where)
+        assert results["ids"] == [["data-science"]]
+    results = index.query(query_texts=["Docker"], where={"type": "missing"})
+    assert results["ids"] == [[]]
+    with pytest.raises(ValueError):
+        index.query(query_texts=["Docker"], where={"type": {"$ne": "skill_data"}})
+
+def test_filter_cache_is_dropped_on_write(index):
+    where = {"type": "skill_data"}
+    assert len(index.query(query_texts=["Rust"], n_results=10, where=where)["ids"][0]) == 3
+    index.add(ids=["rust"], documents=["Rust"], metadatas=[where])
+    assert len(index.query(query_texts=["Rust"], n_results=10, where=where)["ids"][0]) == 4
+
+def test_query_embeddings_and_include(index, backend):
+    embedding = backend.function.embed(["Kubernetes orchestration"])
+    results = index.query(query_embeddings=embedding, n_results=1, include=["embeddings"])
+    assert set(results) == {"ids", "embeddings"}
+    assert results["ids"] == [["kubernetes"]]
+    assert len(results["embeddings"][0][0]) == embedding.shape[1]
+    with pytest.raises(ValueError):
+        index.query()
+
+def test_empty_index(backend):
+    index = NumpyVectorIndex(backend)
+    assert index.count() == 0
+    assert index.query(query_texts=["a", "b"], n_results=3) == {
+        "ids": [[], []], "documents": [[], []], "metadatas": [[], []], "distances": [[], []]
+    }
+    with pytest.raises(ValueError):
+        index.save()
+
+def test_save_and_load_round_trip(index, backend, tmp_path):
+    index.save(tmp_path)
+    loaded = NumpyVectorIndex.load(tmp_path, backend)
+    assert isinstance(loaded._state.vectors, np.memmap)
+    assert loaded.count() == index.count()
+    assert loaded.metadata == index.metadata
+    for query in ("Docker container", "data science", "Python"):
+        assert loaded.query(query_texts=[query], n_results=4) == index.query(query_texts=[query], n_results=4)
+
+    # A loaded index takes writes and saves back to its directory
+    loaded.upsert(ids=["docker", "rust"], documents=["Docker images", "Rust"])
+    loaded.save()
+    reloaded = NumpyVectorIndex.load(tmp_path, backend)
+    assert reloaded.count() == len(DOCUMENTS) + 1
+    assert reloaded.query(query_texts=["Docker images"], n_results=1)["documents"] == [["Docker images"]]
+
+def test_load_missing_directory_is_empty(backend, tmp_path):
+    index = NumpyVectorIndex.load(tmp_path / "index", backend)
+    assert index.count() == 0
+    index.add(ids=["python"], documents=["Python"])
+    index.save()
+    assert NumpyVectorIndex.load(tmp_path / "index", backend).count() == 1
+
+def test_load_rejects_other_embedding_model(index, tmp_path):
+    index.save(tmp_path)
+    with pytest.raises(ValueError):
+        NumpyVectorIndex.load(tmp_path, create_embedding_backend("hashing", dim=64))
@@ -0,0 +1,88 @@
+"""
+End-to-end tests of the vector store lookups on a Chroma collection embedded
+with the hashing backend.
+"""
+import pytest
+
+pytest.importorskip("chromadb")
+
+from app.services import kb_builder, vector_store
+from app.services.embedding_cache import CachedEmbeddingFunction, EmbeddingCache
+from app.services.embeddings import create_embedding_backend
+
+@pytest.fixture
+def embedding_backend(request):
+    backend = create_embedding_backend("hashing")
+    if getattr(request, "param", None) == "cached":
+        backend = backend._replace(function=CachedEmbeddingFunction(backend.function, EmbeddingCache(backend.model_id)))
+    return backend
+
+@pytest.fixture
+def chroma_store(tmp_path, monkeypatch, embedding_backend):
+    backend = embedding_backend
+    monkeypatch.setattr(vector_store, "VECTOR_BACKEND", "chroma")
+    monkeypatch.setattr(vector_store, "default_root", lambda vector_backend: tmp_path)
+    monkeypatch.setattr(vector_store, "get_embedding_backend", lambda: backend)
+    monkeypatch.setattr(kb_builder, "get_embedding_backend", lambda: backend)
+    vector_store.shutdown_vector_store()
+    yield tmp_path
+    vector_store.shutdown_vector_store()
+
+def test_store_is_built_and_active(chroma_store):
+    health = vector_store.vector_store_health()
+    assert health["status"] == "healthy"
+    assert health["documents"] > 0
+    assert kb_builder.active_build_directory(chroma_store) is not None
+
+def test_get_similar_skills(chroma_store):
+    result = vector_store.get_similar_skills("Docker")
+    assert result["skill"] == "Docker"
+    assert "Kubernetes" in result["related_skills"]
+
+def test_get_similar_skills_many(chroma_store):
+    results = vector_store.get_similar_skills_many(["python", "Python ", "aws"], k=2)
+    assert [result["skill"] for result in results] == ["python", "Python ", "aws"]
+    assert results[0]["similar"][0]["skill"] == "Python"
+    assert results[0]["similar"] == results[1]["similar"]
+    assert len(results[2]["similar"]) == 2
+
+def test_get_industry_standards(chroma_store):
+    result = vector_store.get_industry_standards("data science")
+    assert result["industry"] == "Data Science"
+
+def test_reopens_active_build(chroma_store):
+    count = vector_store.get_collection().count()
+    build = kb_builder.active_build_directory(chroma_store)
+    vector_store.shutdown_vector_store()
+    assert vector_store.get_collection().count() == count
+    assert kb_builder.active_build_directory(chroma_store) == build
+
+@pytest.mark.parametrize("embedding_backend", ["cached"], indirect=True)
+def test_queries_go_through_the_embedding_cache(chroma_store, embedding_backend):
+    cache = embedding_backend.function.cache
+    vector_store.get_similar_skills("Docker")
+    misses = cache.stats()["misses"]
+    vector_store.get_similar_skills("Docker")
+    stats = cache.stats()
+    assert stats["misses"] == misses
+    assert stats["hits"] >= 1
+
+def test_reload_switches_to_new_build(chroma_store):
+    vector_store.get_collection()
+    previous = kb_builder.active_build_directory(chroma_store)
+    stats = vector_store.reload_vector_store()
+    assert kb_builder.active_build_directory(chroma_store) == kb_builder.Path(stats["directory"])
+    assert kb_builder.Path(stats["directory"]) != previous
+    assert vector_store.get_similar_skills("Docker")["skill"] == "Docker"
+
+def test_reload_leaves_running_lookups_open(chroma_store, monkeypatch):
+    closed = []
+    close_client = vector_store.close_client
+    monkeypatch.setattr(vector_store, "close_client", lambda client: (closed.append(client), close_client(client)))
+    with vector_store._reading() as collection:
+        previous = vector_store._store
+        vector_store.reload_vector_store()
+        assert vector_store._store is not previous
+        assert closed == []
+        assert collection.count() > 0
+    assert closed == [previous.client]